@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark DNS: batch banyak domain dengan resolver sistem yang lambat
+
+Setiap host hostN.bench diarahkan ke server HTTP lokal lewat resolver palsu
+yang menunggu --dns-ms per lookup (seperti DNS resolver publik), lalu
+scrape_many dijalankan tanpa cache, dengan DnsCache, dan dengan prefetch.
+Prewarm tidak diukur di sini: connect ke loopback hampir tanpa biaya,
+keuntungannya baru terlihat pada handshake TCP/TLS lewat jaringan.
+Jalankan dari folder WebScrapper:
+
+    python benchmarks/bench_dns.py
+    python benchmarks/bench_dns.py --hosts 400 --dns-ms 80 --workers 16
+"""
+
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper_engine import DnsCache, ListSink, ScraperEngine  # noqa: E402
+
+PAGE = b'<html><body>' + b''.join(b'<p>Paragraf %d</p>' % i for i in range(50)) + b'</body></html>'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        status, body = (404, b'') if self.path == '/robots.txt' else (200, PAGE)
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def slow_resolver(original, delay):
+    """getaddrinfo palsu: *.bench -> 127.0.0.1 setelah menunggu `delay` detik"""
+    def getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+        if isinstance(host, str) and host.endswith('.bench'):
+            time.sleep(delay)
+            host = '127.0.0.1'
+        return original(host, port, family, type, proto, flags)
+    return getaddrinfo
+
+
+def run(urls, args, dns=None, prefetch=0):
+    engine = ScraperEngine(delay=0, max_workers=args.workers, dns=dns, prefetch=prefetch)
+    start = time.perf_counter()
+    stats = engine.scrape_many(urls, ListSink(), mode='text')
+    elapsed = time.perf_counter() - start
+    engine.close()
+    return elapsed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--hosts', type=int, default=200)
+    parser.add_argument('--pages', type=int, default=2, help='Halaman per host')
+    parser.add_argument('--dns-ms', type=float, default=50)
+    parser.add_argument('--page-ms', type=float, default=30, help='Waktu respons server per request')
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+    Handler.delay = args.page_ms / 1000
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    original = socket.getaddrinfo
+    socket.getaddrinfo = slow_resolver(original, args.dns_ms / 1000)
+
+    print(f"{args.hosts} host x {args.pages} halaman, DNS {args.dns_ms:g} ms, "
+          f"respons {args.page_ms:g} ms, {args.workers} worker")
+    print(f"{'varian':<26} {'waktu':>8} {'lookup':>8} {'gagal':>6}")
+    variants = [
+        ('tanpa cache', None, 0),
+        ('DnsCache', DnsCache, 0),
+        ('DnsCache + prefetch 16', DnsCache, 16),
+    ]
+    try:
+        for index, (name, cache_class, prefetch) in enumerate(variants):
+            # Nama host baru per varian supaya koneksi keep-alive tidak terbawa
+            urls = [f'http://host{host}.run{index}.bench:{port}/page{page}.html'
+                    for host in range(args.hosts) for page in range(args.pages)]
+            dns = cache_class().install() if cache_class else None
+            try:
+                elapsed, stats = run(urls, args, dns, prefetch)
+            finally:
+                if dns is not None:
+                    dns.uninstall()
+            lookups = dns.stats['lookups'] if dns is not None else '-'
+            print(f"{name:<26} {elapsed:>7.2f}s {lookups:>8} {stats['failed']:>6}")
+    finally:
+        socket.getaddrinfo = original
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark export streaming: waktu dan puncak memory per format
+
+ResultStore sementara diisi item mode basic, lalu setiap format di-export.
+Dengan --memory, puncak alokasi Python diukur dengan tracemalloc (export
+jadi beberapa kali lebih lambat, jadi waktu diukur terpisah). Jalankan dari
+folder WebScrapper:
+
+    python benchmarks/bench_export.py
+    python benchmarks/bench_export.py --rows 1000000 --formats csv jsonl xlsx
+    python benchmarks/bench_export.py --memory --baseline   # vs DataFrame.to_excel
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper_engine.export import EXPORT_FORMATS, export_data  # noqa: E402
+from scraper_engine.store import ResultStore  # noqa: E402
+
+
+def fill(store, rows, per_page=200):
+    for page in range(0, rows, per_page):
+        url = f'https://example.com/kategori/halaman-{page // per_page}.html'
+        timestamp = f'2024-01-01 10:{page // 60 % 60:02d}:{page % 60:02d}'
+        store.add_many([
+            {'url': url, 'timestamp': timestamp, 'type': 'link' if i % 2 else 'text',
+             'content': f'https://example.com/produk/{page}/{i}' if i % 2 else f'Paragraf {page}-{i} ' * 4,
+             **({'text': f'Produk {i}'} if i % 2 else {})}
+            for i in range(min(per_page, rows - page))
+        ])
+
+
+def measure(func, memory=False):
+    """Return (hasil, detik, puncak byte atau None)"""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    if not memory:
+        return result, elapsed, None
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def report(name, count, elapsed, peak, path):
+    peak = f"{peak / 2**20:>8.1f}MB" if peak is not None else f"{'-':>10}"
+    print(f"{name:<10} {elapsed:>7.2f}s {count / elapsed:>10,.0f} {peak} "
+          f"{os.path.getsize(path) / 2**20:>8.1f}MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Waktu dan memory export streaming')
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--formats', nargs='+', default=list(EXPORT_FORMATS), choices=EXPORT_FORMATS)
+    parser.add_argument('--baseline', action='store_true',
+                        help='Ukur juga cara lama: DataFrame penuh lalu to_excel')
+    parser.add_argument('--memory', action='store_true',
+                        help='Ukur puncak memory dengan tracemalloc (export dijalankan dua kali)')
+    args = parser.parse_args(argv)
+
+    folder = tempfile.mkdtemp(prefix='bench_export_')
+    store = ResultStore(window=0)
+    try:
+        start = time.perf_counter()
+        fill(store, args.rows)
+        print(f"{len(store):,} item disiapkan dalam {time.perf_counter() - start:.1f}s")
+        print(f"{'format':<10} {'waktu':>8} {'baris/s':>10} {'puncak':>10} {'file':>10}")
+
+        for format_type in args.formats:
+            path = os.path.join(folder, f'hasil.{format_type}')
+            try:
+                count, elapsed, peak = measure(lambda: export_data(store, path, format_type),
+                                               args.memory)
+            except ImportError as e:
+                print(f"{format_type:<10} dilewati: {e}")
+                continue
+            report(format_type, count, elapsed, peak, path)
+
+        if args.baseline:
+            path = os.path.join(folder, 'lama.xlsx')
+            _, elapsed, peak = measure(lambda: store.to_pandas().to_excel(path, index=False),
+                                       args.memory)
+            report('to_excel', len(store), elapsed, peak, path)
+    finally:
+        store.close()
+        shutil.rmtree(folder, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark waktu import (cold start) EasyScraper
+
+Setiap pengukuran menjalankan interpreter baru, jadi hasilnya mewakili
+startup worker batch yang berumur pendek. Jalankan dari folder WebScrapper:
+
+    python benchmarks/bench_import.py --runs 10
+    python benchmarks/bench_import.py --json >> import_times.jsonl
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+TARGETS = {
+    'python': 'pass',
+    'scraper_engine': 'import scraper_engine',
+    'scraper_engine+scrape': 'import scraper_engine.extractor as e; e.extract("http://x/", b"<p>x</p>")',
+    'easyscraper': 'import easyscraper',
+}
+
+
+def time_run(code):
+    """Waktu wall-clock satu interpreter baru (detik)"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def top_imports(code, limit):
+    """Modul dengan waktu import kumulatif terbesar dari python -X importtime"""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        # Format: "import time:  self_us | cumulative_us | nama.modul"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us), name.strip()))
+    rows.sort(reverse=True)
+    return rows[:limit]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark waktu import EasyScraper')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=8, help='Tampilkan N modul import paling lambat')
+    parser.add_argument('--json', action='store_true', help='Output satu baris JSON (untuk tracking)')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, code in TARGETS.items():
+        try:
+            times = [time_run(code) for _ in range(args.runs)]
+        except subprocess.CalledProcessError:
+            results[name] = None
+            continue
+        results[name] = {'median_ms': round(statistics.median(times) * 1000, 1),
+                         'min_ms': round(min(times) * 1000, 1)}
+
+    if args.json:
+        print(json.dumps({'timestamp': int(time.time()), 'python': sys.version.split()[0],
+                          'results': results}))
+        return 0
+
+    for name, result in results.items():
+        if result is None:
+            print(f"{name:<24} GAGAL (dependency belum terinstall?)")
+        else:
+            print(f"{name:<24} median {result['median_ms']:>7.1f} ms   min {result['min_ms']:>7.1f} ms")
+
+    print(f"\nImport paling lambat (scraper_engine):")
+    for cumulative_us, name in top_imports(TARGETS['scraper_engine'], args.top):
+        print(f"  {cumulative_us / 1000:>7.1f} ms  {name}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark parser backend
+
+Setiap backend yang terinstall (plus streaming extractor 'stream')
+dijalankan pada korpus HTML yang sama. Kesesuaian hasil dengan bs4 dicek
+oleh tests/test_parsers.py; mode teks streaming sengaja berbeda (setiap
+text node hanya dihitung sekali) sehingga jumlah itemnya ditampilkan di
+sini. Jalankan dari folder WebScrapper:
+
+    python benchmarks/bench_parsers.py
+    python benchmarks/bench_parsers.py --files halaman1.html halaman2.html --repeat 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper_engine.extractor import extract  # noqa: E402
+from scraper_engine.parsers import available_backends  # noqa: E402
+
+BASE_URL = 'https://example.com/kategori/'
+
+SAMPLES = {
+    'dasar': """<html><head><title>Contoh</title><style>p { color: red }</style></head>
+<body><h1>Judul halaman contoh yang panjang</h1>
+<div><p>Paragraf pertama yang cukup panjang untuk lolos filter.</p>
+<span>teks span pendek sekali ya</span></div>
+<a href="/a.html">Link A</a> <a href="b.html?x=1&amp;y=2">Link &amp; B</a>
+<a href>kosong</a><a name="anchor">tanpa href</a>
+<img src="x.png" alt="gambar"><img src="//cdn.example.com/y.jpg"><img alt="tanpa src">
+</body></html>""",
+    'nested': """<html><body><div class="a"><div class="b"><div class="c">
+<p>Teks <b>tebal</b> dan <i>miring</i> di dalam paragraf panjang.</p>
+<span>Span dengan <a href="/dalam">link di dalam span</a> ekor</span>
+</div> tail setelah c </div><!-- komentar yang tidak dihitung --> tail b</div></body></html>""",
+    'script': """<html><body><div>Sebelum script yang panjang <script>var x = "<p>bukan teks</p>";</script>
+sesudah script <template><b>isi template</b></template> akhir</div>
+<p>Entitas &lt;tag&gt; &copy; 2024 &nbsp; unicode: héllo wörld 日本語</p></body></html>""",
+    'listing': '<html><body><ul>' + ''.join(
+        f'<li><div class="item"><h2>Produk nomor {i} dengan nama panjang</h2>'
+        f'<p>Deskripsi produk {i} yang cukup panjang untuk lolos filter teks.</p>'
+        f'<a href="/produk/{i}">Lihat produk {i}</a><img src="/img/{i}.jpg" alt="foto {i}">'
+        f'<span class="harga">Rp {i * 1000:,}</span></div></li>'
+        for i in range(2000)) + '</ul></body></html>',
+}
+
+def run(content, mode, backend, selector=None):
+    return extract(BASE_URL, content, mode, selector, parser=backend)
+
+
+def text_counts(corpus):
+    """Jumlah item mode text: bs4 (duplikat per elemen) vs stream (sekali per node)"""
+    print(f"\n{'halaman':<10} {'text bs4':>10} {'text stream':>12}")
+    for name, content in corpus.items():
+        print(f"{name:<10} {len(run(content, 'text', 'bs4')):>10} "
+              f"{len(run(content, 'text', 'stream')):>12}")
+
+
+def benchmark(corpus, backends, repeat):
+    print(f"\n{'halaman':<10} {'mode':<7} " + ''.join(f"{b:>14}" for b in backends))
+    for name, content in corpus.items():
+        for mode in ('text', 'basic'):
+            row = []
+            for backend in backends:
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    run(content, mode, backend)
+                row.append((time.perf_counter() - start) / repeat * 1000)
+            base = row[0]
+            print(f"{name:<10} {mode:<7} " + ''.join(
+                f"{ms:>8.2f}ms x{base / ms:>3.0f}" if ms else f"{'-':>14}" for ms in row))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark parser backend')
+    parser.add_argument('--files', nargs='*', default=[], help='File HTML tambahan')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    corpus = {name: content.encode('utf-8') for name, content in SAMPLES.items()}
+    for path in args.files:
+        with open(path, 'rb') as handle:
+            corpus[os.path.basename(path)[:10]] = handle.read()
+
+    backends = ['bs4'] + [b for b in available_backends() if b != 'bs4'] + ['stream']
+    print(f"Backend terinstall: {', '.join(backends)}")
+
+    text_counts(corpus)
+    benchmark(corpus, backends, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
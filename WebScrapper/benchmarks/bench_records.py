@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark memory: list dict vs RecordTable untuk crawl yang banyak link-nya
+
+Item dibuat seperti output ScraperEngine.make_items (mode links) lalu diukur
+dengan tracemalloc. Jalankan dari folder WebScrapper:
+
+    python benchmarks/bench_records.py
+    python benchmarks/bench_records.py --pages 2000 --links 500
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper_engine.records import RecordTable  # noqa: E402
+
+
+def generate(pages, links):
+    """Item mode links; string dibuat baru per item seperti hasil parser/SQLite"""
+    for page in range(pages):
+        for link in range(links):
+            yield {
+                'url': f'https://example.com/kategori/halaman-{page}.html',
+                'timestamp': f'2024-01-01 10:{page // 60 % 60:02d}:{page % 60:02d}',
+                'type': ''.join(['li', 'nk']),
+                'content': f'https://example.com/produk/{page}/{link}',
+                'text': f'Produk {link}',
+            }
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = build()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return data, size, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Memory list dict vs RecordTable')
+    parser.add_argument('--pages', type=int, default=500)
+    parser.add_argument('--links', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    total = args.pages * args.links
+    print(f"{total:,} item ({args.pages} halaman x {args.links} link)")
+
+    dicts, dict_size, dict_time = measure(lambda: list(generate(args.pages, args.links)))
+    del dicts
+    table, table_size, table_time = measure(lambda: RecordTable(generate(args.pages, args.links)))
+
+    print(f"{'list dict':<12} {dict_size / 2**20:>8.1f} MB {dict_size / total:>7.0f} B/item {dict_time:>6.2f}s")
+    print(f"{'RecordTable':<12} {table_size / 2**20:>8.1f} MB {table_size / total:>7.0f} B/item {table_time:>6.2f}s")
+    print(f"Hemat {dict_size / table_size:.1f}x")
+
+    try:
+        start = time.perf_counter()
+        frame = table.to_pandas()
+        print(f"to_pandas: {time.perf_counter() - start:.3f}s, "
+              f"{frame.memory_usage(deep=False).sum() / 2**20:.1f} MB (tanpa isi string)")
+    except ImportError:
+        print("pandas tidak terinstall, to_pandas dilewati")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,56 +8,115 @@ Dibuat untuk memudahkan scraping website tanpa coding
 import os
 import sys
 import subprocess
-import importlib
+import importlib.util
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, scrolledtext
+from tkinter import ttk, messagebox, filedialog, scrolledtext, simpledialog
 import threading
 import time
-import json
-from datetime import datetime
 import webbrowser
-from urllib.robotparser import RobotFileParser
+from urllib.parse import urlparse
+
+# Package yang dibutuhkan: nama pip -> nama modul
+REQUIRED_PACKAGES = {
+    'requests': 'requests',
+    'beautifulsoup4': 'bs4',
+    'pandas': 'pandas',
+    'lxml': 'lxml',
+    'openpyxl': 'openpyxl'
+}
 
 # Fungsi untuk mengecek dan menginstall dependencies
 def check_and_install_dependencies():
-    """Mengecek dan menginstall dependencies yang diperlukan"""
-    required_packages = {
-        'requests': 'requests',
-        'beautifulsoup4': 'bs4',
-        'selenium': 'selenium',
-        'pandas': 'pandas',
-        'lxml': 'lxml',
-        'openpyxl': 'openpyxl'
-    }
-    
-    missing_packages = []
-    
-    for package, import_name in required_packages.items():
-        try:
-            importlib.import_module(import_name)
-        except ImportError:
-            missing_packages.append(package)
+    """Mengecek dan menginstall dependencies yang diperlukan
+
+    Pengecekan memakai importlib.util.find_spec sehingga modul tidak ikut
+    di-import saat startup; pip hanya dijalankan jika ada yang belum terinstall.
+    """
+    missing_packages = [package for package, import_name in REQUIRED_PACKAGES.items()
+                        if importlib.util.find_spec(import_name) is None]
     
     if missing_packages:
         print(f"Menginstall dependencies: {', '.join(missing_packages)}")
         for package in missing_packages:
             subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+        importlib.invalidate_caches()
         print("Semua dependencies telah diinstall!")
 
 # Install dependencies jika belum ada
 try:
     check_and_install_dependencies()
-    import requests
-    from bs4 import BeautifulSoup
-    import pandas as pd
-    from urllib.parse import urljoin, urlparse
-    import re
+    # Modul berat (pandas, openpyxl) di-import saat pertama kali dipakai
+    from scraper_engine import (DedupSink, Deduplicator, DnsCache, FingerprintStore, HttpCache,
+                                JobStore, Metrics, ScraperEngine, SitemapReader,
+                                available_backends, export_data, export_tables)
 except Exception as e:
     print(f"Error installing dependencies: {e}")
     input("Tekan Enter untuk keluar...")
     sys.exit(1)
 
+class UiQueue:
+    """Saluran thread worker -> GUI, diproses per tick di thread Tk
+
+    Worker hanya menaruh event ke antrian (tanpa menyentuh widget atau
+    root.after). post() dijalankan berurutan; update() digabung per key
+    sehingga status/progress yang datang beruntun hanya digambar sekali.
+    """
+    
+    TICK_MS = 100
+    
+    def __init__(self, root, metrics=None):
+        self.root = root
+        self.metrics = metrics  # waktu callback per tick dicatat sebagai fase 'ui'
+        self.on_error = None    # dipanggil dengan pesan jika callback error
+        self._lock = threading.Lock()
+        self._calls = []
+        self._latest = {}
+        self._tick()
+    
+    def post(self, func, *args):
+        """Jalankan func(*args) di thread GUI pada tick berikutnya"""
+        with self._lock:
+            self._calls.append((func, args))
+    
+    def update(self, key, func, *args):
+        """Seperti post(), tapi hanya panggilan terakhir per key yang dijalankan"""
+        with self._lock:
+            self._latest[key] = (func, args)
+    
+    def _tick(self):
+        with self._lock:
+            calls, self._calls = self._calls, []
+            latest, self._latest = self._latest, {}
+        start = time.perf_counter()
+        try:
+            for func, args in calls + list(latest.values()):
+                # Satu callback yang error tidak boleh membuang sisa antrian tick ini
+                try:
+                    func(*args)
+                except Exception as e:
+                    print(f"Error di callback UI {getattr(func, '__name__', func)}: {e}",
+                          file=sys.stderr)
+                    if func != self.report_error:
+                        self.post(self.report_error, e)
+        finally:
+            if self.metrics is not None and (calls or latest):
+                self.metrics.observe(None, 'ui', time.perf_counter() - start)
+            self.root.after(self.TICK_MS, self._tick)
+    
+    def report_error(self, error):
+        """Tampilkan error callback di status bar (jika aplikasi memasang on_error)"""
+        if self.on_error is not None:
+            self.on_error(f"Error tampilan: {error}")
+
+
 class EasyScraperApp:
+    TABLE_WINDOW = 1000  # Jumlah item terakhir yang disimpan di memory
+    PAGE_SIZE = 200      # Jumlah baris per halaman di Data Viewer
+    CACHE_PATH = os.path.join(os.path.expanduser('~'), '.easyscraper', 'http_cache.sqlite')
+    # Job sesi ini; disimpan jika ada URL yang belum selesai saat aplikasi ditutup/crash
+    SESSION_PATH = os.path.join(os.path.expanduser('~'), '.easyscraper', 'session.sqlite')
+    FINGERPRINT_PATH = os.path.join(os.path.expanduser('~'), '.easyscraper', 'fingerprints.sqlite')
+    
     def __init__(self, root):
         self.root = root
         self.root.title("EasyScraper v1.0 - Web Scraping Made Easy")
@@ -65,16 +124,93 @@ class EasyScraperApp:
         self.root.resizable(True, True)
         
         # Variabel
-        self.scraped_data = []
+        # Hasil disimpan streaming ke SQLite; hanya item terakhir yang ada di memory
+        os.makedirs(os.path.dirname(self.SESSION_PATH), exist_ok=True)
+        self.scraped_data = JobStore(self.SESSION_PATH, window=self.TABLE_WINDOW)
         self.is_scraping = False
+        # Cache DNS dipasang untuk seluruh aplikasi (scraping, robots.txt, sitemap)
+        self.dns = DnsCache().install()
+        # Waktu per fase request (DNS, connect, TLS, TTFB, download, parse, ...) dan UI
+        self.metrics = Metrics()
+        self.engine = ScraperEngine(dns=self.dns, metrics=self.metrics)
+        self.ui = UiQueue(root, self.metrics)
+        self.workers = []            # Thread scraping/export yang memakai store
+        self._stats_shown = 0.0      # Waktu terakhir tab Statistik digambar ulang
+        self.http_cache = None       # Dibuka saat opsi cache HTTP pertama kali dipakai
+        self.fingerprints = None     # Dibuka saat mode incremental pertama kali dipakai
+        self.failure_report = None   # FailureReport dari run multiple URL terakhir
+        self.table_page = 0          # Halaman Data Viewer yang dipilih user
+        self._rendered_page = None   # Halaman yang sedang ada di Treeview
+        self._rendered_rows = 0
         
         # Style
         style = ttk.Style()
         style.theme_use('clam')
         
         self.create_widgets()
+        self.ui.on_error = self.update_status
         self.center_window()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.ui.post(self.offer_resume)
+    
+    def offer_resume(self):
+        """Tawarkan melanjutkan job sesi sebelumnya yang belum selesai"""
+        pending = self.scraped_data.pending_urls()
+        if not pending:
+            if self.scraped_data:
+                self.update_results_display()
+            return
         
+        if messagebox.askyesno(
+                "Lanjutkan Job",
+                f"Scraping sebelumnya berhenti dengan {len(pending)} URL belum selesai "
+                f"({len(self.scraped_data)} item sudah tersimpan).\n\n"
+                f"Lanjutkan sekarang?\n(No = mulai baru, data lama dihapus)"):
+            self.update_results_display()
+            self.urls_text.delete('1.0', 'end')
+            self.urls_text.insert('1.0', '\n'.join(pending))
+            self.start_advanced_scraping(resume=True)
+        else:
+            self.scraped_data.clear()
+    
+    def on_close(self):
+        """Tutup aplikasi; file sesi hanya disimpan jika job belum selesai"""
+        self.is_scraping = False
+        if not self.wait_workers():
+            # Worker masih menulis: store dibiarkan terbuka, job bisa dilanjutkan nanti
+            self.dns.uninstall()
+            self.root.destroy()
+            return
+        if self.scraped_data.pending_urls():
+            self.scraped_data.close()
+        else:
+            self.scraped_data.discard()
+        self.engine.close()
+        self.dns.uninstall()
+        if self.http_cache is not None:
+            self.http_cache.close()
+        if self.fingerprints is not None:
+            self.fingerprints.close()
+        self.root.destroy()
+        
+    def start_worker(self, target, *args):
+        """Jalankan target di thread daemon yang ditunggu saat aplikasi ditutup"""
+        self.workers = [thread for thread in self.workers if thread.is_alive()]
+        thread = threading.Thread(target=target, args=args)
+        thread.daemon = True
+        thread.start()
+        self.workers.append(thread)
+    
+    def wait_workers(self, timeout=30):
+        """Tunggu thread scraping/export selesai; False jika masih jalan setelah timeout"""
+        deadline = time.monotonic() + timeout
+        for thread in self.workers:
+            if thread.is_alive():
+                self.update_status("Menunggu proses yang berjalan berhenti...")
+                self.root.update_idletasks()
+            thread.join(max(0, deadline - time.monotonic()))
+        return not any(thread.is_alive() for thread in self.workers)
+    
     def center_window(self):
         """Menempatkan window di tengah layar"""
         self.root.update_idletasks()
@@ -113,7 +249,10 @@ class EasyScraperApp:
         # Tab 4: Data Viewer
         self.create_data_tab(notebook)
         
-        # Tab 5: Help
+        # Tab 5: Statistik waktu per fase
+        self.create_stats_tab(notebook)
+        
+        # Tab 6: Help
         self.create_help_tab(notebook)
         
         # Status bar
@@ -215,8 +354,11 @@ class EasyScraperApp:
                   command=self.clear_data).pack(side='right', padx=5)
         
         # Progress
-        self.progress = ttk.Progressbar(frame, mode='indeterminate')
-        self.progress.pack(fill='x', padx=10, pady=5)
+        self.progress = ttk.Progressbar(frame, mode='determinate')
+        self.progress.pack(fill='x', padx=10, pady=(5, 0))
+        
+        self.progress_label = ttk.Label(frame, text="")
+        self.progress_label.pack(anchor='e', padx=10)
         
         # Results
         results_frame = ttk.LabelFrame(frame, text="Hasil Scraping", padding=10)
@@ -246,10 +388,103 @@ class EasyScraperApp:
         delay_frame = ttk.Frame(settings_frame)
         delay_frame.pack(fill='x', pady=5)
         
-        ttk.Label(delay_frame, text="Delay antar request (detik):").pack(side='left')
+        ttk.Label(delay_frame, text="Delay antar request per domain (detik):").pack(side='left')
         self.delay_var = tk.StringVar(value="1")
         ttk.Entry(delay_frame, textvariable=self.delay_var, width=10).pack(side='left', padx=5)
         
+        ttk.Label(delay_frame, text="Retry:").pack(side='left', padx=(10, 0))
+        self.retries_var = tk.StringVar(value="3")
+        ttk.Entry(delay_frame, textvariable=self.retries_var, width=4).pack(side='left', padx=5)
+        
+        self.cache_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(delay_frame, text="Cache HTTP (download ulang hanya jika halaman berubah)",
+                        variable=self.cache_var).pack(side='left', padx=10)
+        
+        self.respect_robots_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(delay_frame, text="Patuhi robots.txt",
+                        variable=self.respect_robots_var).pack(side='left', padx=10)
+        
+        # Concurrency
+        concurrency_frame = ttk.Frame(settings_frame)
+        concurrency_frame.pack(fill='x', pady=5)
+        
+        ttk.Label(concurrency_frame, text="Maks. request bersamaan:").pack(side='left')
+        self.max_workers_var = tk.StringVar(value="8")
+        ttk.Entry(concurrency_frame, textvariable=self.max_workers_var, width=6).pack(side='left', padx=5)
+        
+        ttk.Label(concurrency_frame, text="Maks. per domain:").pack(side='left', padx=(10, 0))
+        self.per_host_var = tk.StringVar(value="1")
+        ttk.Entry(concurrency_frame, textvariable=self.per_host_var, width=6).pack(side='left', padx=5)
+        
+        ttk.Label(concurrency_frame, text="Maks. MB/halaman:").pack(side='left', padx=(10, 0))
+        self.max_mb_var = tk.StringVar(value="10")
+        ttk.Entry(concurrency_frame, textvariable=self.max_mb_var, width=6).pack(side='left', padx=5)
+        
+        self.http2_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(concurrency_frame, text="HTTP/2 (butuh httpx[http2])",
+                        variable=self.http2_var).pack(side='left', padx=10)
+        
+        self.prewarm_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(concurrency_frame, text="Buka koneksi lebih awal",
+                        variable=self.prewarm_var).pack(side='left', padx=10)
+        
+        # Parser HTML
+        parser_frame = ttk.Frame(settings_frame)
+        parser_frame.pack(fill='x', pady=5)
+        
+        ttk.Label(parser_frame, text="Parser HTML:").pack(side='left')
+        self.parser_var = tk.StringVar(value="auto")
+        ttk.Combobox(parser_frame, textvariable=self.parser_var, state='readonly', width=12,
+                     values=['auto', 'stream', 'bs4', 'lxml', 'selectolax']).pack(side='left', padx=5)
+        ttk.Label(parser_frame, text=f"(terinstall: {', '.join(available_backends())})",
+                  foreground='gray').pack(side='left', padx=5)
+        
+        ttk.Label(parser_frame, text="Proses parser:").pack(side='left', padx=(10, 0))
+        self.parse_workers_var = tk.StringVar(value="0")
+        ttk.Entry(parser_frame, textvariable=self.parse_workers_var, width=6).pack(side='left', padx=5)
+        ttk.Label(parser_frame, text="(0 = thread, -1 = semua core)",
+                  foreground='gray').pack(side='left')
+        
+        # Incremental: scrape ulang hanya mengirim item yang berubah
+        incremental_frame = ttk.Frame(settings_frame)
+        incremental_frame.pack(fill='x', pady=5)
+        
+        self.incremental_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(incremental_frame,
+                        text="Hanya perubahan (halaman sama dilewati, item baru/berubah/hilang saja)",
+                        variable=self.incremental_var).pack(side='left')
+        ttk.Button(incremental_frame, text="🧹 Reset Riwayat",
+                   command=self.reset_fingerprints).pack(side='left', padx=10)
+        
+        # Dedup: item sama persis dan boilerplate tidak disimpan
+        dedup_frame = ttk.Frame(settings_frame)
+        dedup_frame.pack(fill='x', pady=5)
+        
+        self.dedup_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(dedup_frame,
+                        text="Buang duplikat (item sama, boilerplate)",
+                        variable=self.dedup_var).pack(side='left')
+        
+        # Crawl: URL di bawah menjadi seed, link yang ditemukan ikut diambil
+        crawl_frame = ttk.Frame(settings_frame)
+        crawl_frame.pack(fill='x', pady=5)
+        
+        self.crawl_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(crawl_frame, text="Mode crawl (ikuti link)",
+                        variable=self.crawl_var).pack(side='left')
+        
+        ttk.Label(crawl_frame, text="Kedalaman:").pack(side='left', padx=(10, 0))
+        self.crawl_depth_var = tk.StringVar(value="2")
+        ttk.Entry(crawl_frame, textvariable=self.crawl_depth_var, width=4).pack(side='left', padx=5)
+        
+        ttk.Label(crawl_frame, text="Maks. halaman:").pack(side='left')
+        self.crawl_pages_var = tk.StringVar(value="1000")
+        ttk.Entry(crawl_frame, textvariable=self.crawl_pages_var, width=7).pack(side='left', padx=5)
+        
+        self.same_domain_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(crawl_frame, text="Hanya domain yang sama",
+                        variable=self.same_domain_var).pack(side='left', padx=5)
+        
         # Multiple URLs
         urls_frame = ttk.LabelFrame(frame, text="Multiple URLs", padding=10)
         urls_frame.pack(fill='both', expand=True, padx=10, pady=5)
@@ -267,6 +502,10 @@ class EasyScraperApp:
         
         ttk.Button(adv_control_frame, text="📁 Load URLs from File", 
                   command=self.load_urls_from_file).pack(side='left', padx=5)
+        
+        self.failures_btn = ttk.Button(adv_control_frame, text="⚠️ Laporan Gagal",
+                                       command=self.show_failure_report, state='disabled')
+        self.failures_btn.pack(side='left', padx=5)
     
     def create_robots_tab(self, notebook):
         """Tab untuk robots.txt checker"""
@@ -293,6 +532,24 @@ class EasyScraperApp:
         ttk.Button(robots_controls, text="📋 Batch Check", 
                   command=self.batch_check_robots).pack(side='left', padx=5)
         
+        ttk.Label(robots_controls, text="Paralel:").pack(side='left', padx=(15, 0))
+        self.robots_workers_var = tk.StringVar(value="16")
+        ttk.Entry(robots_controls, textvariable=self.robots_workers_var, width=5).pack(side='left', padx=5)
+        
+        ttk.Label(robots_controls, text="Timeout (detik):").pack(side='left')
+        self.robots_timeout_var = tk.StringVar(value="10")
+        ttk.Entry(robots_controls, textvariable=self.robots_timeout_var, width=5).pack(side='left', padx=5)
+        
+        sitemap_controls = ttk.Frame(robots_url_frame)
+        sitemap_controls.pack(fill='x', pady=5)
+        
+        ttk.Button(sitemap_controls, text="🗺️ Ambil URL dari Sitemap", 
+                  command=self.load_sitemap_urls).pack(side='left', padx=5)
+        
+        ttk.Label(sitemap_controls, text="Diubah sejak (YYYY-MM-DD, opsional):").pack(side='left', padx=(15, 0))
+        self.sitemap_since_var = tk.StringVar()
+        ttk.Entry(sitemap_controls, textvariable=self.sitemap_since_var, width=12).pack(side='left', padx=5)
+        
         # Results display
         results_frame = ttk.LabelFrame(frame, text="Robots.txt Analysis", padding=10)
         results_frame.pack(fill='both', expand=True, padx=10, pady=5)
@@ -343,6 +600,26 @@ class EasyScraperApp:
         self.data_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
         
+        # Navigasi halaman: Treeview hanya berisi satu halaman data
+        nav_frame = ttk.Frame(frame)
+        nav_frame.pack(fill='x', padx=10)
+        
+        ttk.Button(nav_frame, text="⏮", width=3,
+                  command=lambda: self.go_to_page(0)).pack(side='left')
+        ttk.Button(nav_frame, text="◀", width=3,
+                  command=lambda: self.go_to_page(self.table_page - 1)).pack(side='left')
+        ttk.Button(nav_frame, text="▶", width=3,
+                  command=lambda: self.go_to_page(self.table_page + 1)).pack(side='left')
+        ttk.Button(nav_frame, text="⏭", width=3,
+                  command=lambda: self.go_to_page(None)).pack(side='left')
+        
+        self.page_label = ttk.Label(nav_frame, text="Halaman 1 / 1")
+        self.page_label.pack(side='left', padx=10)
+        
+        self.follow_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(nav_frame, text="Ikuti data terbaru", variable=self.follow_var,
+                       command=self.update_data_table).pack(side='left', padx=5)
+        
         # Export options
         export_frame = ttk.Frame(frame)
         export_frame.pack(fill='x', padx=10, pady=5)
@@ -355,6 +632,124 @@ class EasyScraperApp:
         
         ttk.Button(export_frame, text="📋 Export JSON", 
                   command=lambda: self.export_data('json')).pack(side='left', padx=5)
+        
+        ttk.Button(export_frame, text="📜 Export JSONL", 
+                  command=lambda: self.export_data('jsonl')).pack(side='left', padx=5)
+        
+        ttk.Button(export_frame, text="🗃️ Export Parquet", 
+                  command=lambda: self.export_data('parquet')).pack(side='left', padx=5)
+        
+        ttk.Button(export_frame, text="📑 Export Tabel (Excel)", 
+                  command=lambda: self.export_data('tables')).pack(side='left', padx=5)
+    
+    # Nama fase metrics untuk tab Statistik
+    PHASE_LABELS = {
+        'dns': "DNS", 'connect': "Connect TCP", 'tls': "Handshake TLS",
+        'ttfb': "Menunggu respons (TTFB)", 'download': "Download body", 'parse': "Parse HTML",
+        'extract': "Extract data", 'store': "Simpan hasil", 'ui': "Update tampilan (UI)",
+        'total': "Total per request",
+    }
+    
+    def create_stats_tab(self, notebook):
+        """Tab statistik: waktu per fase, host paling lambat, dan bottleneck"""
+        frame = ttk.Frame(notebook)
+        notebook.add(frame, text="📈 Statistik")
+        
+        summary_frame = ttk.LabelFrame(frame, text="Ringkasan", padding=10)
+        summary_frame.pack(fill='x', padx=10, pady=5)
+        
+        self.stats_summary = ttk.Label(summary_frame, text="Belum ada request")
+        self.stats_summary.pack(anchor='w')
+        
+        # Waktu per fase (p50/p95 dari histogram)
+        phase_frame = ttk.LabelFrame(frame, text="Waktu per Fase", padding=10)
+        phase_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        columns = ('Fase', 'Jumlah', 'Rata-rata (ms)', 'p50 (ms)', 'p95 (ms)', 'Maks (ms)', 'Total (s)')
+        self.phase_tree = ttk.Treeview(phase_frame, columns=columns, show='headings', height=10)
+        for col in columns:
+            self.phase_tree.heading(col, text=col)
+            self.phase_tree.column(col, width=160 if col == 'Fase' else 90)
+        self.phase_tree.pack(fill='both', expand=True)
+        
+        # Host dengan total waktu terbesar
+        host_frame = ttk.LabelFrame(frame, text="Host Paling Lambat", padding=10)
+        host_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        columns = ('Host', 'Request', 'Gagal', 'KB', 'Total (s)', 'Rata-rata (ms)')
+        self.host_tree = ttk.Treeview(host_frame, columns=columns, show='headings', height=8)
+        for col in columns:
+            self.host_tree.heading(col, text=col)
+            self.host_tree.column(col, width=220 if col == 'Host' else 90)
+        
+        scrollbar = ttk.Scrollbar(host_frame, orient='vertical', command=self.host_tree.yview)
+        self.host_tree.configure(yscrollcommand=scrollbar.set)
+        
+        self.host_tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill='x', padx=10, pady=5)
+        
+        ttk.Button(button_frame, text="🔄 Refresh",
+                  command=self.update_stats_panel).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="💾 Export JSON",
+                  command=self.export_metrics).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="🧹 Reset",
+                  command=self.reset_metrics).pack(side='left', padx=5)
+    
+    def update_stats_panel(self, force=True):
+        """Gambar ulang tab Statistik; tanpa force paling sering sekali per detik"""
+        now = time.time()
+        if not force and now - self._stats_shown < 1.0:
+            return
+        self._stats_shown = now
+        
+        snapshot = self.metrics.snapshot(top_hosts=50)
+        counters = snapshot['counters']
+        summary = (f"{counters['requests']} request, {counters['errors']} gagal, "
+                   f"{counters['bytes'] / (1024 * 1024):.1f} MB, {counters['items']} item")
+        bottleneck = snapshot.get('bottleneck')
+        if bottleneck:
+            summary += (f" | Waktu terbanyak: {bottleneck['group']} "
+                        f"({bottleneck['percent']:.0f}% dari waktu terukur)")
+        self.stats_summary.configure(text=summary)
+        
+        self.phase_tree.delete(*self.phase_tree.get_children())
+        for phase, label in self.PHASE_LABELS.items():
+            stats = snapshot['phases'].get(phase)
+            if stats is None:
+                continue
+            self.phase_tree.insert('', 'end', values=(
+                label, stats['count'], f"{stats['avg'] * 1000:.1f}", f"{stats['p50'] * 1000:.1f}",
+                f"{stats['p95'] * 1000:.1f}", f"{stats['max'] * 1000:.1f}", f"{stats['sum']:.2f}"))
+        
+        self.host_tree.delete(*self.host_tree.get_children())
+        for host, stats in snapshot['hosts'].items():
+            total = stats['seconds'].get('total', 0.0)
+            average = total / stats['requests'] * 1000 if stats['requests'] else 0.0
+            self.host_tree.insert('', 'end', values=(
+                host, stats['requests'], stats['errors'], f"{stats['bytes'] / 1024:.0f}",
+                f"{total:.2f}", f"{average:.1f}"))
+    
+    def export_metrics(self):
+        """Simpan snapshot metrics (fase, host, histogram) ke file JSON"""
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if filename:
+            try:
+                self.metrics.write_json(filename)
+                messagebox.showinfo("Success", f"Statistik disimpan ke {filename}")
+            except Exception as e:
+                messagebox.showerror("Error", f"Gagal menyimpan statistik: {str(e)}")
+    
+    def reset_metrics(self):
+        """Mulai statistik dari nol (mis. sebelum job baru)"""
+        self.metrics.reset()
+        self.update_stats_panel()
+        self.update_status("Statistik direset")
     
     def create_help_tab(self, notebook):
         """Tab bantuan dan tutorial"""
@@ -374,6 +769,7 @@ class EasyScraperApp:
 
 2. ADVANCED SCRAPER:
    • Atur User Agent dan delay
+   • Delay berlaku per domain, domain berbeda di-scrape paralel
    • Masukkan multiple URLs
    • Scrape banyak website sekaligus
 
@@ -431,9 +827,50 @@ class EasyScraperApp:
             self.custom_frame.pack_forget()
     
     def update_status(self, message):
-        """Update status bar"""
+        """Update status bar (hanya dari thread GUI; worker memakai self.ui)"""
         self.status_var.set(message)
-        self.root.update_idletasks()
+    
+    def start_progress(self, total):
+        """Reset progress bar untuk `total` URL"""
+        self._progress_started = time.time()
+        self._progress_bytes = 0
+        self.progress.configure(maximum=max(total, 1), value=0)
+        self.progress_label.configure(text=f"0/{total}")
+    
+    def show_progress(self, done, total, nbytes):
+        """Tampilkan done/total, halaman/detik, dan kecepatan download"""
+        elapsed = max(time.time() - self._progress_started, 1e-6)
+        self.progress.configure(maximum=max(total, 1), value=done)
+        self.progress_label.configure(
+            text=f"{done}/{total} • {done / elapsed:.1f} halaman/s • "
+                 f"{nbytes / elapsed / 1024:.1f} KB/s")
+    
+    def get_http_cache(self):
+        """HttpCache jika opsi cache aktif, atau None"""
+        if not self.cache_var.get():
+            return None
+        if self.http_cache is None:
+            self.http_cache = HttpCache(self.CACHE_PATH)
+        return self.http_cache
+    
+    def get_fingerprints(self):
+        """FingerprintStore jika mode incremental aktif, atau None"""
+        if not self.incremental_var.get():
+            return None
+        if self.fingerprints is None:
+            self.fingerprints = FingerprintStore(self.FINGERPRINT_PATH)
+        return self.fingerprints
+    
+    def reset_fingerprints(self):
+        """Lupakan riwayat incremental; run berikutnya mengambil semua item lagi"""
+        if not messagebox.askyesno("Reset Riwayat",
+                                   "Hapus riwayat halaman? Scraping berikutnya akan "
+                                   "mengambil semua item lagi."):
+            return
+        if self.fingerprints is None:
+            self.fingerprints = FingerprintStore(self.FINGERPRINT_PATH)
+        self.fingerprints.forget()
+        self.update_status("Riwayat incremental dihapus")
     
     def start_simple_scraping(self):
         """Memulai simple scraping"""
@@ -449,15 +886,26 @@ class EasyScraperApp:
         self.is_scraping = True
         self.scrape_btn.configure(state='disabled')
         self.stop_btn.configure(state='normal')
-        self.progress.start()
+        self.start_progress(1)
         
-        # Jalankan scraping di thread terpisah
-        thread = threading.Thread(target=self.scrape_website, args=(url,))
-        thread.daemon = True
-        thread.start()
+        # Baca pengaturan di thread GUI, lalu scraping di thread terpisah
+        try:
+            max_bytes = int(float(self.max_mb_var.get()) * 1024 * 1024) or None
+        except ValueError:
+            max_bytes = 10 * 1024 * 1024
+        self.engine.configure(parser=self.parser_var.get(), cache=self.get_http_cache(),
+                              fingerprints=self.get_fingerprints(),
+                              respect_robots=self.respect_robots_var.get(), max_bytes=max_bytes)
+        dedup = Deduplicator() if self.dedup_var.get() else None
+        args = (url, self.target_var.get(), self.custom_selector.get(), self.user_agent.get(), dedup)
+        self.start_worker(self.scrape_website, *args)
     
-    def start_advanced_scraping(self):
-        """Memulai advanced scraping"""
+    def start_advanced_scraping(self, resume=False):
+        """Memulai advanced scraping
+
+        resume=True (dari offer_resume): jumlah percobaan URL di job tidak
+        direset, jadi URL yang terus gagal berhenti setelah max_attempts.
+        """
         urls_text = self.urls_text.get('1.0', 'end-1c').strip()
         if not urls_text:
             messagebox.showerror("Error", "Masukkan URLs terlebih dahulu!")
@@ -468,176 +916,187 @@ class EasyScraperApp:
             messagebox.showerror("Error", "Tidak ada URL valid!")
             return
         
+        try:
+            delay = float(self.delay_var.get())
+        except ValueError:
+            delay = 1
+        try:
+            max_workers = int(self.max_workers_var.get())
+            per_host = int(self.per_host_var.get())
+        except ValueError:
+            max_workers, per_host = 8, 1
+        try:
+            parse_workers = int(self.parse_workers_var.get())
+        except ValueError:
+            parse_workers = 0
+        try:
+            max_retries = int(self.retries_var.get())
+        except ValueError:
+            max_retries = 3
+        try:
+            max_bytes = int(float(self.max_mb_var.get()) * 1024 * 1024) or None
+        except ValueError:
+            max_bytes = 10 * 1024 * 1024
+        settings = (delay, max_workers, per_host, self.user_agent.get(), self.http2_var.get())
+        crawl = None
+        if self.crawl_var.get():
+            try:
+                crawl = (int(self.crawl_depth_var.get()), int(self.crawl_pages_var.get()),
+                         self.same_domain_var.get())
+            except ValueError:
+                crawl = (2, 1000, self.same_domain_var.get())
+        self.engine.configure(parser=self.parser_var.get(), parse_workers=parse_workers,
+                              max_retries=max_retries, max_bytes=max_bytes,
+                              cache=self.get_http_cache(), fingerprints=self.get_fingerprints(),
+                              respect_robots=self.respect_robots_var.get(),
+                              prewarm=self.prewarm_var.get())
+        if crawl is None:
+            # Catat URL di job supaya bisa dilanjutkan jika berhenti di tengah jalan
+            urls = self.scraped_data.add_urls(urls, reset=not resume)
+        
         self.is_scraping = True
-        self.progress.start()
+        self.scrape_btn.configure(state='disabled')
+        self.stop_btn.configure(state='normal')
+        self.start_progress(len(urls) if crawl is None else crawl[1])
+        self.set_failure_report(None)
         
         # Jalankan scraping di thread terpisah
-        thread = threading.Thread(target=self.scrape_multiple_websites, args=(urls,))
-        thread.daemon = True
-        thread.start()
+        dedup = Deduplicator() if self.dedup_var.get() else None
+        self.start_worker(self.scrape_multiple_websites, urls, settings, crawl, dedup)
     
-    def scrape_website(self, url):
-        """Scraping satu website"""
+    def scrape_website(self, url, mode, selector, user_agent, dedup=None):
+        """Scraping satu website (item difilter dedup jika diberikan)"""
         try:
-            self.update_status(f"Scraping {url}...")
-            
-            headers = {'User-Agent': self.user_agent.get()}
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            target_type = self.target_var.get()
-            
-            results = []
-            
-            if target_type == "text":
-                # Ambil semua teks
-                for element in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'span', 'div']):
-                    text = element.get_text(strip=True)
-                    if text and len(text) > 10:  # Filter teks pendek
-                        results.append({
-                            'type': 'text',
-                            'content': text,
-                            'tag': element.name
-                        })
-            
-            elif target_type == "links":
-                # Ambil semua link
-                for link in soup.find_all('a', href=True):
-                    href = urljoin(url, link['href'])
-                    text = link.get_text(strip=True)
-                    results.append({
-                        'type': 'link',
-                        'content': href,
-                        'text': text
-                    })
-            
-            elif target_type == "images":
-                # Ambil semua gambar
-                for img in soup.find_all('img', src=True):
-                    src = urljoin(url, img['src'])
-                    alt = img.get('alt', '')
-                    results.append({
-                        'type': 'image',
-                        'content': src,
-                        'alt': alt
-                    })
+            self.ui.update('status', self.update_status, f"Scraping {url}...")
             
-            elif target_type == "tables":
-                # Ambil tabel
-                for i, table in enumerate(soup.find_all('table')):
-                    try:
-                        df = pd.read_html(str(table))[0]
-                        results.append({
-                            'type': 'table',
-                            'content': df.to_string(),
-                            'table_id': i
-                        })
-                    except:
-                        pass
-            
-            elif target_type == "custom":
-                # Custom CSS selector
-                selector = self.custom_selector.get().strip()
-                if selector:
-                    for element in soup.select(selector):
-                        content = element.get_text(strip=True) if element.string else str(element)
-                        results.append({
-                            'type': 'custom',
-                            'content': content,
-                            'selector': selector
-                        })
+            self.engine.configure(user_agent=user_agent)
+            items = self.engine.scrape_url(url, mode, selector)
+            if dedup is not None:
+                items = dedup.filter(url, items)
             
             # Simpan hasil
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            for result in results:
-                self.scraped_data.append({
-                    'url': url,
-                    'timestamp': timestamp,
-                    **result
-                })
+            self.scraped_data.add_many(items)
             
             # Update UI
-            self.root.after(0, self.update_results_display)
-            self.root.after(0, lambda: self.update_status(f"Berhasil scraping {len(results)} item dari {url}"))
+            self.ui.update('results', self.update_results_display)
+            self.ui.update('progress', self.show_progress, 1, 1, 0)
+            if self.engine.fingerprints is not None and not items:
+                self.ui.update('status', self.update_status, f"Tidak ada perubahan di {url}")
+            else:
+                self.ui.update('status', self.update_status, f"Berhasil scraping {len(items)} item dari {url}")
+            self.ui.update('stats', self.update_stats_panel)
             
         except Exception as e:
-            self.root.after(0, lambda: self.update_status(f"Error: {str(e)}"))
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Gagal scraping {url}:\n{str(e)}"))
+            self.ui.update('status', self.update_status, f"Error: {str(e)}")
+            self.ui.post(messagebox.showerror, "Error", f"Gagal scraping {url}:\n{str(e)}")
         
         finally:
-            self.root.after(0, self.scraping_finished)
+            self.ui.post(self.scraping_finished)
     
-    def scrape_multiple_websites(self, urls):
-        """Scraping multiple websites"""
-        try:
-            delay = float(self.delay_var.get())
-        except:
-            delay = 1
+    def scrape_multiple_websites(self, urls, settings, crawl=None, dedup=None):
+        """Scraping multiple websites secara concurrent lewat engine
+
+        crawl = (kedalaman, maks_halaman, hanya_domain_sama) untuk mode crawl;
+        dedup = Deduplicator untuk membuang item duplikat sebelum disimpan.
+        """
+        delay, max_workers, per_host, user_agent, http2 = settings
+        self.engine.configure(delay=delay, max_workers=max_workers, per_host=per_host,
+                              user_agent=user_agent, http2=http2)
+        
+        downloaded = [0]
+        
+        # Dipanggil dari thread scraping: hanya kirim event ke UiQueue
+        def on_progress(done, total, url, count, error, nbytes):
+            downloaded[0] += nbytes
+            self.ui.update('progress', self.show_progress, done, total, downloaded[0])
+            if error is not None:
+                # Dicatat di laporan gagal; tidak ada popup per URL
+                self.ui.update('status', self.update_status, f"Gagal {done}/{total}: {url}")
+                return
+            self.ui.update('status', self.update_status, f"Scraping {done}/{total}: {url}")
+            self.ui.update('stats', self.update_stats_panel, False)
+            if count:
+                self.ui.update('results', self.update_results_display)
+        
+        sink = self.scraped_data if dedup is None else DedupSink(self.scraped_data, dedup)
+        if crawl is None:
+            stats = self.engine.scrape_many(urls, sink,
+                                            on_progress=on_progress,
+                                            should_continue=lambda: self.is_scraping)
+        else:
+            max_depth, max_pages, same_domain = crawl
+            stats = self.engine.crawl(urls, sink, max_depth=max_depth,
+                                      max_pages=max_pages, same_domain=same_domain,
+                                      on_progress=on_progress,
+                                      should_continue=lambda: self.is_scraping)
+        if http2 and not self.engine.http.http2:
+            self.ui.post(self.update_status, "httpx[http2] tidak terinstall, memakai HTTP/1.1")
         
-        total_results = 0
+        # Update UI
+        self.ui.update('results', self.update_results_display)
+        message = f"Selesai! Total {stats['items']} item dari {stats['urls']} website"
+        if stats.get('unchanged'):
+            message += f", {stats['unchanged']} halaman tidak berubah"
+        if dedup is not None:
+            message += f", {dedup.summary()}"
+        if stats['failed']:
+            message += f" ({stats['failed']} gagal, lihat Laporan Gagal)"
+        self.ui.update('status', self.update_status, message)
+        self.ui.update('stats', self.update_stats_panel)
+        self.ui.post(self.set_failure_report, stats['failures'])
+        self.ui.post(self.scraping_finished)
+    
+    def set_failure_report(self, report):
+        """Simpan laporan gagal terakhir dan aktifkan tombolnya jika ada isinya"""
+        self.failure_report = report
+        self.failures_btn.configure(state='normal' if report else 'disabled')
+    
+    def show_failure_report(self):
+        """Jendela daftar URL gagal (kategori, jumlah percobaan, error)"""
+        report = self.failure_report
+        if not report:
+            messagebox.showinfo("Info", "Tidak ada URL yang gagal.")
+            return
         
-        for i, url in enumerate(urls):
-            if not self.is_scraping:
-                break
-            
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
-            
+        window = tk.Toplevel(self.root)
+        window.title(f"Laporan Gagal - {len(report)} URL")
+        window.geometry("700x400")
+        
+        ttk.Label(window, text=f"Per kategori: {report.summary()}").pack(anchor='w', padx=10, pady=5)
+        
+        text = scrolledtext.ScrolledText(window, height=15)
+        text.pack(fill='both', expand=True, padx=10, pady=5)
+        for entry in report:
+            text.insert('end', f"[{entry['category']}] {entry['url']} "
+                               f"({entry['attempts']}x)\n   {entry['error']}\n")
+        text.configure(state='disabled')
+        
+        btn_frame = ttk.Frame(window)
+        btn_frame.pack(fill='x', padx=10, pady=5)
+        ttk.Button(btn_frame, text="🔁 Scrape Ulang yang Gagal",
+                   command=lambda: self.retry_failed_urls(window)).pack(side='left', padx=5)
+        ttk.Button(btn_frame, text="💾 Simpan CSV",
+                   command=self.save_failure_report).pack(side='left', padx=5)
+    
+    def retry_failed_urls(self, window=None):
+        """Isi daftar URL dengan URL yang gagal supaya bisa dijalankan lagi"""
+        self.urls_text.delete('1.0', 'end')
+        self.urls_text.insert('1.0', '\n'.join(entry['url'] for entry in self.failure_report))
+        if window is not None:
+            window.destroy()
+        self.update_status(f"{len(self.failure_report)} URL gagal dimuat ke tab Advanced")
+    
+    def save_failure_report(self):
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if filename:
             try:
-                self.update_status(f"Scraping {i+1}/{len(urls)}: {url}")
-                
-                headers = {'User-Agent': self.user_agent.get()}
-                response = requests.get(url, headers=headers, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Simple scraping - ambil teks dan link
-                results = []
-                
-                # Teks
-                for element in soup.find_all(['p', 'h1', 'h2', 'h3']):
-                    text = element.get_text(strip=True)
-                    if text and len(text) > 20:
-                        results.append({
-                            'type': 'text',
-                            'content': text[:200] + '...' if len(text) > 200 else text
-                        })
-                
-                # Links
-                for link in soup.find_all('a', href=True):
-                    href = urljoin(url, link['href'])
-                    text = link.get_text(strip=True)
-                    if text:
-                        results.append({
-                            'type': 'link',
-                            'content': href,
-                            'text': text
-                        })
-                
-                # Simpan hasil
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                for result in results:
-                    self.scraped_data.append({
-                        'url': url,
-                        'timestamp': timestamp,
-                        **result
-                    })
-                
-                total_results += len(results)
-                
-                # Delay antar request
-                if i < len(urls) - 1:
-                    time.sleep(delay)
-                
+                self.failure_report.write_csv(filename)
+                messagebox.showinfo("Success", f"Laporan disimpan ke {filename}")
             except Exception as e:
-                self.root.after(0, lambda e=e, u=url: messagebox.showwarning("Warning", f"Gagal scraping {u}:\n{str(e)}"))
-        
-        # Update UI
-        self.root.after(0, self.update_results_display)
-        self.root.after(0, lambda: self.update_status(f"Selesai! Total {total_results} item dari {len(urls)} website"))
-        self.root.after(0, self.scraping_finished)
+                messagebox.showerror("Error", f"Gagal menyimpan laporan: {str(e)}")
     
     def stop_scraping(self):
         """Stop scraping"""
@@ -649,7 +1108,6 @@ class EasyScraperApp:
         self.is_scraping = False
         self.scrape_btn.configure(state='normal')
         self.stop_btn.configure(state='disabled')
-        self.progress.stop()
     
     def update_results_display(self):
         """Update tampilan hasil"""
@@ -657,7 +1115,7 @@ class EasyScraperApp:
         self.results_text.delete('1.0', 'end')
         
         # Show latest results
-        recent_data = self.scraped_data[-50:]  # Show last 50 items
+        recent_data = self.scraped_data.recent(50)  # Show last 50 items
         
         for i, item in enumerate(recent_data, 1):
             self.results_text.insert('end', f"{i}. [{item['type'].upper()}] {item['url']}\n")
@@ -668,61 +1126,90 @@ class EasyScraperApp:
         
         # Update summary
         total_items = len(self.scraped_data)
-        unique_urls = len(set(item['url'] for item in self.scraped_data))
+        unique_urls = self.scraped_data.unique_urls()
         self.data_summary.configure(text=f"Total: {total_items} items dari {unique_urls} website")
     
+    def go_to_page(self, page):
+        """Pindah halaman Data Viewer; None = halaman terakhir dan ikuti data baru"""
+        self.follow_var.set(page is None)
+        if page is not None:
+            self.table_page = max(0, page)
+        self.update_data_table()
+    
     def update_data_table(self):
-        """Update data table"""
-        # Clear existing data
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
+        """Update data table (hanya halaman yang terlihat, baris baru ditambahkan saja)"""
+        total = len(self.scraped_data)
+        pages = max(1, -(-total // self.PAGE_SIZE))
+        if self.follow_var.get():
+            self.table_page = pages - 1
+        self.table_page = min(self.table_page, pages - 1)
+        self.page_label.configure(text=f"Halaman {self.table_page + 1} / {pages}")
+        
+        start = self.table_page * self.PAGE_SIZE
+        rows = min(self.PAGE_SIZE, total - start)
+        if self._rendered_page != self.table_page or rows < self._rendered_rows:
+            # Halaman lain (atau data di-clear): render ulang satu halaman saja
+            self.data_tree.delete(*self.data_tree.get_children())
+            self._rendered_page = self.table_page
+            self._rendered_rows = 0
+        if rows <= self._rendered_rows:
+            return
         
-        # Add new data
-        for i, item in enumerate(self.scraped_data, 1):
+        first = start + self._rendered_rows
+        new_items = self.scraped_data.page(first, rows - self._rendered_rows)
+        for i, item in enumerate(new_items, first + 1):
             content = item['content'][:50] + "..." if len(item['content']) > 50 else item['content']
             self.data_tree.insert('', 'end', values=(
                 i, item['url'], item['type'], content, item['timestamp']
             ))
+        self._rendered_rows += len(new_items)
+    
+    EXPORT_FILETYPES = {
+        'csv': ("CSV files", "*.csv"),
+        'excel': ("Excel files", "*.xlsx"),
+        'json': ("JSON files", "*.json"),
+        'jsonl': ("JSON Lines files", "*.jsonl"),
+        'parquet': ("Parquet files", "*.parquet"),
+        'tables': ("Excel files", "*.xlsx"),
+    }
     
     def export_data(self, format_type='csv'):
-        """Export data ke berbagai format"""
+        """Export data ke berbagai format (streaming, di thread terpisah)"""
         if not self.scraped_data:
             messagebox.showinfo("Info", "Belum ada data untuk di-export!")
             return
         
-        try:
-            if format_type == 'csv':
-                filename = filedialog.asksaveasfilename(
-                    defaultextension=".csv",
-                    filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-                )
-                if filename:
-                    df = pd.DataFrame(self.scraped_data)
-                    df.to_csv(filename, index=False, encoding='utf-8-sig')
-                    messagebox.showinfo("Success", f"Data berhasil di-export ke {filename}")
-            
-            elif format_type == 'excel':
-                filename = filedialog.asksaveasfilename(
-                    defaultextension=".xlsx",
-                    filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
-                )
-                if filename:
-                    df = pd.DataFrame(self.scraped_data)
-                    df.to_excel(filename, index=False)
-                    messagebox.showinfo("Success", f"Data berhasil di-export ke {filename}")
-            
-            elif format_type == 'json':
-                filename = filedialog.asksaveasfilename(
-                    defaultextension=".json",
-                    filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
-                )
-                if filename:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(self.scraped_data, f, indent=2, ensure_ascii=False)
-                    messagebox.showinfo("Success", f"Data berhasil di-export ke {filename}")
+        label, pattern = self.EXPORT_FILETYPES[format_type]
+        filename = filedialog.asksaveasfilename(
+            defaultextension=pattern[1:],
+            filetypes=[(label, pattern), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        
+        total = len(self.scraped_data)
+        self.update_status(f"Export {total} item ke {filename}...")
+        self.start_worker(self.export_worker, filename, format_type, total)
+    
+    def export_worker(self, filename, format_type, total):
+        """Tulis file export per batch; progress lewat status bar"""
+        unit = 'tabel' if format_type == 'tables' else 'item'
+        
+        def on_progress(count):
+            self.ui.update('status', self.update_status, f"Export {count} {unit}...")
         
+        try:
+            if format_type == 'tables':
+                # Satu sheet per tabel dengan kolom dan tipe aslinya
+                count = export_tables(self.scraped_data, filename, 'xlsx', on_progress=on_progress)
+            else:
+                count = export_data(self.scraped_data, filename, format_type, on_progress=on_progress)
         except Exception as e:
-            messagebox.showerror("Error", f"Gagal export data: {str(e)}")
+            self.ui.update('status', self.update_status, "Export gagal")
+            self.ui.post(messagebox.showerror, "Error", f"Gagal export data: {str(e)}")
+            return
+        self.ui.update('status', self.update_status, f"{count} {unit} di-export ke {filename}")
+        self.ui.post(messagebox.showinfo, "Success", f"Data berhasil di-export ke {filename}")
     
     def clear_data(self):
         """Clear semua data"""
@@ -761,7 +1248,6 @@ class EasyScraperApp:
         
         try:
             # Parse domain from URL
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
             
@@ -779,19 +1265,19 @@ class EasyScraperApp:
     def _check_robots_thread(self, robots_url, target_url):
         """Check robots.txt in background thread"""
         try:
-            rp = RobotFileParser()
-            rp.set_url(robots_url)
-            rp.read()
-            
             # Check if our user agent can fetch the URL
             user_agent = self.user_agent.get() if hasattr(self, 'user_agent') else '*'
-            can_fetch = rp.can_fetch(user_agent, target_url)
+            entry = self.engine.robots.entry(target_url, user_agent)
+            if entry.error is not None:
+                raise entry.error
+            
+            can_fetch = entry.can_fetch(target_url, user_agent)
             
             # Get crawl delay
-            crawl_delay = rp.crawl_delay(user_agent)
+            crawl_delay = entry.parser.crawl_delay(user_agent)
             
             # Get request rate
-            request_rate = rp.request_rate(user_agent)
+            request_rate = entry.parser.request_rate(user_agent)
             
             # Update UI in main thread
             if can_fetch:
@@ -805,22 +1291,22 @@ class EasyScraperApp:
                 status_text += f" | Delay: {crawl_delay}s"
                 # Auto-update delay in advanced settings
                 if hasattr(self, 'delay_var'):
-                    self.root.after(0, lambda: self.delay_var.set(str(max(float(self.delay_var.get()), crawl_delay))))
+                    self.ui.post(lambda: self.delay_var.set(str(max(float(self.delay_var.get()), crawl_delay))))
             
             if request_rate:
                 status_text += f" | Rate: {request_rate.requests}/{request_rate.seconds}s"
             
-            self.root.after(0, lambda: self.robots_status.configure(text=status_text, foreground=color))
-            self.root.after(0, lambda: self.update_status(f"Robots.txt checked: {'Allowed' if can_fetch else 'Blocked'}"))
+            self.ui.post(lambda: self.robots_status.configure(text=status_text, foreground=color))
+            self.ui.post(lambda: self.update_status(f"Robots.txt checked: {'Allowed' if can_fetch else 'Blocked'}"))
             
             # Show detailed robots.txt info
             if not can_fetch:
-                self.root.after(0, lambda: self._show_robots_warning(robots_url))
+                self.ui.post(lambda: self._show_robots_warning(robots_url))
                 
         except Exception as e:
             error_text = f"⚠️ Tidak bisa mengakses robots.txt"
-            self.root.after(0, lambda: self.robots_status.configure(text=error_text, foreground="orange"))
-            self.root.after(0, lambda: self.update_status("Robots.txt tidak tersedia (mungkin tidak ada)"))
+            self.ui.post(lambda: self.robots_status.configure(text=error_text, foreground="orange"))
+            self.ui.post(lambda: self.update_status("Robots.txt tidak tersedia (mungkin tidak ada)"))
     
     def _show_robots_warning(self, robots_url):
         """Show warning dialog when robots.txt blocks scraping"""
@@ -868,21 +1354,17 @@ class EasyScraperApp:
     def _detailed_robots_check(self, url):
         """Detailed robots.txt analysis"""
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
             
-            # Fetch robots.txt content
-            headers = {'User-Agent': 'EasyScraper/1.0'}
-            response = requests.get(robots_url, headers=headers, timeout=10)
+            # Pakai cache robots.txt bersama (download hanya jika belum ada)
+            entry = self.engine.robots.entry(url, self.engine.user_agent)
+            if entry.error is not None:
+                raise entry.error
+            rp = entry.parser
             
-            if response.status_code == 200:
-                robots_content = response.text
-                
-                # Parse with RobotFileParser
-                rp = RobotFileParser()
-                rp.set_url(robots_url)
-                rp.read()
+            if entry.found:
+                robots_content = entry.text
                 
                 # Analysis
                 result = f"✅ Robots.txt found at: {robots_url}\n\n"
@@ -931,14 +1413,14 @@ class EasyScraperApp:
                     result += "💡 Consider contacting website owner for permission\n"
                 
                 # Find sitemaps
-                sitemap_lines = [line for line in robots_content.split('\n') 
-                               if line.strip().lower().startswith('sitemap:')]
-                if sitemap_lines:
+                sitemaps = entry.sitemaps()
+                if sitemaps:
                     result += "\n🗺️  SITEMAPS FOUND:\n"
-                    for sitemap in sitemap_lines:
-                        result += f"   {sitemap.strip()}\n"
+                    for sitemap in sitemaps:
+                        result += f"   {sitemap}\n"
+                    result += "💡 Klik '🗺️ Ambil URL dari Sitemap' untuk memasukkan URL-nya ke Multiple URLs\n"
                 
-            elif response.status_code == 404:
+            elif entry.status == 404:
                 result = f"ℹ️  No robots.txt found at: {robots_url}\n\n"
                 result += "This means:\n"
                 result += "✅ No specific restrictions (generally safe to scrape)\n"
@@ -946,7 +1428,7 @@ class EasyScraperApp:
                 result += "⚠️  Check website terms of service\n"
                 
             else:
-                result = f"⚠️  Error accessing robots.txt: HTTP {response.status_code}\n"
+                result = f"⚠️  Error accessing robots.txt: HTTP {entry.status}\n"
                 result += f"URL: {robots_url}\n"
                 
         except Exception as e:
@@ -954,8 +1436,8 @@ class EasyScraperApp:
             result += f"URL: {robots_url}\n"
         
         # Update UI
-        self.root.after(0, lambda: self.robots_results.delete('1.0', 'end'))
-        self.root.after(0, lambda: self.robots_results.insert('1.0', result))
+        self.ui.post(lambda: self.robots_results.delete('1.0', 'end'))
+        self.ui.post(lambda: self.robots_results.insert('1.0', result))
     
     def view_robots_txt(self):
         """Open robots.txt in browser"""
@@ -967,11 +1449,55 @@ class EasyScraperApp:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
-        from urllib.parse import urlparse
         parsed = urlparse(url)
         robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
         webbrowser.open(robots_url)
     
+    def load_sitemap_urls(self):
+        """Ambil URL halaman dari sitemap situs ke daftar Multiple URLs"""
+        url = self.robots_url_var.get().strip()
+        if not url:
+            messagebox.showwarning("Warning", "Masukkan URL situs atau sitemap!")
+            return
+        try:
+            reader = SitemapReader(self.engine, since=self.sitemap_since_var.get().strip() or None)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        
+        self.robots_results.delete('1.0', 'end')
+        self.robots_results.insert('end', f"🗺️ Membaca sitemap untuk: {url}\n")
+        self.robots_results.insert('end', "=" * 60 + "\n\n")
+        
+        thread = threading.Thread(target=self._sitemap_worker, args=(reader, url))
+        thread.daemon = True
+        thread.start()
+    
+    def _sitemap_worker(self, reader, url):
+        """Baca sitemap (streaming) lalu isi daftar Multiple URLs"""
+        def on_url(found):
+            if reader.stats['urls'] % 1000 == 0:
+                self.ui.update('status', self.update_status,
+                               f"Membaca sitemap... {reader.stats['urls']} URL")
+        
+        urls = reader.read([url], on_url=on_url)
+        stats = reader.stats
+        result = f"✅ {len(urls)} URL dari {stats['sitemaps']} sitemap\n"
+        if reader.since is not None:
+            result += (f"⏭️  Dilewati (lastmod lebih lama): {stats['old']} halaman, "
+                       f"{stats['old_sitemaps']} sitemap\n")
+        if stats['duplicates']:
+            result += f"♻️  Duplikat: {stats['duplicates']}\n"
+        for sitemap, error in reader.errors:
+            result += f"❌ {sitemap}: {error}\n"
+        if urls:
+            result += "\n📋 URL dimasukkan ke tab Advanced > Multiple URLs\n"
+            self.ui.post(self.urls_text.delete, '1.0', 'end')
+            self.ui.post(self.urls_text.insert, '1.0', '\n'.join(urls))
+        
+        self.ui.post(self.robots_results.insert, 'end', result)
+        self.ui.update('status', self.update_status, f"Sitemap: {len(urls)} URL ditemukan")
+    
     def batch_check_robots(self):
         """Batch check robots.txt for multiple domains"""
         domains_text = """masukkan domain (satu per baris):
@@ -981,7 +1507,7 @@ bukalapak.com
 blibli.com
 lazada.co.id"""
         
-        domains = tk.simpledialog.askstring(
+        domains = simpledialog.askstring(
             "Batch Robots.txt Check",
             "Masukkan domains (satu per baris):",
             initialvalue=domains_text
@@ -994,64 +1520,50 @@ lazada.co.id"""
         if not domain_list:
             return
         
+        try:
+            workers = max(1, int(self.robots_workers_var.get()))
+            timeout = max(1.0, float(self.robots_timeout_var.get()))
+        except ValueError:
+            workers, timeout = 16, 10.0
+        
         self.robots_results.delete('1.0', 'end')
         self.robots_results.insert('end', f"🔍 Batch checking {len(domain_list)} domains...\n")
         self.robots_results.insert('end', "=" * 60 + "\n\n")
         
-        thread = threading.Thread(target=self._batch_robots_check, args=(domain_list,))
+        thread = threading.Thread(target=self._batch_robots_check,
+                                  args=(domain_list, workers, timeout, self.engine.user_agent))
         thread.daemon = True
         thread.start()
     
-    def _batch_robots_check(self, domains):
-        """Batch robots.txt check"""
-        results = []
+    def _batch_robots_check(self, domains, workers, timeout, user_agent):
+        """Batch robots.txt check, paralel; hasil tampil begitu selesai"""
+        urls = [domain if domain.startswith(('http://', 'https://')) else 'https://' + domain
+                for domain in domains]
+        status_text = {'allowed': "✅ ALLOWED", 'blocked': "❌ BLOCKED"}
+        done = [0]
+        
+        def on_result(index, check):
+            done[0] += 1
+            if check.error is not None:
+                line = f"{index + 1:2d}. {check.host:<25} → ❌ ERROR: {str(check.error)}\n"
+            else:
+                delay_info = f" (delay: {check.crawl_delay:g}s)" if check.crawl_delay else ""
+                line = f"{index + 1:2d}. {check.host:<25} → {status_text[check.outcome]}{delay_info}\n"
+            self.ui.post(self.robots_results.insert, 'end', line)
+            self.ui.update('status', self.update_status, f"Checking robots.txt... {done[0]}/{len(urls)}")
         
-        for i, domain in enumerate(domains, 1):
-            if not domain.startswith(('http://', 'https://')):
-                domain = 'https://' + domain
-            
-            try:
-                from urllib.parse import urlparse
-                parsed = urlparse(domain)
-                robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-                
-                self.root.after(0, lambda d=domain: self.update_status(f"Checking {d}..."))
-                
-                rp = RobotFileParser()
-                rp.set_url(robots_url)
-                rp.read()
-                
-                can_fetch = rp.can_fetch('*', domain)
-                crawl_delay = rp.crawl_delay('*')
-                
-                status = "✅ ALLOWED" if can_fetch else "❌ BLOCKED"
-                delay_info = f" (delay: {crawl_delay}s)" if crawl_delay else ""
-                
-                result = f"{i:2d}. {parsed.netloc:<25} → {status}{delay_info}\n"
-                results.append(result)
-                
-                # Update UI progressively
-                self.root.after(0, lambda r=result: self.robots_results.insert('end', r))
-                
-                time.sleep(1)  # Be respectful
-                
-            except Exception as e:
-                result = f"{i:2d}. {domain:<25} → ❌ ERROR: {str(e)}\n"
-                results.append(result)
-                self.root.after(0, lambda r=result: self.robots_results.insert('end', r))
+        results = self.engine.robots.check_many(urls, '*', user_agent, workers=workers,
+                                                timeout=timeout, on_result=on_result)
         
         # Summary
-        allowed = sum(1 for r in results if "✅ ALLOWED" in r)
-        blocked = sum(1 for r in results if "❌ BLOCKED" in r)
-        errors = sum(1 for r in results if "❌ ERROR" in r)
-        
+        outcomes = [check.outcome for check in results if check is not None]
         summary = f"\n📊 SUMMARY:\n"
-        summary += f"✅ Allowed: {allowed}\n"
-        summary += f"❌ Blocked: {blocked}\n"
-        summary += f"⚠️  Errors: {errors}\n"
+        summary += f"✅ Allowed: {outcomes.count('allowed')}\n"
+        summary += f"❌ Blocked: {outcomes.count('blocked')}\n"
+        summary += f"⚠️  Errors: {outcomes.count('error')}\n"
         
-        self.root.after(0, lambda: self.robots_results.insert('end', summary))
-        self.root.after(0, lambda: self.update_status("Batch robots.txt check completed"))
+        self.ui.post(self.robots_results.insert, 'end', summary)
+        self.ui.update('status', self.update_status, "Batch robots.txt check completed")
 
 def main():
     """Fungsi utama untuk menjalankan aplikasi"""
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+scraper_engine - inti scraping EasyScraper tanpa GUI
+
+Dipakai oleh GUI (easyscraper.py), CLI (python -m scraper_engine), dan
+pipeline lain yang berjalan di server tanpa display.
+"""
+
+from .cache import HttpCache
+from .crawl import BloomFilter, Crawler, canonicalize_url
+from .dedup import DedupSink, Deduplicator, SimHashIndex
+from .engine import DEFAULT_USER_AGENT, ScraperEngine
+from .export import EXPORT_FORMATS, export_data, export_tables
+from .extractor import MODES, extract
+from .fetcher import DownloadRejected, HostScheduler, HttpClient, HttpError, normalize_url, robots_url_for
+from .incremental import FingerprintStore
+from .jobs import JobStore
+from .metrics import JsonDumper, Metrics, MetricsServer
+from .parsers import ParserBackend, available_backends, get_backend
+from .records import Record, RecordTable
+from .resolver import DnsCache, Prewarmer
+from .retry import FailureReport, RateController, RetryHandler, RetryPolicy, classify_error
+from .robots import RobotsCheck, RobotsDisallowed, RobotsEntry, RobotsPolicy
+from .sinks import JsonlSink, ListSink, ResultSink
+from .sitemap import SitemapEntry, SitemapParser, SitemapReader
+from .store import ResultStore
+from .tables import Table, TableExtractor
+from .streaming import LinkCollector, StreamExtractor, StreamParser, stream_extract
+
+__all__ = [
+    'BloomFilter',
+    'Crawler',
+    'DEFAULT_USER_AGENT',
+    'DedupSink',
+    'DnsCache',
+    'Deduplicator',
+    'DownloadRejected',
+    'EXPORT_FORMATS',
+    'FailureReport',
+    'FingerprintStore',
+    'HostScheduler',
+    'HttpCache',
+    'HttpClient',
+    'HttpError',
+    'JobStore',
+    'JsonDumper',
+    'JsonlSink',
+    'LinkCollector',
+    'ListSink',
+    'MODES',
+    'Metrics',
+    'MetricsServer',
+    'ParserBackend',
+    'Prewarmer',
+    'RateController',
+    'Record',
+    'RecordTable',
+    'ResultSink',
+    'RetryHandler',
+    'RetryPolicy',
+    'RobotsCheck',
+    'RobotsDisallowed',
+    'RobotsEntry',
+    'RobotsPolicy',
+    'ResultStore',
+    'ScraperEngine',
+    'SitemapEntry',
+    'SitemapParser',
+    'SitemapReader',
+    'SimHashIndex',
+    'StreamExtractor',
+    'StreamParser',
+    'Table',
+    'TableExtractor',
+    'available_backends',
+    'canonicalize_url',
+    'classify_error',
+    'export_data',
+    'export_tables',
+    'extract',
+    'get_backend',
+    'normalize_url',
+    'robots_url_for',
+    'stream_extract',
+]
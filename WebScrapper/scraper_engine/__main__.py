@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+import sys
+
+from .cli import main
+
+# Guard wajib: process pool (spawn di Windows/macOS) meng-import ulang modul ini
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+HttpCache - cache response HTTP di disk dengan revalidasi ETag/Last-Modified
+
+Response 200 yang punya validator (ETag atau Last-Modified) disimpan di
+SQLite. Request berikutnya ke URL yang sama mengirim If-None-Match /
+If-Modified-Since; jika server menjawab 304, body diambil dari cache tanpa
+download ulang. Entry dibuang jika lebih tua dari `max_age` atau jika total
+ukuran melewati `max_size` (yang paling lama tidak dipakai dibuang dulu).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    vary TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at);
+"""
+
+
+class _Headers(dict):
+    """Dict header dengan nama huruf kecil (pencarian tidak peka huruf besar)"""
+
+    def __getitem__(self, name):
+        return super().__getitem__(name.lower())
+
+    def __contains__(self, name):
+        return super().__contains__(name.lower())
+
+    def get(self, name, default=None):
+        return super().get(name.lower(), default)
+
+
+class CachedResponse:
+    """Response dari cache dengan API yang dipakai engine (mirip requests)"""
+
+    from_cache = True
+
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.headers = _Headers((name.lower(), value) for name, value in headers.items())
+        self.content = content
+
+    @property
+    def encoding(self):
+        content_type = self.headers.get('content-type', '')
+        for part in content_type.split(';')[1:]:
+            name, _, value = part.strip().partition('=')
+            if name.lower() == 'charset' and value:
+                return value.strip('"\'')
+        return None
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def raise_for_status(self):
+        pass
+
+
+class HttpCache:
+    """Cache response HTTP di SQLite (aman dipakai lintas thread)"""
+
+    def __init__(self, path, max_size=512 * 1024 * 1024, max_age=30 * 24 * 3600):
+        if os.path.isdir(path):
+            path = os.path.join(path, 'http_cache.sqlite')
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_size = max_size
+        self.max_age = max_age
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'bytes_saved': 0}
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._size = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        self.prune()
+
+    @staticmethod
+    def key_for(url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _vary_values(vary, headers):
+        """Nilai header request yang disebut di Vary (nama huruf kecil)"""
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        return {name: headers.get(name) for name in vary}
+
+    def lookup(self, url, headers=None):
+        """Entry yang cocok untuk request ini, atau None
+
+        Return dict (etag, last_modified, headers, body).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT vary, etag, last_modified, headers, body, stored_at FROM responses '
+                'WHERE key = ?', (self.key_for(url),)).fetchone()
+        if row is None:
+            return None
+        vary, etag, last_modified, stored_headers, body, stored_at = row
+        if self.max_age and time.time() - stored_at > self.max_age:
+            return None
+        if vary:
+            vary = json.loads(vary)
+            if self._vary_values(vary, headers) != vary:
+                return None
+        return {'etag': etag, 'last_modified': last_modified,
+                'headers': json.loads(stored_headers), 'body': body}
+
+    @staticmethod
+    def conditional_headers(entry, headers=None):
+        """Header request + If-None-Match / If-Modified-Since dari entry"""
+        headers = dict(headers or {})
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def hit(self, url, entry):
+        """Server menjawab 304: catat pemakaian dan return CachedResponse
+
+        Entry yang baru divalidasi dianggap segar lagi (umur dihitung ulang).
+        """
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                self._conn.execute('UPDATE responses SET used_at = ?, stored_at = ? WHERE key = ?',
+                                   (now, now, self.key_for(url)))
+            self.stats['hits'] += 1
+            self.stats['bytes_saved'] += len(entry['body'])
+        return CachedResponse(url, 200, entry['headers'], entry['body'])
+
+    def store(self, url, headers, response, body=None):
+        """Simpan response 200 jika punya validator dan boleh di-cache
+
+        `body` diisi jika response dibaca streaming (response.content kosong).
+        """
+        with self._lock:
+            self.stats['misses'] += 1
+        if response.status_code != 200:
+            return
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if not (etag or last_modified) or 'no-store' in cache_control:
+            return
+
+        vary = [name.strip().lower() for name in response.headers.get('Vary', '').split(',')
+                if name.strip()]
+        if '*' in vary:
+            return
+        if body is None:
+            body = response.content
+        if self.max_size and len(body) > self.max_size // 10:
+            return
+        now = time.time()
+        stored_headers = {name.lower(): value for name, value in response.headers.items()
+                          if name.lower() in ('content-type', 'etag', 'last-modified')}
+        with self._lock:
+            key = self.key_for(url)
+            old = self._conn.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            with self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (key, url, json.dumps(self._vary_values(vary, headers)) if vary else None,
+                     etag, last_modified, json.dumps(stored_headers), body, len(body), now, now))
+            self._size += len(body) - (old[0] if old else 0)
+            self.stats['stored'] += 1
+            if self.max_size and self._size > self.max_size:
+                self._evict(int(self.max_size * 0.9))
+
+    def _evict(self, target_size):
+        """Buang entry yang paling lama tidak dipakai sampai ukuran <= target"""
+        rows = self._conn.execute('SELECT key, size FROM responses ORDER BY used_at').fetchall()
+        remove = []
+        size = self._size
+        for key, entry_size in rows:
+            if size <= target_size:
+                break
+            remove.append((key,))
+            size -= entry_size
+        with self._conn:
+            self._conn.executemany('DELETE FROM responses WHERE key = ?', remove)
+        self._size = size
+
+    def prune(self):
+        """Hapus entry yang lebih tua dari max_age dan rapikan ukuran"""
+        with self._lock:
+            if self.max_age:
+                with self._conn:
+                    self._conn.execute('DELETE FROM responses WHERE stored_at < ?',
+                                       (time.time() - self.max_age,))
+                self._size = self._conn.execute(
+                    'SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+            if self.max_size and self._size > self.max_size:
+                self._evict(self.max_size)
+
+    def clear(self):
+        with self._lock:
+            with self._conn:
+                self._conn.execute('DELETE FROM responses')
+            self._size = 0
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    @property
+    def size(self):
+        return self._size
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
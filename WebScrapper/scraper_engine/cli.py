@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+CLI batch mode - jalankan daftar URL tanpa GUI
+
+Contoh:
+    python -m scraper_engine -i urls.txt -o hasil.jsonl --workers 16 --delay 1
+    python -m scraper_engine --sitemap https://contoh.com --since 2024-05-01 -o hasil.csv
+"""
+
+import argparse
+import sys
+
+from .cache import HttpCache
+from .dedup import DedupSink, Deduplicator
+from .engine import DEFAULT_USER_AGENT, ScraperEngine
+from .export import export_data, format_for
+from .incremental import FingerprintStore
+from .extractor import MODES
+from .jobs import JobStore
+from .metrics import JsonDumper, Metrics, MetricsServer
+from .parsers import BACKENDS
+from .resolver import DnsCache
+from .sinks import JsonlSink
+from .sitemap import SitemapReader
+from .store import ResultStore
+
+
+def read_urls(path):
+    """Baca URL dari file (satu per baris); '-' berarti stdin"""
+    handle = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        return [line.strip() for line in handle
+                if line.strip() and not line.lstrip().startswith('#')]
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def open_sink(path):
+    """Pilih sink dari ekstensi file output
+
+    .csv/.json/.parquet/.xlsx ditampung dulu di ResultStore sementara lalu
+    di-export setelah scraping selesai.
+    """
+    if path not in (None, '-') and path.lower().endswith(('.sqlite', '.db')):
+        return ResultStore(path, window=0)
+    if path not in (None, '-') and format_for(path) not in (None, 'jsonl'):
+        return ResultStore(window=0)
+    return JsonlSink(path)
+
+
+def read_sitemaps(sources, args):
+    """Ganti daftar situs/sitemap dengan URL halaman dari sitemap; None jika --since salah"""
+    engine = ScraperEngine(user_agent=args.user_agent, delay=args.delay, timeout=args.timeout)
+    try:
+        reader = SitemapReader(engine, since=args.since)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return None
+    try:
+        urls = reader.read(sources)
+    finally:
+        engine.close()
+    if not args.quiet:
+        stats = reader.stats
+        print(f"Sitemap: {len(urls)} URL dari {stats['sitemaps']} sitemap "
+              f"({stats['old']} halaman dan {stats['old_sitemaps']} sitemap lebih lama dari "
+              f"--since dilewati)", file=sys.stderr)
+    for sitemap, error in reader.errors:
+        print(f"Sitemap GAGAL {sitemap}: {error}", file=sys.stderr)
+    return urls
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='scraper_engine',
+        description='EasyScraper headless - scraping banyak URL dari command line')
+    parser.add_argument('urls', nargs='*', help='URL yang akan di-scrape')
+    parser.add_argument('-i', '--input', help="File berisi URL (satu per baris, '-' untuk stdin)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="File output: .jsonl (default stdout), .sqlite/.db, .csv, .json, "
+                             ".parquet atau .xlsx")
+    parser.add_argument('--job', metavar='PATH',
+                        help='File job .sqlite: progress dan hasil disimpan per URL; jalankan '
+                             'perintah yang sama lagi untuk melanjutkan (URL selesai dilewati)')
+    parser.add_argument('-m', '--mode', default='basic', choices=MODES,
+                        help='Jenis data yang diambil (default: basic = teks + link)')
+    parser.add_argument('--selector', help="CSS selector untuk mode 'custom'")
+    parser.add_argument('--delay', type=float, default=1.0,
+                        help='Delay antar request per domain dalam detik (default: 1)')
+    parser.add_argument('--workers', type=int, default=8,
+                        help='Maks. request bersamaan (default: 8)')
+    parser.add_argument('--per-host', type=int, default=1,
+                        help='Maks. request bersamaan per domain (default: 1)')
+    parser.add_argument('--crawl', action='store_true',
+                        help='Mode crawl: URL input menjadi seed, link yang ditemukan ikut diambil')
+    parser.add_argument('--max-depth', type=int, default=2,
+                        help='Kedalaman link dari seed untuk --crawl (default: 2)')
+    parser.add_argument('--max-pages', type=int, default=1000,
+                        help='Maks. halaman yang di-download untuk --crawl (default: 1000)')
+    parser.add_argument('--all-domains', action='store_true',
+                        help='--crawl boleh mengikuti link ke domain lain')
+    parser.add_argument('--sitemap', action='store_true',
+                        help='URL input adalah situs/sitemap (.xml, .xml.gz, .txt atau file lokal); '
+                             'halaman yang di-scrape diambil dari sitemap (situs: lewat robots.txt '
+                             'atau /sitemap.xml)')
+    parser.add_argument('--since', metavar='TANGGAL',
+                        help='Dengan --sitemap: hanya halaman dengan lastmod >= TANGGAL '
+                             '(mis. 2024-05-01 atau 2024-05-01T10:00:00+07:00)')
+    parser.add_argument('--timeout', type=float, default=30, help='Timeout request (detik)')
+    parser.add_argument('--retries', type=int, default=3,
+                        help='Maks. percobaan ulang untuk timeout, error koneksi, 429/503 dan 5xx '
+                             '(default: 3)')
+    parser.add_argument('--backoff', type=float, default=1.0,
+                        help='Detik dasar backoff eksponensial antar percobaan (default: 1)')
+    parser.add_argument('--failures', metavar='PATH',
+                        help='Simpan laporan URL yang gagal ke file CSV')
+    parser.add_argument('--max-mb', type=float, default=10,
+                        help='Batas ukuran halaman dalam MB; lebih besar dilewati (0 = tanpa batas, '
+                             'default: 10)')
+    parser.add_argument('--http2', action='store_true', help='Pakai HTTP/2 jika httpx[http2] tersedia')
+    parser.add_argument('--parser', default='auto', choices=('auto', 'stream') + tuple(BACKENDS),
+                        help='Backend parser HTML (default: auto = streaming satu pass, '
+                             'atau DOM tercepat yang terinstall untuk tables/custom)')
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help='Jumlah proses parser (0 = di thread fetch, -1 = semua core)')
+    parser.add_argument('--cache', metavar='PATH',
+                        help='Cache HTTP di disk (file .sqlite atau folder); halaman yang '
+                             'tidak berubah dilayani dari cache lewat revalidasi 304')
+    parser.add_argument('--cache-max-mb', type=int, default=512,
+                        help='Ukuran maksimum cache dalam MB (default: 512)')
+    parser.add_argument('--incremental', metavar='PATH',
+                        help='File state .sqlite untuk scrape ulang: halaman yang tidak berubah '
+                             'tidak di-parse dan hanya item baru/berubah/hilang yang ditulis '
+                             "(field 'change'); tidak berlaku untuk --crawl")
+    parser.add_argument('--dedup', action='store_true',
+                        help='Buang item duplikat: item sama persis, pembungkus dan boilerplate '
+                             '(footer/sidebar berulang)')
+    parser.add_argument('--dedup-pages', action='store_true',
+                        help='Dengan --dedup: buang juga halaman yang teksnya hampir sama '
+                             '(SimHash, mis. mirror atau versi cetak)')
+    parser.add_argument('--dns-ttl', type=float, default=300,
+                        help='Simpan hasil DNS di memory selama N detik (default: 300, 0 = mati)')
+    parser.add_argument('--prefetch', type=int, default=16,
+                        help='Resolve DNS N host berikutnya di antrian lebih awal (default: 16, 0 = mati)')
+    parser.add_argument('--prewarm', action='store_true',
+                        help='Buka juga koneksi TCP/TLS ke host berikutnya sebelum request pertamanya')
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help='Sajikan metrics selama batch berjalan di http://127.0.0.1:PORT/metrics '
+                             '(format Prometheus) dan /metrics.json')
+    parser.add_argument('--metrics-json', metavar='PATH',
+                        help='Tulis metrics (waktu per fase, per host, histogram) ke file JSON '
+                             'secara berkala dan saat selesai')
+    parser.add_argument('--metrics-interval', type=float, default=10,
+                        help='Interval tulis --metrics-json dalam detik (default: 10)')
+    parser.add_argument('--ignore-robots', action='store_true',
+                        help='Jangan cek robots.txt sebelum request (default: dipatuhi)')
+    parser.add_argument('--user-agent', default=DEFAULT_USER_AGENT)
+    parser.add_argument('-q', '--quiet', action='store_true', help='Jangan tampilkan progress')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    urls = list(args.urls)
+    if args.input:
+        urls.extend(read_urls(args.input))
+
+    if args.sitemap and urls:
+        urls = read_sitemaps(urls, args)
+        if urls is None:
+            return 2
+
+    job = None
+    if args.job:
+        job = JobStore(args.job, window=0)
+        job.add_urls(urls)
+        if not args.crawl:
+            urls = job.pending_urls()
+            progress = job.progress()
+            if progress['done'] and not args.quiet:
+                print(f"Melanjutkan job: {progress['done']} URL sudah selesai, "
+                      f"{len(urls)} tersisa", file=sys.stderr)
+    if not urls:
+        if job is not None:
+            job.close()
+            print("Tidak ada URL tersisa di job.", file=sys.stderr)
+            return 0
+        print("Tidak ada URL. Berikan URL sebagai argumen atau pakai --input.", file=sys.stderr)
+        return 2
+
+    cache = HttpCache(args.cache, max_size=args.cache_max_mb * 1024 * 1024) if args.cache else None
+    dns = DnsCache(ttl=args.dns_ttl).install() if args.dns_ttl > 0 else None
+    metrics = Metrics() if args.metrics_port is not None or args.metrics_json else None
+    fingerprints = FingerprintStore(args.incremental) if args.incremental else None
+    if fingerprints is not None and args.crawl and not args.quiet:
+        print("--incremental diabaikan untuk --crawl (semua halaman di-parse untuk mencari link)",
+              file=sys.stderr)
+    engine = ScraperEngine(user_agent=args.user_agent, delay=args.delay,
+                           max_workers=args.workers, per_host=args.per_host,
+                           http2=args.http2, timeout=args.timeout, parser=args.parser,
+                           parse_workers=args.parse_workers, cache=cache,
+                           respect_robots=not args.ignore_robots,
+                           max_retries=args.retries, backoff=args.backoff,
+                           max_bytes=int(args.max_mb * 1024 * 1024) or None,
+                           fingerprints=fingerprints, dns=dns, prefetch=args.prefetch,
+                           prewarm=args.prewarm, metrics=metrics)
+    server = dumper = None
+    if args.metrics_port is not None:
+        server = MetricsServer(metrics, args.metrics_port)
+        if not args.quiet:
+            print(f"Metrics: http://127.0.0.1:{server.port}/metrics", file=sys.stderr)
+    if args.metrics_json:
+        dumper = JsonDumper(metrics, args.metrics_json, args.metrics_interval)
+    dedup = Deduplicator(pages=args.dedup_pages) if args.dedup or args.dedup_pages else None
+
+    def on_progress(done, total, url, count, error, nbytes):
+        if args.quiet:
+            return
+        if error is not None:
+            print(f"[{done}/{total}] GAGAL {url}: {error}", file=sys.stderr)
+        else:
+            print(f"[{done}/{total}] {count} item dari {url}", file=sys.stderr)
+
+    try:
+        with (job if job is not None else open_sink(args.output)) as store:
+            sink = DedupSink(store, dedup) if dedup is not None else store
+            if args.crawl:
+                stats = engine.crawl(urls, sink, mode=args.mode, selector=args.selector,
+                                     max_depth=args.max_depth, max_pages=args.max_pages,
+                                     same_domain=not args.all_domains, on_progress=on_progress)
+            else:
+                stats = engine.scrape_many(urls, sink, mode=args.mode, selector=args.selector,
+                                           on_progress=on_progress)
+            if isinstance(store, ResultStore) and args.output != '-' and format_for(args.output):
+                count = export_data(store, args.output)
+                if not args.quiet:
+                    print(f"{count} item di-export ke {args.output}", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("Dihentikan.", file=sys.stderr)
+        return 130
+    finally:
+        engine.close()
+        if cache is not None:
+            cache.close()
+        if fingerprints is not None:
+            fingerprints.close()
+        if dns is not None:
+            dns.uninstall()
+        if dumper is not None:
+            dumper.close()
+        if server is not None:
+            server.close()
+
+    print(f"Selesai! Total {stats['items']} item dari {stats['urls']} website "
+          f"({stats['failed']} gagal, {stats['retries']} percobaan ulang)", file=sys.stderr)
+    if stats.get('unchanged'):
+        print(f"Incremental: {stats['unchanged']} halaman tidak berubah (tidak di-parse)",
+              file=sys.stderr)
+    if dedup is not None:
+        print(f"Dedup: {dedup.summary()}", file=sys.stderr)
+    bottleneck = metrics.bottleneck() if metrics is not None else None
+    if bottleneck is not None and not args.quiet:
+        group, seconds, percent = bottleneck
+        print(f"Waktu terbanyak: {group} ({seconds:.1f} detik, {percent:.0f}% dari waktu terukur)",
+              file=sys.stderr)
+    failures = stats['failures']
+    if failures:
+        print(f"Gagal per kategori: {failures.summary()}", file=sys.stderr)
+        if args.failures:
+            failures.write_csv(args.failures)
+            print(f"Laporan gagal disimpan ke {args.failures}", file=sys.stderr)
+    if dns is not None and not args.quiet:
+        message = f"DNS: {dns.stats['lookups']} lookup, {dns.stats['hits']} dari cache"
+        prewarm = engine.prewarm_stats
+        if prewarm and prewarm['connections']:
+            message += f", {prewarm['connections']} koneksi dibuka lebih awal"
+        print(message, file=sys.stderr)
+    if cache is not None and not args.quiet:
+        print(f"Cache: {cache.stats['hits']} tidak berubah (304), "
+              f"{cache.stats['bytes_saved'] / 1024:.0f} KB tidak di-download ulang", file=sys.stderr)
+    return 1 if stats['failed'] and stats['failed'] == stats['urls'] else 0
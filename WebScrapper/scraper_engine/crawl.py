@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Crawler - ikuti link dari halaman seed dengan batas kedalaman dan domain
+
+Frontier berupa heap (kedalaman, urutan): halaman dangkal selalu diambil
+lebih dulu. URL dinormalisasi sebelum dicek duplikat; daftar URL yang sudah
+dilihat disimpan di Bloom filter sehingga jutaan URL hanya butuh beberapa
+MB. Kesopanan per host tetap ditangani HostScheduler (delay, Crawl-delay,
+batas koneksi per host) dan robots.txt dicek engine sebelum setiap request.
+"""
+
+import hashlib
+import heapq
+import math
+import posixpath
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .fetcher import HostScheduler, normalize_url
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Link ke file non-HTML tidak ikut di-crawl
+SKIP_EXTENSIONS = frozenset((
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico', '.bmp',
+    '.pdf', '.zip', '.rar', '.7z', '.gz', '.tar', '.exe', '.dmg', '.apk',
+    '.mp3', '.mp4', '.avi', '.mov', '.webm', '.css', '.js', '.json', '.xml',
+    '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+))
+
+
+def canonicalize_url(url):
+    """Bentuk baku URL untuk dedup
+
+    Scheme/host huruf kecil, port default dibuang, segmen '.'/'..'
+    diselesaikan, fragment (#...) dibuang, dan parameter query diurutkan.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    if parts.username:
+        host = f"{parts.username}@{host}"
+
+    path = parts.path or '/'
+    if '.' in path:
+        trailing = path.endswith('/')
+        path = posixpath.normpath(path)
+        if trailing and path != '/':
+            path += '/'
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, path, query, ''))
+
+
+def is_crawlable(url):
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.netloc:
+        return False
+    return posixpath.splitext(parts.path)[1].lower() not in SKIP_EXTENSIONS
+
+
+class BloomFilter:
+    """Himpunan probabilistik: tidak ada false negative, false positive ~error_rate
+
+    Jika isinya melewati kapasitas, filter baru (kapasitas 2x, error lebih
+    kecil) ditambahkan sehingga error total tetap terjaga (scalable Bloom).
+    """
+
+    def __init__(self, capacity=100000, error_rate=1e-4):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filters = []
+        self._count = 0
+        self._add_filter()
+
+    def _add_filter(self):
+        index = len(self._filters)
+        capacity = self.capacity * (2 ** index)
+        error = self.error_rate * (0.5 ** (index + 1))
+        bits = max(8, int(-capacity * math.log(error) / (math.log(2) ** 2)))
+        hashes = max(1, round(bits / capacity * math.log(2)))
+        self._filters.append((bytearray((bits + 7) // 8), bits, hashes, capacity, [0]))
+
+    @staticmethod
+    def _positions(item, bits, hashes):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % bits for i in range(hashes)]
+
+    def __contains__(self, item):
+        for array, bits, hashes, _, _ in self._filters:
+            if all(array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item, bits, hashes)):
+                return True
+        return False
+
+    def add(self, item):
+        """Tambahkan item; return True jika item (kemungkinan besar) baru"""
+        if item in self:
+            return False
+        array, bits, hashes, capacity, count = self._filters[-1]
+        if count[0] >= capacity:
+            self._add_filter()
+            array, bits, hashes, capacity, count = self._filters[-1]
+        for pos in self._positions(item, bits, hashes):
+            array[pos >> 3] |= 1 << (pos & 7)
+        count[0] += 1
+        self._count += 1
+        return True
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def nbytes(self):
+        return sum(len(f[0]) for f in self._filters)
+
+
+class Crawler:
+    """Crawl dari URL seed memakai ScraperEngine (fetch, robots, extractor)
+
+    max_depth = jumlah lompatan link dari seed (0 = hanya seed),
+    max_pages = batas halaman yang di-download, same_domain = hanya ikuti
+    link ke host yang sama dengan salah satu seed.
+    """
+
+    def __init__(self, engine, max_depth=2, max_pages=1000, same_domain=True,
+                 seen=None, feed_size=None):
+        self.engine = engine
+        self.max_depth = max(0, int(max_depth))
+        self.max_pages = max(1, int(max_pages))
+        self.same_domain = same_domain
+        self.seen = seen if seen is not None else BloomFilter()
+        # URL yang diserahkan ke scheduler sekaligus; sisanya tetap di frontier
+        self.feed_size = feed_size or max(64, engine.max_workers * 8)
+        self._frontier = []     # heap (depth, seq, url)
+        self._seq = 0
+        self._depth = {}        # url di scheduler/berjalan -> depth
+        self._hosts = set()
+
+    def push(self, url, depth):
+        """Tambahkan URL ke frontier jika belum pernah dilihat dan lolos filter"""
+        url = canonicalize_url(url)
+        if depth > self.max_depth or not is_crawlable(url):
+            return False
+        if self.same_domain and HostScheduler.host_of(url) not in self._hosts:
+            return False
+        if not self.seen.add(url):
+            return False
+        self._seq += 1
+        heapq.heappush(self._frontier, (depth, self._seq, url))
+        return True
+
+    def run(self, seeds, sink, mode='basic', selector=None,
+            on_progress=None, should_continue=lambda: True):
+        """Jalankan crawl; return dict ringkasan seperti scrape_many"""
+        engine = self.engine
+        seeds = [canonicalize_url(normalize_url(url)) for url in seeds if url.strip()]
+        self._hosts.update(HostScheduler.host_of(url) for url in seeds)
+        for url in seeds:
+            self.push(url, 0)
+
+        engine.http.configure(pool_connections=min(max(20, len(self._hosts)), 500),
+                              pool_maxsize=max(4, engine.per_host), http2=engine.http2)
+        scheduler = engine.new_scheduler()
+        retry = engine.retry_handler(scheduler)
+        stats = {'urls': 0, 'done': 0, 'failed': 0, 'items': 0, 'bytes': 0,
+                 'retries': 0, 'failures': retry.report, 'queued': 0, 'seen': 0}
+
+        def feed():
+            while (self._frontier and len(self._depth) < self.feed_size
+                   and stats['urls'] < self.max_pages):
+                depth, _, url = heapq.heappop(self._frontier)
+                self._depth[url] = depth
+                stats['urls'] += 1
+                scheduler.add(url)
+
+        def task(url):
+            crawl_delay = engine.check_robots(url)
+            if crawl_delay:
+                retry.set_crawl_delay(url, crawl_delay)
+            links = []
+            with engine.track(url):
+                # Link untuk diikuti dikumpulkan dari parse yang sama dengan item
+                content, results = engine.fetch_extract(url, mode, selector, links)
+            return len(content), results, links
+
+        def on_result(url, result, error):
+            if error is not None and retry.retry(url, error, should_continue):
+                stats['retries'] = retry.retries
+                return
+            depth = self._depth.pop(url)
+            stats['done'] += 1
+            count = nbytes = 0
+            if error is not None:
+                stats['failed'] += 1
+                sink.add_result(url, None, error)
+            else:
+                retry.success(url)
+                nbytes, results, links = result
+                items = engine.make_items(url, results)
+                start = time.perf_counter()
+                sink.add_result(url, items)
+                engine.stored(url, time.perf_counter() - start, len(items))
+                count = len(items)
+                stats['items'] += count
+                stats['bytes'] += nbytes
+                if depth < self.max_depth:
+                    for link in links:
+                        self.push(link, depth + 1)
+            feed()
+            stats['queued'] = len(self._frontier)
+            stats['seen'] = len(self.seen)
+            if on_progress:
+                total = min(self.max_pages, stats['urls'] + len(self._frontier))
+                on_progress(stats['done'], total, url, count, error, nbytes)
+
+        feed()
+        scheduler.run(task, on_result, should_continue)
+        return stats
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Dedup - buang item duplikat sebelum masuk sink
+
+Tiga lapis, dari yang paling murah:
+
+- exact: item dengan type + content yang sama hanya dikirim sekali per
+  run (hash 64-bit), termasuk menu/footer yang berulang di setiap halaman
+- pembungkus: blok teks yang isinya diawali blok teks berikutnya adalah
+  div/span yang membungkus <p> (extractor DOM mengambil teks semua
+  turunannya), jadi dibuang dan isinya tetap ada di blok anak
+- hampir sama: SimHash 64-bit per blok teks panjang dan (opsional) per
+  halaman; sidik jari yang berbeda <= `distance` bit dianggap duplikat.
+  SimHashIndex membagi hash menjadi distance + 1 pita, jadi kandidat
+  cukup dicari lewat lookup dict (pigeonhole), bukan dibanding satu per
+  satu
+
+Untuk blok, angka dinormalisasi menjadi '0' sebelum di-hash, jadi
+footer/sidebar yang hanya berbeda tanggal, jam, atau jumlah komentar
+tetap dianggap sama (SimHash blok pendek terlalu kasar untuk perbedaan
+sekecil itu). Kalimat templat yang muncul lebih dari sekali di satu
+halaman (daftar produk/artikel) bukan boilerplate dan tidak pernah
+dibuang. Sidik jari halaman hanya dari blok teks dan tanpa normalisasi
+angka, supaya halaman paginasi (/page/1, /page/2) tetap berbeda.
+"""
+
+import hashlib
+import re
+from collections import Counter
+
+from .sinks import ResultSink
+
+_WORD = re.compile(r'\w+')
+
+
+def _hash64(text):
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8', 'surrogatepass'),
+                                          digest_size=8).digest(), 'little')
+
+
+# Setiap bit hash token disebar ke "lajur" 32-bit dalam satu int besar, jadi
+# penjumlahan 64 penghitung bit cukup satu operasi int per token
+_LANE = 32
+_LANE_MASK = (1 << _LANE) - 1
+_BYTE_LANES = [sum(1 << (bit * _LANE) for bit in range(8) if value >> bit & 1)
+               for value in range(256)]
+_LANES_CACHE_SIZE = 200000
+_lanes_cache = {}
+
+
+def _lanes(token):
+    lanes = _lanes_cache.get(token)
+    if lanes is None:
+        digest = hashlib.blake2b(token.encode('utf-8', 'surrogatepass'), digest_size=8).digest()
+        lanes = 0
+        for position, value in enumerate(digest):
+            lanes |= _BYTE_LANES[value] << (position * 8 * _LANE)
+        if len(_lanes_cache) >= _LANES_CACHE_SIZE:
+            _lanes_cache.clear()
+        _lanes_cache[token] = lanes
+    return lanes
+
+
+def simhash(tokens):
+    """SimHash 64-bit dari token (bobot = frekuensi token)
+
+    Bit ke-i bernilai 1 jika total bobot token yang bit ke-i hash-nya 1
+    lebih dari separuh total bobot.
+    """
+    total = 0
+    counters = 0
+    for token, weight in Counter(tokens).items():
+        counters += weight * _lanes(token)
+        total += weight
+    result = 0
+    for bit in range(64):
+        if (counters >> (bit * _LANE) & _LANE_MASK) * 2 > total:
+            result |= 1 << bit
+    return result
+
+
+def tokenize(text):
+    return _WORD.findall(text.lower())
+
+
+def normalized_tokens(text):
+    """Token dengan angka diganti '0' (tanggal/jam/penghitung tidak membedakan)"""
+    return ['0' if token.isdigit() else token for token in tokenize(text)]
+
+
+class SimHashIndex:
+    """Index SimHash untuk mencari sidik jari dengan jarak Hamming <= distance"""
+
+    def __init__(self, distance=3):
+        self.distance = distance
+        bands = distance + 1
+        width = 64 // bands
+        self._bands = [(i * width, 64 if i == bands - 1 else (i + 1) * width) for i in range(bands)]
+        self._tables = [{} for _ in self._bands]
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _keys(self, value):
+        for start, end in self._bands:
+            yield value >> start & ((1 << (end - start)) - 1)
+
+    def find(self, value, exclude=None):
+        """Label sidik jari yang masih dalam jarak (selain label `exclude`), atau None"""
+        for table, key in zip(self._tables, self._keys(value)):
+            for other, label in table.get(key, ()):
+                if label != exclude and bin(value ^ other).count('1') <= self.distance:
+                    return label
+        return None
+
+    def add(self, value, label=None):
+        for table, key in zip(self._tables, self._keys(value)):
+            table.setdefault(key, []).append((value, label))
+        self._count += 1
+
+
+class Deduplicator:
+    """Filter duplikat untuk item satu run scraping (dipanggil dari satu thread)
+
+    blocks=True membuang blok teks panjang (minimal `min_block_words`
+    kata) yang hampir sama dengan blok dari halaman lain (boilerplate).
+    Blok mirip di halaman yang sama (mis. daftar produk dengan kalimat
+    templat) tetap diambil. pages=True (opt-in) juga membuang seluruh
+    item halaman yang teksnya hampir sama dengan halaman sebelumnya
+    (mirror, versi cetak); halaman tanpa blok teks (mode links/images)
+    tidak dibandingkan. Item dengan change='removed' (mode incremental)
+    selalu diteruskan.
+    """
+
+    def __init__(self, pages=False, blocks=True, distance=3, min_block_words=12):
+        self.pages = pages
+        self.blocks = blocks
+        self.min_block_words = min_block_words
+        self.stats = {'items': 0, 'kept': 0, 'exact': 0, 'wrappers': 0,
+                      'near_blocks': 0, 'near_pages': 0}
+        self.duplicate_pages = []   # (url, url halaman yang mirip)
+        self._seen = set()
+        self._templates = {}    # hash blok yang dinormalisasi -> url pertama
+        self._listing = set()   # hash templat yang berulang di satu halaman (bukan boilerplate)
+        self._page_index = SimHashIndex(distance)
+        self._block_index = SimHashIndex(distance)
+
+    def summary(self):
+        stats = self.stats
+        return (f"{stats['items'] - stats['kept']} dari {stats['items']} item duplikat dibuang "
+                f"({stats['exact']} sama persis, {stats['wrappers']} pembungkus, "
+                f"{stats['near_blocks']} blok mirip, {stats['near_pages']} halaman mirip)")
+
+    def filter(self, url, items):
+        """Return item satu halaman yang bukan duplikat"""
+        self.stats['items'] += len(items)
+        if not items:
+            return items
+        if self.pages and url is not None:
+            tokens = [token for item in items
+                      if item.get('type') == 'text' and item.get('change') != 'removed'
+                      for token in tokenize(item.get('content') or '')]
+            if tokens:
+                fingerprint = simhash(self._shingles(tokens))
+                original = self._page_index.find(fingerprint)
+                if original is not None:
+                    self.stats['near_pages'] += 1
+                    self.duplicate_pages.append((url, original))
+                    return []
+                self._page_index.add(fingerprint, url)
+
+        wrappers = self._find_wrappers(items)
+        blocks = {}             # index item -> token blok yang cukup panjang
+        if self.blocks:
+            for index, item in enumerate(items):
+                if item.get('type') == 'text' and item.get('change') != 'removed':
+                    tokens = normalized_tokens(item.get('content') or '')
+                    if len(tokens) >= self.min_block_words:
+                        blocks[index] = tokens
+            templates = Counter(_hash64(' '.join(tokens)) for tokens in blocks.values())
+            self._listing.update(template for template, count in templates.items() if count > 1)
+        kept = []
+        for index, item in enumerate(items):
+            if item.get('change') == 'removed':
+                kept.append(item)
+                continue
+            if index in wrappers:
+                self.stats['wrappers'] += 1
+                continue
+            key = _hash64(f"{item.get('type')}\x00{item.get('content')}")
+            if key in self._seen:
+                self.stats['exact'] += 1
+                continue
+            self._seen.add(key)
+            if index in blocks and self._is_boilerplate(url, blocks[index]):
+                self.stats['near_blocks'] += 1
+                continue
+            kept.append(item)
+        self.stats['kept'] += len(kept)
+        return kept
+
+    def _is_boilerplate(self, url, tokens):
+        """True jika blok (hampir) sama dengan blok dari halaman lain"""
+        template = _hash64(' '.join(tokens))
+        if template in self._listing:
+            return False
+        first = self._templates.setdefault(template, url)
+        if first != url:
+            return True
+        fingerprint = simhash(tokens)
+        if self._block_index.find(fingerprint, exclude=url) is not None:
+            return True
+        self._block_index.add(fingerprint, url)
+        return False
+
+    @staticmethod
+    def _shingles(tokens, size=3):
+        """Himpunan potongan `size` token berurutan untuk sidik jari halaman
+
+        Tanpa bobot frekuensi, jadi kalimat templat yang berulang di daftar
+        tidak menenggelamkan angka/nama yang membedakan halaman.
+        """
+        if len(tokens) <= size:
+            return {' '.join(tokens)}
+        return {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+    @staticmethod
+    def _find_wrappers(items):
+        """Index blok teks yang isinya diawali blok teks berikutnya yang berbeda"""
+        texts = [(index, ' '.join((item.get('content') or '').split()))
+                 for index, item in enumerate(items) if item.get('type') == 'text']
+        wrappers = set()
+        for position, (index, text) in enumerate(texts):
+            following = position + 1
+            while following < len(texts) and texts[following][1] == text:
+                following += 1
+            if following < len(texts):
+                child = texts[following][1]
+                if len(child) < len(text) and text.startswith(child):
+                    wrappers.add(index)
+        return wrappers
+
+
+class DedupSink(ResultSink):
+    """Sink pembungkus: item difilter Deduplicator lalu diteruskan ke sink asli"""
+
+    def __init__(self, sink, dedup=None):
+        self.sink = sink
+        self.dedup = dedup or Deduplicator()
+
+    def add_many(self, items):
+        self.sink.add_many(self.dedup.filter(None, items))
+
+    def add_result(self, url, items, error=None):
+        if error is None:
+            items = self.dedup.filter(url, items)
+        self.sink.add_result(url, items, error)
+
+    def close(self):
+        self.sink.close()
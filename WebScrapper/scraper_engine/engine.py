@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+ScraperEngine - scraping headless (tanpa Tkinter) untuk GUI, CLI, dan pipeline
+"""
+
+import time
+from contextlib import nullcontext
+from datetime import datetime
+
+from .crawl import Crawler
+from .extractor import extract, uses_stream
+from .fetcher import HTML_TYPES, HostScheduler, HttpClient, normalize_url
+from .incremental import FingerprintStore, body_digest
+from .metrics import record
+from .pipeline import ParsePool, expand, resolve_workers
+from .resolver import Prewarmer
+from .retry import RetryHandler, RetryPolicy
+from .robots import RobotsDisallowed, RobotsPolicy
+from .streaming import LinkCollector, StreamParser, make_extractor
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+class ScraperEngine:
+    """Gabungan fetcher + extractor; hasil dikirim ke ResultSink"""
+
+    def __init__(self, user_agent=DEFAULT_USER_AGENT, delay=1.0, max_workers=8,
+                 per_host=1, http2=False, timeout=30, parser='auto', parse_workers=0,
+                 cache=None, respect_robots=True, max_retries=3, backoff=1.0,
+                 max_bytes=10 * 1024 * 1024, content_types=HTML_TYPES, fingerprints=None,
+                 dns=None, prefetch=16, prewarm=False, metrics=None, http=None, robots=None):
+        self.user_agent = user_agent
+        self.delay = delay
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.http2 = http2
+        self.timeout = timeout
+        self.parser = parser
+        self.parse_workers = parse_workers
+        self.cache = cache  # HttpCache atau None
+        self.respect_robots = respect_robots
+        self.max_retries = max_retries
+        self.backoff = backoff  # detik dasar backoff eksponensial
+        self.max_bytes = max_bytes          # batas ukuran body per halaman (None = tanpa batas)
+        self.content_types = content_types  # Content-Type yang boleh di-download
+        self.fingerprints = fingerprints    # FingerprintStore untuk mode incremental, atau None
+        self.dns = dns                      # DnsCache (sudah di-install) atau None
+        self.prefetch = prefetch            # jumlah host berikutnya yang disiapkan lebih awal
+        self.prewarm = prewarm              # juga buka koneksi TCP/TLS ke host tersebut
+        self.metrics = metrics              # Metrics untuk waktu per fase, atau None
+        self.http = http or HttpClient()
+        self.robots = robots or RobotsPolicy(self.http)
+        self._prewarmer = None
+
+    def configure(self, **options):
+        """Ubah pengaturan engine (user_agent, delay, max_workers, dst.)"""
+        for name, value in options.items():
+            if not hasattr(self, name) or name in ('http', 'robots') or name.startswith('_'):
+                raise AttributeError(f"Pengaturan tidak dikenal: {name}")
+            setattr(self, name, value)
+
+    def _headers(self):
+        return {'User-Agent': self.user_agent}
+
+    def check_robots(self, url):
+        """Raise RobotsDisallowed jika robots.txt melarang URL
+
+        Return Crawl-delay host tersebut (detik) atau None. Tanpa biaya
+        jaringan setelah robots.txt host itu ada di cache.
+        """
+        if not self.respect_robots:
+            return None
+        entry = self.robots.entry(url, self.user_agent)
+        if not entry.can_fetch(url, self.user_agent):
+            raise RobotsDisallowed(url)
+        return entry.crawl_delay(self.user_agent)
+
+    def fetch(self, url, on_chunk=None):
+        """Download satu halaman (streaming, dibatasi max_bytes) dan return bytes body
+
+        Status >= 400 menjadi HttpError (dengan Retry-After jika ada);
+        body non-HTML atau terlalu besar menjadi DownloadRejected.
+        """
+        return self.http.download(url, headers=self._headers(), timeout=self.timeout,
+                                  cache=self.cache, max_bytes=self.max_bytes,
+                                  content_types=self.content_types, on_chunk=on_chunk)
+
+    def fetch_extract(self, url, mode='basic', selector=None, links=None):
+        """Download lalu extract; return (bytes body, list hasil extractor)
+
+        Untuk mode streaming (parser auto/stream), chunk langsung di-parse
+        selama download berjalan sehingga item pertama tidak menunggu
+        seluruh body. Jika `links` berupa list, URL semua <a href> ikut
+        dikumpulkan ke dalamnya dari parse yang sama (untuk crawl).
+        """
+        if uses_stream(mode, self.parser):
+            target = make_extractor(url, mode)
+            if links is not None:
+                target = LinkCollector(target, url)
+            parser = StreamParser(target)
+
+            def feed(chunk):
+                start = time.perf_counter()
+                parser.feed(chunk)
+                record('parse', time.perf_counter() - start)
+
+            content = self.fetch(url, on_chunk=feed)
+            start = time.perf_counter()
+            results = parser.close()
+            record('parse', time.perf_counter() - start)
+            if links is not None:
+                links.extend(target.links)
+            return content, results
+        content = self.fetch(url)
+        return content, extract(url, content, mode, selector, self.parser, links)
+
+    def track(self, url):
+        """Context manager pengukur waktu fase satu request (tanpa efek jika metrics None)"""
+        return self.metrics.track(url) if self.metrics is not None else nullcontext()
+
+    def stored(self, url, seconds, count):
+        """Catat waktu tulis hasil satu URL ke sink"""
+        if self.metrics is not None:
+            self.metrics.stored(url, seconds, count)
+
+    def new_scheduler(self):
+        """HostScheduler untuk satu run
+
+        Dengan dns atau prewarm, `prefetch` host berikutnya di antrian
+        di-resolve (dan dihubungkan) di latar belakang selama fetch lain
+        berjalan.
+        """
+        on_upcoming = None
+        if self.prefetch and (self.dns is not None or self.prewarm):
+            if self._prewarmer is None:
+                self._prewarmer = Prewarmer(self.http)
+            self._prewarmer.dns = self.dns
+            self._prewarmer.connect = self.prewarm
+            self._prewarmer.timeout = self.timeout
+            on_upcoming = self._prewarmer.warm
+        return HostScheduler(max_workers=self.max_workers, per_host=self.per_host,
+                             delay=self.delay, on_upcoming=on_upcoming, lookahead=self.prefetch)
+
+    @property
+    def prewarm_stats(self):
+        """Statistik Prewarmer (hosts, connections, failures) atau None"""
+        return self._prewarmer.stats if self._prewarmer is not None else None
+
+    def retry_handler(self, scheduler):
+        """RetryHandler (backoff + AIMD per host) untuk satu run scheduler"""
+        return RetryHandler(scheduler, RetryPolicy(self.max_retries, self.backoff))
+
+    @staticmethod
+    def make_items(url, results):
+        """Tambahkan url dan timestamp ke setiap hasil extractor"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return [{'url': url, 'timestamp': timestamp, **result} for result in results]
+
+    def scrape_url(self, url, mode='text', selector=None):
+        """Scraping satu URL, return list item
+
+        Dengan fingerprints hanya item yang berubah sejak run sebelumnya
+        yang dikembalikan (lihat incremental.FingerprintStore). Body perlu
+        utuh dulu untuk di-hash, jadi parsing tidak berjalan selama
+        download seperti di fetch_extract.
+        """
+        url = normalize_url(url)
+        self.check_robots(url)
+        with self.track(url):
+            if self.fingerprints is None:
+                _, results = self.fetch_extract(url, mode, selector)
+                return self.make_items(url, results)
+            content = self.fetch(url)
+            digest = body_digest(content, mode)
+            profile = FingerprintStore.profile(mode, selector)
+            if self.fingerprints.is_unchanged(url, profile, digest):
+                return []
+            results = extract(url, content, mode, selector, self.parser)
+            changes, snapshot = self.fingerprints.diff(url, profile, results)
+            self.fingerprints.save(url, profile, digest, snapshot)
+            return self.make_items(url, changes)
+
+    def scrape_many(self, urls, sink, mode='basic', selector=None,
+                    on_progress=None, should_continue=lambda: True):
+        """Scraping banyak URL secara concurrent, sopan per domain
+
+        on_progress(done, total, url, count, error, nbytes) dipanggil setiap
+        satu URL selesai (nbytes = ukuran body yang didownload). Return dict
+        ringkasan (urls, done, failed, items, bytes, retries, failures,
+        unchanged); failures adalah FailureReport.
+
+        Error sementara (timeout, koneksi, 429/503, 5xx) dicoba ulang sampai
+        max_retries kali dengan backoff; URL tidak dihitung selesai sebelum
+        percobaan terakhir.
+
+        Jika parse_workers > 0 (atau -1 = semua core), parsing dijalankan di
+        process pool: thread fetch hanya download lalu menyerahkan bytes.
+
+        Dengan fingerprints (mode incremental), halaman yang body-nya tidak
+        berubah tidak di-parse dan hanya item baru/berubah/hilang yang masuk
+        sink; `unchanged` menghitung halaman yang dilewati.
+        """
+        urls = [normalize_url(url) for url in urls if url.strip()]
+
+        # Pool disesuaikan dengan jumlah domain supaya koneksi keep-alive
+        # tiap host tidak terbuang saat scheduler bergantian antar host
+        hosts = len(set(HostScheduler.host_of(url) for url in urls))
+        self.http.configure(pool_connections=min(max(20, hosts), 500),
+                            pool_maxsize=max(4, self.per_host), http2=self.http2)
+
+        scheduler = self.new_scheduler()
+        for url in urls:
+            scheduler.add(url)
+        retry = self.retry_handler(scheduler)
+
+        stats = {'urls': len(urls), 'done': 0, 'failed': 0, 'items': 0, 'bytes': 0,
+                 'retries': 0, 'failures': retry.report, 'unchanged': 0}
+        parse_pool = ParsePool(self.parse_workers) if resolve_workers(self.parse_workers) else None
+        parsing = []  # (url, nbytes, Future, hash body) yang masih di process pool
+        fingerprints = self.fingerprints
+        profile = FingerprintStore.profile(mode, selector)
+
+        def task(url):
+            """Return (nbytes, hasil atau Future, hash body atau None)"""
+            crawl_delay = self.check_robots(url)
+            if crawl_delay:
+                retry.set_crawl_delay(url, crawl_delay)
+            with self.track(url):
+                if fingerprints is None and parse_pool is None:
+                    content, results = self.fetch_extract(url, mode, selector)
+                    return len(content), results, None
+                content = self.fetch(url)
+                digest = None
+                if fingerprints is not None:
+                    digest = body_digest(content, mode)
+                    if fingerprints.is_unchanged(url, profile, digest):
+                        return len(content), None, digest
+                if parse_pool is None:
+                    return len(content), extract(url, content, mode, selector, self.parser), digest
+            # Slot host dilepas setelah download; parsing lanjut di proses lain
+            return len(content), parse_pool.submit(url, content, mode, selector, self.parser), digest
+
+        def on_result(url, result, error):
+            if error is not None and retry.retry(url, error, should_continue):
+                stats['retries'] = retry.retries
+                return
+            if error is None:
+                retry.success(url)
+            nbytes, result, digest = result if error is None else (0, None, None)
+            if parse_pool is not None and error is None and result is not None:
+                parsing.append((url, nbytes, result, digest))
+            else:
+                finish(url, nbytes, result, error, digest)
+            collect_parsed(wait=False)
+
+        def collect_parsed(wait):
+            for entry in list(parsing):
+                url, nbytes, future, digest = entry
+                if not wait and not future.done():
+                    continue
+                parsing.remove(entry)
+                error = future.exception()
+                results = None
+                if error is not None:
+                    retry.report.add(url, error, 1)
+                else:
+                    rows, phases = future.result()
+                    if self.metrics is not None:
+                        self.metrics.add(url, phases, request=False)
+                    results = expand(rows)
+                finish(url, nbytes, results, error, digest)
+
+        def finish(url, nbytes, results, error, digest=None):
+            stats['done'] += 1
+            stats['bytes'] += nbytes
+            count = 0
+            if error is not None:
+                stats['failed'] += 1
+                sink.add_result(url, None, error)
+            elif results is None:
+                # Body tidak berubah: URL tetap tercatat selesai, tanpa item
+                stats['unchanged'] += 1
+                sink.add_result(url, [])
+            else:
+                snapshot = None
+                if digest is not None:
+                    results, snapshot = fingerprints.diff(url, profile, results)
+                items = self.make_items(url, results)
+                start = time.perf_counter()
+                sink.add_result(url, items)
+                self.stored(url, time.perf_counter() - start, len(items))
+                if snapshot is not None:
+                    # Disimpan setelah sink supaya delta tidak hilang jika sink gagal
+                    fingerprints.save(url, profile, digest, snapshot)
+                count = len(items)
+                stats['items'] += count
+            if on_progress:
+                on_progress(stats['done'], stats['urls'], url, count, error, nbytes)
+
+        try:
+            scheduler.run(task, on_result, should_continue)
+            if should_continue():
+                collect_parsed(wait=True)
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown(cancel=not should_continue())
+        return stats
+
+    def crawl(self, seeds, sink, mode='basic', selector=None, max_depth=2, max_pages=1000,
+              same_domain=True, on_progress=None, should_continue=lambda: True):
+        """Crawl dari URL seed dengan mengikuti link (lihat crawl.Crawler)
+
+        Callback dan return sama dengan scrape_many; total di on_progress
+        ikut bertambah selama link baru ditemukan. Crawl selalu mengambil
+        semua item (fingerprints tidak dipakai) karena link setiap halaman
+        tetap perlu di-parse untuk diikuti.
+        """
+        crawler = Crawler(self, max_depth=max_depth, max_pages=max_pages, same_domain=same_domain)
+        return crawler.run(seeds, sink, mode, selector, on_progress, should_continue)
+
+    def close(self):
+        if self._prewarmer is not None:
+            self._prewarmer.close()
+        self.http.close()
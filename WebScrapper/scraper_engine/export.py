@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+"""
+Export streaming - CSV, JSON Lines, JSON, Parquet, dan Excel
+
+Semua exporter membaca data per batch (ResultStore.iter_batches) lalu
+langsung menulisnya ke file, jadi waktu naik linear dan memory tetap
+sebesar satu batch berapa pun jumlah item:
+
+- csv: csv.writer per batch (utf-8 dengan BOM supaya terbaca Excel)
+- jsonl: satu objek JSON per baris
+- json: array JSON ditulis per item
+- parquet: satu row group per batch, url/type dictionary-encoded (pyarrow)
+- xlsx: xlsxwriter mode constant_memory jika ada, atau openpyxl write-only;
+  lebih dari 1.048.576 baris dilanjutkan ke sheet berikutnya
+
+Sumber boleh ResultStore/JobStore, RecordTable, atau list dict.
+
+export_tables menulis item tabel (mode tables) dengan kolom dan tipe
+aslinya: satu sheet per tabel (.xlsx), satu baris JSON per tabel (.jsonl),
+atau satu file per tabel di dalam folder (.csv / .parquet).
+"""
+
+import csv
+import importlib.util
+import json
+import os
+
+from .records import BASE_FIELDS, TIMESTAMP_FORMAT
+from .tables import Table
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'json', 'parquet', 'xlsx')
+
+EXTENSIONS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.json': 'json',
+    '.parquet': 'parquet',
+    '.xlsx': 'xlsx',
+}
+
+EXCEL_MAX_ROWS = 1048576
+EXCEL_MAX_CELL = 32767
+
+
+def format_for(path):
+    """Format export dari ekstensi file, atau None jika tidak dikenal"""
+    return EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+
+def iter_batches(source, batch_size=10000):
+    """Return (fields, generator list tuple per batch) dari sumber data"""
+    if hasattr(source, 'iter_batches'):
+        fields = source.fields
+        return fields, source.iter_batches(batch_size, fields)
+
+    fields = getattr(source, 'fields', None)
+    if fields is None:
+        fields = list(BASE_FIELDS)
+        for item in source:
+            fields.extend(key for key in item if key not in fields)
+
+    def batches():
+        batch = []
+        for item in source:
+            batch.append(tuple(item.get(name) for name in fields))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    return fields, batches()
+
+
+def _as_dict(fields, row):
+    """Dict satu baris; field tambahan yang kosong tidak ditulis"""
+    base = len(BASE_FIELDS)
+    item = dict(zip(fields[:base], row[:base]))
+    for name, value in zip(fields[base:], row[base:]):
+        if value is not None:
+            item[name] = value
+    return item
+
+
+def export_csv(source, path, batch_size=10000, on_progress=None):
+    fields, batches = iter_batches(source, batch_size)
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8-sig') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(fields)
+        for batch in batches:
+            writer.writerows(batch)
+            count += len(batch)
+            if on_progress:
+                on_progress(count)
+    return count
+
+
+def export_jsonl(source, path, batch_size=10000, on_progress=None):
+    fields, batches = iter_batches(source, batch_size)
+    count = 0
+    with open(path, 'w', encoding='utf-8') as handle:
+        for batch in batches:
+            handle.write(''.join(json.dumps(_as_dict(fields, row), ensure_ascii=False) + '\n'
+                                 for row in batch))
+            count += len(batch)
+            if on_progress:
+                on_progress(count)
+    return count
+
+
+def export_json(source, path, batch_size=10000, on_progress=None):
+    """Array JSON, ditulis per item tanpa memuat semua data"""
+    fields, batches = iter_batches(source, batch_size)
+    count = 0
+    with open(path, 'w', encoding='utf-8') as handle:
+        handle.write('[')
+        for batch in batches:
+            for row in batch:
+                handle.write(',\n  ' if count else '\n  ')
+                handle.write(json.dumps(_as_dict(fields, row), ensure_ascii=False))
+                count += 1
+            if on_progress:
+                on_progress(count)
+        handle.write('\n]\n')
+    return count
+
+
+def export_parquet(source, path, batch_size=100000, on_progress=None):
+    """Parquet; butuh pyarrow. Field tambahan ditulis sebagai string"""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow belum terinstall. Install dengan: pip install pyarrow")
+
+    fields, batches = iter_batches(source, batch_size)
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    schema = pa.schema([('url', dictionary), ('timestamp', pa.timestamp('s')),
+                        ('type', dictionary), ('content', pa.string())]
+                       + [(name, pa.string()) for name in fields[len(BASE_FIELDS):]])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in batches:
+            columns = list(zip(*batch))
+            arrays = [
+                pa.array(columns[0], pa.string()).dictionary_encode(),
+                pc.strptime(pa.array(columns[1], pa.string()), format=TIMESTAMP_FORMAT, unit='s'),
+                pa.array(columns[2], pa.string()).dictionary_encode(),
+                pa.array(columns[3], pa.string()),
+            ]
+            arrays.extend(pa.array([None if value is None else str(value) for value in column],
+                                   pa.string()) for column in columns[len(BASE_FIELDS):])
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            count += len(batch)
+            if on_progress:
+                on_progress(count)
+    return count
+
+
+def _excel_value(value):
+    if isinstance(value, str) and len(value) > EXCEL_MAX_CELL:
+        return value[:EXCEL_MAX_CELL]
+    return value
+
+
+def export_excel(source, path, batch_size=10000, on_progress=None):
+    """Excel .xlsx dengan memory konstan (xlsxwriter atau openpyxl write-only)"""
+    fields, batches = iter_batches(source, batch_size)
+    writer = _open_workbook(path)
+    count = 0
+    try:
+        writer.add_sheet('Data', fields)
+        for batch in batches:
+            for row in batch:
+                writer.append([_excel_value(value) for value in row])
+            count += len(batch)
+            if on_progress:
+                on_progress(count)
+    finally:
+        writer.close()
+    return count
+
+
+def _open_workbook(path):
+    if importlib.util.find_spec('xlsxwriter') is not None:
+        return _XlsxWriterBook(path)
+    return _OpenpyxlBook(path)
+
+
+class _Workbook:
+    """Sheet ditulis berurutan; lewat batas baris Excel lanjut ke sheet '<judul> (2)'"""
+
+    def add_sheet(self, title, header):
+        self._title = title
+        self._header = header
+        self._part = 1
+        self._new_sheet(title)
+
+    def _new_sheet(self, name):
+        raise NotImplementedError
+
+    def _next_part(self):
+        self._part += 1
+        self._new_sheet(f"{self._title} ({self._part})")
+
+
+class _XlsxWriterBook(_Workbook):
+    """xlsxwriter constant_memory: baris langsung di-flush ke file sementara"""
+
+    def __init__(self, path):
+        import xlsxwriter
+
+        self._book = xlsxwriter.Workbook(path, {
+            'constant_memory': True,
+            'strings_to_numbers': False,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
+
+    def _new_sheet(self, name):
+        self._sheet = self._book.add_worksheet(name)
+        self._sheet.write_row(0, 0, self._header)
+        self._row = 1
+
+    def append(self, values):
+        if self._row >= EXCEL_MAX_ROWS:
+            self._next_part()
+        self._sheet.write_row(self._row, 0, values)
+        self._row += 1
+
+    def close(self):
+        self._book.close()
+
+
+class _OpenpyxlBook(_Workbook):
+    """openpyxl write-only: baris ditulis berurutan tanpa menyimpan cell di memory"""
+
+    def __init__(self, path):
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+        self._path = path
+        self._book = Workbook(write_only=True)
+        self._cell = WriteOnlyCell
+        self._illegal = ILLEGAL_CHARACTERS_RE
+
+    def _new_sheet(self, name):
+        self._sheet = self._book.create_sheet(name)
+        self._sheet.append([self._value(value) for value in self._header])
+        self._row = 1
+
+    def _value(self, value):
+        if not isinstance(value, str):
+            return value
+        value = self._illegal.sub('', value)
+        if value.startswith('='):
+            # Teks hasil scraping jangan sampai dianggap formula
+            cell = self._cell(self._sheet, value)
+            cell.data_type = 's'
+            return cell
+        return value
+
+    def append(self, values):
+        if self._row >= EXCEL_MAX_ROWS:
+            self._next_part()
+        self._sheet.append([self._value(value) for value in values])
+        self._row += 1
+
+    def close(self):
+        self._book.save(self._path)
+
+
+def iter_tables(source):
+    """(url, table_id, Table) untuk setiap item tabel di sumber data"""
+    items = source.iter_items() if hasattr(source, 'iter_items') else source
+    for item in items:
+        if item['type'] == 'table':
+            yield item['url'], item.get('table_id'), Table.from_item(item)
+
+
+TABLE_INDEX_FIELDS = ('no', 'url', 'table_id', 'caption', 'rows', 'columns')
+
+
+def export_tables(source, path, format_type=None, on_progress=None):
+    """Export item tabel dengan kolom dan tipe aslinya; return jumlah tabel
+
+    .xlsx: sheet 'Daftar Tabel' + satu sheet per tabel, .jsonl: satu baris
+    per tabel, csv/parquet: `path` adalah folder berisi tabel_<no>.<ext>.
+    """
+    format_type = format_type or format_for(path) or 'csv'
+    if format_type == 'excel':
+        format_type = 'xlsx'
+    if format_type not in ('xlsx', 'jsonl', 'csv', 'parquet'):
+        raise ValueError(f"Format export tabel tidak dikenal: {format_type}")
+    if format_type == 'parquet':
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow belum terinstall. Install dengan: pip install pyarrow")
+        arrow_types = {'int': pa.int64(), 'float': pa.float64(), 'str': pa.string()}
+    if format_type in ('csv', 'parquet'):
+        os.makedirs(path, exist_ok=True)
+
+    index = []
+    book = handle = None
+    if format_type == 'xlsx':
+        book = _open_workbook(path)
+    elif format_type == 'jsonl':
+        handle = open(path, 'w', encoding='utf-8')
+    try:
+        for number, (url, table_id, table) in enumerate(iter_tables(source), 1):
+            index.append((number, url, table_id, table.caption, len(table), len(table.columns)))
+            if format_type == 'xlsx':
+                book.add_sheet(f"Tabel {number}", table.columns)
+                for row in table.rows():
+                    book.append([_excel_value(value) for value in row])
+            elif format_type == 'jsonl':
+                handle.write(json.dumps({'url': url, 'caption': table.caption,
+                                         'columns': table.columns, 'dtypes': table.dtypes,
+                                         'data': table.data}, ensure_ascii=False) + '\n')
+            elif format_type == 'csv':
+                with open(os.path.join(path, f"tabel_{number}.csv"), 'w', newline='',
+                          encoding='utf-8-sig') as out:
+                    out.write(table.to_csv())
+            else:
+                schema = pa.schema([(name, arrow_types[dtype])
+                                    for name, dtype in zip(table.columns, table.dtypes)])
+                pq.write_table(pa.Table.from_arrays(
+                    [pa.array(values, field.type) for values, field in zip(table.data, schema)],
+                    schema=schema), os.path.join(path, f"tabel_{number}.parquet"))
+            if on_progress:
+                on_progress(number)
+        if format_type == 'xlsx':
+            book.add_sheet('Daftar Tabel', list(TABLE_INDEX_FIELDS))
+            for row in index:
+                book.append(list(row))
+    finally:
+        if book is not None:
+            book.close()
+        if handle is not None:
+            handle.close()
+    return len(index)
+
+
+EXPORTERS = {
+    'csv': export_csv,
+    'jsonl': export_jsonl,
+    'json': export_json,
+    'parquet': export_parquet,
+    'xlsx': export_excel,
+}
+
+
+def export_data(source, path, format_type=None, batch_size=None, on_progress=None):
+    """Export sumber data ke `path`; format dari ekstensi jika tidak diberikan
+
+    on_progress(jumlah_baris) dipanggil setiap satu batch selesai ditulis.
+    Return jumlah baris yang ditulis.
+    """
+    format_type = format_type or format_for(path)
+    if format_type == 'excel':
+        format_type = 'xlsx'
+    if format_type not in EXPORTERS:
+        raise ValueError(f"Format export tidak dikenal: {format_type}")
+    exporter = EXPORTERS[format_type]
+    if batch_size is None:
+        return exporter(source, path, on_progress=on_progress)
+    return exporter(source, path, batch_size=batch_size, on_progress=on_progress)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Extractor - mengambil teks, link, gambar, tabel, atau CSS selector dari HTML
+"""
+
+import time
+from urllib.parse import urljoin
+
+from .metrics import record
+from .parsers import ParserBackend, get_backend
+from .streaming import STREAM_MODES, stream_extract
+
+
+def extract_text(url, doc, parser):
+    """Ambil semua teks"""
+    results = []
+    for element in parser.find_all(doc, ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'span', 'div']):
+        text = parser.text(element)
+        if text and len(text) > 10:  # Filter teks pendek
+            results.append({
+                'type': 'text',
+                'content': text,
+                'tag': parser.tag(element)
+            })
+    return results
+
+
+def extract_links(url, doc, parser):
+    """Ambil semua link"""
+    results = []
+    for link in parser.find_all(doc, 'a', attr='href'):
+        href = urljoin(url, parser.get(link, 'href'))
+        text = parser.text(link)
+        results.append({
+            'type': 'link',
+            'content': href,
+            'text': text
+        })
+    return results
+
+
+def extract_images(url, doc, parser):
+    """Ambil semua gambar"""
+    results = []
+    for img in parser.find_all(doc, 'img', attr='src'):
+        src = urljoin(url, parser.get(img, 'src'))
+        alt = parser.get(img, 'alt', '')
+        results.append({
+            'type': 'image',
+            'content': src,
+            'alt': alt
+        })
+    return results
+
+
+def extract_custom(url, doc, parser, selector):
+    """Custom CSS selector"""
+    results = []
+    if selector:
+        for element in parser.select(doc, selector):
+            content = parser.text(element) if parser.string(element) else parser.outer_html(element)
+            results.append({
+                'type': 'custom',
+                'content': content,
+                'selector': selector
+            })
+    return results
+
+
+def extract_basic(url, doc, parser):
+    """Simple scraping untuk multiple URLs - ambil teks dan link"""
+    results = []
+
+    # Teks
+    for element in parser.find_all(doc, ['p', 'h1', 'h2', 'h3']):
+        text = parser.text(element)
+        if text and len(text) > 20:
+            results.append({
+                'type': 'text',
+                'content': text[:200] + '...' if len(text) > 200 else text
+            })
+
+    # Links
+    for link in parser.find_all(doc, 'a', attr='href'):
+        href = urljoin(url, parser.get(link, 'href'))
+        text = parser.text(link)
+        if text:
+            results.append({
+                'type': 'link',
+                'content': href,
+                'text': text
+            })
+
+    return results
+
+
+EXTRACTORS = {
+    'text': extract_text,
+    'links': extract_links,
+    'images': extract_images,
+    'basic': extract_basic,
+}
+
+MODES = ('text', 'links', 'images', 'tables', 'basic', 'custom')
+
+
+def uses_stream(mode, parser='auto'):
+    """True jika mode ini di-extract oleh streaming extractor
+
+    Tabel selalu streaming (tidak butuh DOM), mode lain hanya jika parser
+    'auto' atau 'stream'.
+    """
+    return mode == 'tables' or (mode in STREAM_MODES and parser in ('auto', 'stream'))
+
+
+def extract(url, content, mode='text', selector=None, parser='auto', links=None):
+    """Parse HTML lalu jalankan extractor sesuai mode
+
+    `parser` adalah nama backend ('auto', 'stream', 'bs4', 'lxml',
+    'selectolax') atau instance ParserBackend. 'auto' dan 'stream' memakai
+    streaming extractor satu pass untuk mode text/links/images/basic;
+    tables selalu streaming, dan custom tetap butuh DOM sehingga memakai
+    backend tercepat. Jika `links` berupa list, URL semua <a href>
+    ditambahkan ke dalamnya dari parse yang sama (untuk crawl).
+    """
+    if mode not in MODES:
+        raise ValueError(f"Mode tidak dikenal: {mode}")
+
+    start = time.perf_counter()
+    if uses_stream(mode, parser):
+        # Satu pass: tokenizer dan extractor tidak bisa dipisah, dicatat sebagai parse
+        results = stream_extract(url, content, mode, links=links)
+        record('parse', time.perf_counter() - start)
+        return results
+    if parser in ('auto', 'stream'):
+        parser = 'auto'
+
+    backend = parser if isinstance(parser, ParserBackend) else get_backend(parser)
+    if mode == 'custom' and not backend.supports_css:
+        # lxml tanpa paket cssselect: pakai bs4 (soupsieve) untuk selector
+        backend = get_backend('bs4')
+
+    doc = backend.parse(content)
+    parsed = time.perf_counter()
+    record('parse', parsed - start)
+    if doc is None:
+        return []
+    if mode == 'custom':
+        results = extract_custom(url, doc, backend, (selector or '').strip())
+    else:
+        results = EXTRACTORS[mode](url, doc, backend)
+    if links is not None:
+        links.extend(item['content'] for item in
+                     (results if mode == 'links' else extract_links(url, doc, backend)))
+    record('extract', time.perf_counter() - parsed)
+    return results
@@ -0,0 +1,552 @@
+# -*- coding: utf-8 -*-
+"""
+Fetcher - session HTTP bersama dan scheduler concurrent per host
+"""
+
+import heapq
+import importlib.util
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from .metrics import current_timing
+
+# Content-Type yang boleh di-download untuk di-scrape
+HTML_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain', 'text/xml', 'application/xml')
+
+# Awalan file biner yang pasti bukan HTML (dicek jika Content-Type kosong)
+BINARY_SIGNATURES = (b'PK\x03\x04', b'%PDF', b'\x89PNG', b'GIF8', b'\xff\xd8\xff',
+                     b'\x1f\x8b', b'Rar!', b'7z\xbc\xaf', b'\x00\x00\x00', b'ID3', b'OggS',
+                     b'RIFF', b'\x7fELF', b'MZ')
+
+CHUNK_SIZE = 64 * 1024
+
+
+def normalize_url(url):
+    """Tambahkan https:// jika URL belum punya scheme"""
+    url = url.strip()
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    return url
+
+
+class HttpError(Exception):
+    """Response dengan status >= 400"""
+
+    def __init__(self, url, status, retry_after=None):
+        super().__init__(f"HTTP {status} untuk {url}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+
+
+class DownloadRejected(Exception):
+    """Body tidak di-download: bukan HTML atau melebihi batas ukuran"""
+
+    def __init__(self, url, reason):
+        super().__init__(f"Dilewati ({reason}): {url}")
+        self.url = url
+        self.reason = reason
+
+
+def parse_retry_after(value):
+    """Header Retry-After (detik atau tanggal HTTP) -> detik, atau None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    # Diimport di sini: paket email ikut memperlambat import engine
+    import email.utils
+
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def looks_binary(chunk):
+    """Tebak dari chunk pertama apakah body adalah file biner"""
+    head = chunk[:512]
+    return head.startswith(BINARY_SIGNATURES) or b'\x00' in head
+
+
+def robots_url_for(url):
+    """URL robots.txt untuk domain dari URL yang diberikan"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+
+
+_TIMED_POOLS = None
+
+
+def _timed_pool_classes():
+    """Pool urllib3 yang mencatat waktu connect dan TLS ke request yang sedang di-track
+
+    Waktu DNS yang dicatat DnsCache selama connect dikurangkan dari
+    connect, dan connect dikurangkan dari total handshake HTTPS (= tls).
+    """
+    global _TIMED_POOLS
+    if _TIMED_POOLS is not None:
+        return _TIMED_POOLS
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    def timed_new_conn(new_conn):
+        timing = current_timing()
+        if timing is None:
+            return new_conn()
+        dns = timing.get('dns')
+        start = time.perf_counter()
+        try:
+            return new_conn()
+        finally:
+            timing.add('connect', time.perf_counter() - start - (timing.get('dns') - dns))
+
+    class TimedHTTPConnection(HTTPConnection):
+        def _new_conn(self):
+            return timed_new_conn(super()._new_conn)
+
+    class TimedHTTPSConnection(HTTPSConnection):
+        def _new_conn(self):
+            return timed_new_conn(super()._new_conn)
+
+        def connect(self):
+            timing = current_timing()
+            if timing is None:
+                return super().connect()
+            setup = timing.setup()
+            start = time.perf_counter()
+            try:
+                return super().connect()
+            finally:
+                timing.add('tls', time.perf_counter() - start - (timing.setup() - setup))
+
+    class TimedHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = TimedHTTPConnection
+
+    class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = TimedHTTPSConnection
+
+    _TIMED_POOLS = {'http': TimedHTTPConnectionPool, 'https': TimedHTTPSConnectionPool}
+    return _TIMED_POOLS
+
+
+class HttpClient:
+    """Session HTTP bersama dengan connection pool dan keep-alive per host
+
+    Semua fetch (scraping dan robots.txt) lewat sini supaya koneksi TCP/TLS
+    dipakai ulang. HTTP/2 dipakai jika diminta dan paket httpx[http2]
+    tersedia; kalau tidak, fallback ke requests.Session.
+    """
+
+    def __init__(self, pool_connections=20, pool_maxsize=4, http2=False):
+        self._lock = threading.Lock()
+        self._session = None
+        self._options = None
+        self.configure(pool_connections, pool_maxsize, http2)
+
+    @staticmethod
+    def http2_available():
+        """Cek apakah httpx dengan dukungan HTTP/2 terinstall (tanpa import)"""
+        return all(importlib.util.find_spec(name) is not None for name in ('httpx', 'h2'))
+
+    def configure(self, pool_connections=20, pool_maxsize=4, http2=False):
+        """Atur ukuran pool; session dibuat ulang hanya jika pengaturan berubah
+
+        pool_connections = jumlah host yang pool-nya disimpan,
+        pool_maxsize = jumlah koneksi keep-alive per host.
+        Session baru dibuat saat request pertama (requests/httpx di-import
+        lazy supaya startup cepat).
+        """
+        http2 = bool(http2) and self.http2_available()
+        options = (max(1, int(pool_connections)), max(1, int(pool_maxsize)), http2)
+        with self._lock:
+            if options == self._options:
+                return
+            old = self._session
+            self._session = None
+            self._options = options
+        if old is not None:
+            old.close()
+
+    def _get_session(self):
+        with self._lock:
+            if self._session is None:
+                self._session = self._build_session(*self._options)
+            return self._session
+
+    @staticmethod
+    def _build_session(pool_connections, pool_maxsize, http2):
+        if http2:
+            import httpx
+            limits = httpx.Limits(max_connections=pool_connections * pool_maxsize,
+                                  max_keepalive_connections=pool_connections * pool_maxsize)
+            return httpx.Client(http2=True, limits=limits, follow_redirects=True)
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize, pool_block=False)
+        # Dict baru: pool_classes_by_scheme default milik modul urllib3
+        adapter.poolmanager.pool_classes_by_scheme = dict(_timed_pool_classes())
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @property
+    def http2(self):
+        return self._options[2]
+
+    def get(self, url, headers=None, timeout=30, cache=None):
+        """GET lewat session bersama (response punya API mirip requests)
+
+        Jika `cache` (HttpCache) diberikan, request dikirim kondisional dan
+        jawaban 304 dilayani dari cache.
+        """
+        session = self._get_session()
+        if cache is None:
+            return session.get(url, headers=headers, timeout=timeout)
+        entry = cache.lookup(url, headers)
+        request_headers = cache.conditional_headers(entry, headers) if entry else headers
+        response = session.get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            return cache.hit(url, entry)
+        cache.store(url, headers, response)
+        return response
+
+    def download(self, url, headers=None, timeout=30, cache=None, max_bytes=None,
+                 content_types=HTML_TYPES, on_chunk=None, keep_body=True):
+        """GET streaming dengan batas ukuran; return bytes body
+
+        Status, Content-Type dan Content-Length dicek dari header sebelum
+        body dibaca, jadi link ke ZIP/video tidak pernah di-download.
+        Body dibaca per chunk (gzip/deflate didekompresi bertahap oleh
+        session) dan dihentikan begitu melewati `max_bytes`. Setiap chunk
+        juga dikirim ke on_chunk(bytes) supaya parser bisa mulai bekerja
+        sebelum download selesai. Raise HttpError untuk status >= 400 dan
+        DownloadRejected jika body ditolak.
+
+        keep_body=False: chunk hanya dikirim ke on_chunk, tidak ditampung
+        (memory konstan untuk file besar seperti sitemap); return b'' dan
+        response tidak disimpan di cache.
+        """
+        entry = cache.lookup(url, headers) if cache is not None else None
+        request_headers = cache.conditional_headers(entry, headers) if entry else headers
+        session = self._get_session()
+        timing = current_timing()
+        if timing is not None:
+            setup = timing.setup()
+            start = time.perf_counter()
+        if self.http2:
+            response = session.send(session.build_request('GET', url, headers=request_headers,
+                                                          timeout=timeout), stream=True)
+            chunks = response.iter_bytes(CHUNK_SIZE)
+        else:
+            response = session.get(url, headers=request_headers, timeout=timeout, stream=True)
+            chunks = response.iter_content(CHUNK_SIZE)
+        if timing is not None:
+            # Waktu menunggu header response, tanpa DNS/connect/TLS koneksi baru
+            timing.add('ttfb', time.perf_counter() - start - (timing.setup() - setup))
+            start = time.perf_counter()
+        callbacks = 0.0
+
+        try:
+            if response.status_code == 304 and entry is not None:
+                body = cache.hit(url, entry).content
+                if on_chunk:
+                    started = time.perf_counter()
+                    for offset in range(0, len(body), CHUNK_SIZE):
+                        on_chunk(body[offset:offset + CHUNK_SIZE])
+                    callbacks += time.perf_counter() - started
+                return body
+            if response.status_code >= 400:
+                raise HttpError(url, response.status_code,
+                                parse_retry_after(response.headers.get('Retry-After')))
+
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            if content_types and content_type and content_type not in content_types:
+                raise DownloadRejected(url, content_type)
+            length = response.headers.get('Content-Length', '')
+            if max_bytes and length.isdigit() and int(length) > max_bytes:
+                raise DownloadRejected(url, f"{int(length) // 1024} KB > batas {max_bytes // 1024} KB")
+
+            parts = []
+            size = 0
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                if not size and content_types and not content_type and looks_binary(chunk):
+                    raise DownloadRejected(url, 'file biner')
+                size += len(chunk)
+                if max_bytes and size > max_bytes:
+                    raise DownloadRejected(url, f"lebih dari {max_bytes // 1024} KB")
+                if keep_body:
+                    parts.append(chunk)
+                if on_chunk:
+                    if timing is not None:
+                        started = time.perf_counter()
+                        on_chunk(chunk)
+                        callbacks += time.perf_counter() - started
+                    else:
+                        on_chunk(chunk)
+            body = b''.join(parts)
+            if timing is not None:
+                timing.bytes += size
+        finally:
+            response.close()
+            if timing is not None:
+                # Waktu on_chunk (parsing streaming) dicatat sendiri oleh pemanggil
+                timing.add('download', time.perf_counter() - start - callbacks)
+        if cache is not None and keep_body:
+            cache.store(url, headers, response, body)
+        return body
+
+    def preconnect(self, url, timeout=10):
+        """Buka koneksi TCP/TLS ke host URL dan taruh di pool, tanpa request HTTP
+
+        Request pertama ke host itu langsung memakai koneksi yang sudah
+        siap. Return True jika koneksi baru dibuka; False jika pool host
+        sudah punya koneksi, lewat proxy, atau memakai HTTP/2 (httpx
+        mengatur koneksinya sendiri).
+        """
+        if self.http2:
+            return False
+        import requests
+        from requests.utils import select_proxy
+
+        session = self._get_session()
+        # Pengaturan yang sama dengan request biasa (proxy/CA bundle dari env),
+        # supaya koneksi masuk ke pool yang nanti dipakai request itu
+        settings = session.merge_environment_settings(url, {}, False, None, None)
+        if select_proxy(url, settings['proxies']):
+            return False
+        adapter = session.get_adapter(url)
+        if hasattr(adapter, 'get_connection_with_tls_context'):
+            request = requests.Request('GET', url).prepare()
+            pool = adapter.get_connection_with_tls_context(request, settings['verify'],
+                                                           cert=settings['cert'])
+        else:
+            pool = adapter.get_connection(url)
+            adapter.cert_verify(pool, url, settings['verify'], settings['cert'])
+        conn = pool._get_conn()
+        if getattr(conn, 'sock', None) is not None:
+            pool._put_conn(conn)
+            return False
+        try:
+            conn.timeout = timeout
+            conn.connect()
+        except Exception:
+            conn.close()
+            pool._put_conn(None)
+            raise
+        pool._put_conn(conn)
+        return True
+
+    def fetch_robots(self, robots_url, user_agent='EasyScraper/1.0', timeout=10):
+        """Ambil robots.txt lewat session bersama dan parse
+
+        Pengganti RobotFileParser.read() (yang membuka koneksi sendiri via
+        urllib) dengan aturan status yang sama: 401/403 = disallow semua,
+        4xx lainnya = allow semua. Return (parser, response).
+        """
+        # urllib.robotparser menarik urllib.request, http.client, ssl, dan email
+        from urllib.robotparser import RobotFileParser
+
+        rp = RobotFileParser()
+        rp.set_url(robots_url)
+        response = self.get(robots_url, headers={'User-Agent': user_agent}, timeout=timeout)
+        if response.status_code in (401, 403):
+            rp.disallow_all = True
+        elif 400 <= response.status_code < 500:
+            rp.allow_all = True
+        elif response.status_code < 400:
+            rp.parse(response.text.splitlines())
+        return rp, response
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+class HostScheduler:
+    """Menjalankan fetch secara concurrent dengan batas global dan sopan per host
+
+    Delay berlaku per domain: request berikutnya ke host yang sama baru
+    dimulai `delay` detik setelah request sebelumnya selesai, sementara
+    host lain tetap berjalan paralel.
+
+    on_upcoming(url) dipanggil (sekali per host, sesuai urutan antrian)
+    untuk `lookahead` host baru berikutnya sebelum request pertamanya
+    dimulai, supaya DNS/koneksi bisa disiapkan lebih awal (lihat
+    resolver.Prewarmer). Callback dipanggil di dalam lock, jadi harus
+    langsung return.
+    """
+
+    def __init__(self, max_workers=8, per_host=1, delay=1.0, on_upcoming=None, lookahead=16):
+        self.max_workers = max(1, int(max_workers))
+        self.per_host = max(1, int(per_host))
+        self.delay = max(0.0, float(delay))
+        self.on_upcoming = on_upcoming
+        self.lookahead = max(0, int(lookahead))
+
+        self._cond = threading.Condition()
+        self._pending = {}      # host -> deque URL yang belum dijalankan
+        self._active = {}       # host -> jumlah request yang sedang berjalan
+        self._ready = []        # heap (waktu_siap, urutan, host)
+        self._scheduled = set() # host yang sudah ada di heap
+        self._next_start = {}   # host -> waktu paling awal request berikutnya
+        self._host_delay = {}   # host -> delay khusus (mis. Crawl-delay robots.txt)
+        self._completed = deque()
+        self._inflight = 0
+        self._seq = 0
+        self._new_hosts = deque()   # host yang belum diberikan ke on_upcoming
+        self._started_hosts = 0     # host yang request pertamanya sudah dimulai
+        self._announced = 0
+
+    @staticmethod
+    def host_of(url):
+        """Ambil host (netloc) dari URL"""
+        return urlparse(url).netloc.lower()
+
+    def add(self, url, front=False):
+        """Tambahkan URL ke antrian (aman dipanggil dari thread mana pun)
+
+        front=True menaruh URL di depan antrian host-nya (dipakai retry).
+        """
+        host = self.host_of(url)
+        with self._cond:
+            if host not in self._pending:
+                self._new_hosts.append(host)
+            pending = self._pending.setdefault(host, deque())
+            if front:
+                pending.appendleft(url)
+            else:
+                pending.append(url)
+            self._schedule(host, self._next_start.get(host, 0.0))
+            self._cond.notify()
+
+    def set_host_delay(self, host, delay):
+        """Delay khusus untuk satu host; yang dipakai adalah max(delay global, ini)"""
+        with self._cond:
+            self._host_delay[host] = float(delay)
+
+    def delay_for(self, host):
+        return max(self.delay, self._host_delay.get(host, 0.0))
+
+    def defer_host(self, host, seconds):
+        """Tunda request berikutnya ke host ini minimal `seconds` dari sekarang"""
+        with self._cond:
+            ready_at = time.monotonic() + max(0.0, seconds)
+            self._next_start[host] = max(self._next_start.get(host, 0.0), ready_at)
+            self._cond.notify()
+
+    def _schedule(self, host, ready_at):
+        """Masukkan host ke heap jika masih ada URL dan slot per host tersedia"""
+        if host in self._scheduled:
+            return
+        if not self._pending.get(host):
+            return
+        if self._active.get(host, 0) >= self.per_host:
+            return
+        self._seq += 1
+        heapq.heappush(self._ready, (ready_at, self._seq, host))
+        self._scheduled.add(host)
+
+    def _announce(self):
+        """Berikan host baru ke on_upcoming sampai `lookahead` host di depan"""
+        if self.on_upcoming is None:
+            return
+        while self._new_hosts and self._announced < self._started_hosts + self.lookahead:
+            host = self._new_hosts.popleft()
+            self._announced += 1
+            pending = self._pending.get(host)
+            if pending:
+                self.on_upcoming(pending[0])
+
+    def _on_done(self, host, url, future):
+        """Callback dari worker: bebaskan slot host dan jadwalkan ulang"""
+        with self._cond:
+            self._inflight -= 1
+            self._active[host] -= 1
+            ready_at = time.monotonic() + self.delay_for(host)
+            self._next_start[host] = max(self._next_start.get(host, 0.0), ready_at)
+            self._schedule(host, self._next_start[host])
+            self._completed.append((url, future))
+            self._cond.notify()
+
+    def run(self, task, on_result, should_continue=lambda: True):
+        """Jalankan task(url) untuk semua URL di antrian
+
+        on_result(url, result, error) dipanggil di thread pemanggil, jadi
+        aman untuk menulis ke struktur data tanpa lock tambahan.
+        """
+        with self._cond:
+            self._announce()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while True:
+                finished = []
+                with self._cond:
+                    while True:
+                        if self._completed:
+                            break
+                        if not should_continue():
+                            break
+                        if not self._ready and self._inflight == 0:
+                            break
+
+                        now = time.monotonic()
+                        timeout = None
+                        if self._ready and self._inflight < self.max_workers:
+                            ready_at, _, host = self._ready[0]
+                            if ready_at < self._next_start.get(host, 0.0):
+                                # Host ditunda (defer_host) setelah masuk heap
+                                self._seq += 1
+                                heapq.heapreplace(self._ready, (self._next_start[host], self._seq, host))
+                                continue
+                            if ready_at <= now:
+                                heapq.heappop(self._ready)
+                                self._scheduled.discard(host)
+                                url = self._pending[host].popleft()
+                                if host not in self._active:
+                                    self._started_hosts += 1
+                                    self._announce()
+                                self._active[host] = self._active.get(host, 0) + 1
+                                self._inflight += 1
+                                # Slot per host berikutnya tetap menunggu delay
+                                self._next_start[host] = now + self.delay_for(host)
+                                self._schedule(host, self._next_start[host])
+                                future = pool.submit(task, url)
+                                future.add_done_callback(
+                                    lambda f, h=host, u=url: self._on_done(h, u, f))
+                                continue
+                            timeout = ready_at - now
+                        # Bangun berkala supaya tombol Stop tetap responsif
+                        self._cond.wait(min(timeout, 0.5) if timeout else 0.5)
+
+                    while self._completed:
+                        finished.append(self._completed.popleft())
+                    stopping = not should_continue()
+                    idle = not self._ready and self._inflight == 0
+
+                for url, future in finished:
+                    error = future.exception()
+                    result = None if error else future.result()
+                    on_result(url, result, error)
+
+                if stopping:
+                    # Buang antrian; request yang sedang berjalan dibiarkan selesai
+                    with self._cond:
+                        self._pending.clear()
+                        self._ready.clear()
+                        self._scheduled.clear()
+                    break
+                if idle and not finished:
+                    break
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+FingerprintStore - scrape ulang incremental: hanya perubahan yang dikirim
+
+Untuk setiap URL (per mode/selector) disimpan dua sidik jari di SQLite:
+
+- hash body yang dinormalisasi (komentar, isi <script>/<style> dan
+  whitespace diabaikan, jadi nonce/token per request tidak dihitung
+  sebagai perubahan); jika sama dengan run sebelumnya halaman tidak
+  di-parse sama sekali
+- snapshot item terakhir (kunci item -> hash isi + item); hasil parse
+  dibandingkan dengannya dan hanya item baru, berubah, atau hilang yang
+  dikirim ke sink, dengan field 'change' = new / changed / removed
+
+Kunci item adalah type + content (type + table_id untuk tabel), jadi
+link yang teksnya berubah menjadi 'changed', sedangkan paragraf yang
+isinya berubah menjadi pasangan 'removed' + 'new'.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    url TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    body_hash TEXT NOT NULL,
+    snapshot BLOB NOT NULL,
+    items INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (url, profile)
+);
+"""
+
+CHANGE_TYPES = ('new', 'changed', 'removed')
+
+_VOLATILE = re.compile(rb'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.S | re.I)
+_COMMENTS = re.compile(rb'<!--.*?-->', re.S)
+_SPACE = re.compile(rb'\s+')
+
+
+def body_digest(content, mode='basic'):
+    """Hash body yang sudah dinormalisasi
+
+    Mode custom tetap menghitung isi <script>/<style> karena selector
+    bisa saja mengambil dari sana (mis. JSON-LD).
+    """
+    pattern = _COMMENTS if mode == 'custom' else _VOLATILE
+    body = _SPACE.sub(b' ', pattern.sub(b' ', content)).strip()
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _value_hash(item):
+    # repr() tuple yang diurutkan jauh lebih cepat dari json.dumps per item
+    data = repr(sorted(item.items()))
+    return hashlib.blake2b(data.encode('utf-8', 'surrogatepass'), digest_size=8).hexdigest()
+
+
+def make_snapshot(results):
+    """Dict kunci -> [hash isi, item]; kunci kembar diberi nomor urut"""
+    snapshot = {}
+    seen = {}
+    for item in results:
+        key = f"{item.get('type')}\x00{item.get('table_id', item.get('content'))}"
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        snapshot[f"{key}\x00{count}"] = [_value_hash(item), item]
+    return snapshot
+
+
+def diff_snapshots(old, new):
+    """List item yang berubah dari snapshot old ke new (dengan field 'change')"""
+    changes = []
+    for key, (value, item) in new.items():
+        previous = old.get(key)
+        if previous is None:
+            changes.append({**item, 'change': 'new'})
+        elif previous[0] != value:
+            changes.append({**item, 'change': 'changed'})
+    for key, (_, item) in old.items():
+        if key not in new:
+            changes.append({**item, 'change': 'removed'})
+    return changes
+
+
+class FingerprintStore:
+    """Sidik jari body dan item per URL di SQLite (aman dipakai lintas thread)"""
+
+    def __init__(self, path):
+        if os.path.isdir(path):
+            path = os.path.join(path, 'fingerprints.sqlite')
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.stats = {'unchanged': 0, 'changed': 0, 'new': 0}
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def profile(mode, selector=None):
+        """Snapshot terpisah per mode/selector supaya ganti mode tidak dianggap perubahan"""
+        return f"{mode}:{selector or ''}" if mode == 'custom' else mode
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM fingerprints').fetchone()[0]
+
+    def is_unchanged(self, url, profile, digest):
+        """True jika body sama dengan run terakhir (parsing bisa dilewati)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body_hash FROM fingerprints WHERE url = ? AND profile = ?',
+                (url, profile)).fetchone()
+            unchanged = row is not None and row[0] == digest
+            if unchanged:
+                self.stats['unchanged'] += 1
+        return unchanged
+
+    def load(self, url, profile):
+        """Snapshot item terakhir URL ini ({} jika belum pernah)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT snapshot FROM fingerprints WHERE url = ? AND profile = ?',
+                (url, profile)).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else {}
+
+    def diff(self, url, profile, results):
+        """Bandingkan hasil parse dengan snapshot; return (item berubah, snapshot baru)
+
+        Snapshot baru belum disimpan: panggil save() setelah delta masuk
+        sink, supaya perubahan tidak hilang jika sink gagal.
+        """
+        old = self.load(url, profile)
+        snapshot = make_snapshot(results)
+        with self._lock:
+            self.stats['changed' if old else 'new'] += 1
+        return diff_snapshots(old, snapshot), snapshot
+
+    def save(self, url, profile, digest, snapshot):
+        blob = zlib.compress(json.dumps(snapshot, ensure_ascii=False).encode('utf-8'), 1)
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?)',
+                    (url, profile, digest, blob, len(snapshot), time.time()))
+
+    def forget(self, url=None):
+        """Hapus sidik jari satu URL (atau semua) sehingga di-scrape penuh lagi"""
+        with self._lock:
+            with self._conn:
+                if url is None:
+                    self._conn.execute('DELETE FROM fingerprints')
+                else:
+                    self._conn.execute('DELETE FROM fingerprints WHERE url = ?', (url,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+JobStore - batch scraping yang bisa dilanjutkan setelah berhenti atau crash
+
+Daftar URL beserta status (pending/done/failed) dan jumlah percobaan
+disimpan di file SQLite yang sama dengan item hasilnya. Item satu URL dan
+status 'done'-nya ditulis dalam satu transaksi, jadi setelah crash tidak
+ada URL yang tercatat selesai tanpa item (atau sebaliknya). Menjalankan
+ulang job hanya mengambil URL yang belum selesai, termasuk yang gagal
+selama belum melewati `max_attempts`.
+"""
+
+import time
+
+from .fetcher import normalize_url
+from .store import ResultStore
+
+_JOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_urls (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    items INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS job_urls_status ON job_urls (status);
+"""
+
+
+class JobStore(ResultStore):
+    """ResultStore + status per URL untuk job yang bisa dilanjutkan"""
+
+    def __init__(self, path=None, window=1000, max_attempts=3):
+        super().__init__(path, window)
+        self.max_attempts = max_attempts
+        with self._lock:
+            self._conn.executescript(_JOB_SCHEMA)
+
+    def add_urls(self, urls, reset=False):
+        """Daftarkan URL ke job; URL yang sudah ada tidak berubah kecuali reset=True
+
+        reset=True menandai URL tersebut pending lagi (scrape ulang dari awal).
+        Return list URL yang sudah dinormalisasi.
+        """
+        urls = [normalize_url(url) for url in urls if url.strip()]
+        with self._lock:
+            with self._conn:
+                self._conn.executemany('INSERT OR IGNORE INTO job_urls (url) VALUES (?)',
+                                       [(url,) for url in urls])
+                if reset:
+                    self._conn.executemany(
+                        "UPDATE job_urls SET status = 'pending', attempts = 0, error = NULL "
+                        "WHERE url = ?", [(url,) for url in urls])
+        return urls
+
+    def pending_urls(self):
+        """URL yang perlu dijalankan: belum selesai dan percobaan belum habis"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT url FROM job_urls WHERE status != 'done' AND attempts < ? ORDER BY id",
+                (self.max_attempts,))]
+
+    def add_result(self, url, items, error=None):
+        """Simpan item dan status URL dalam satu transaksi
+
+        Status hanya dicatat untuk URL yang didaftarkan lewat add_urls;
+        halaman hasil crawl cuma menyimpan item, jadi tidak pernah muncul
+        di pending_urls().
+        """
+        with self._lock:
+            with self._conn:
+                if error is None:
+                    self._insert(items)
+                self._conn.execute(
+                    'UPDATE job_urls SET status = ?, attempts = attempts + 1, items = ?, '
+                    'error = ?, updated_at = ? WHERE url = ?',
+                    ('failed' if error is not None else 'done', len(items or ()),
+                     str(error) if error is not None else None, time.time(), url))
+
+    def progress(self):
+        """Jumlah URL per status: {'pending': n, 'done': n, 'failed': n}"""
+        counts = {'pending': 0, 'done': 0, 'failed': 0}
+        with self._lock:
+            for status, count in self._conn.execute(
+                    'SELECT status, COUNT(*) FROM job_urls GROUP BY status'):
+                counts[status] = count
+        return counts
+
+    def failures(self):
+        """List (url, attempts, error) untuk URL yang gagal"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT url, attempts, error FROM job_urls WHERE status = 'failed' "
+                "ORDER BY id").fetchall()
+
+    def clear(self):
+        with self._lock:
+            with self._conn:
+                self._conn.execute('DELETE FROM job_urls')
+            super().clear()
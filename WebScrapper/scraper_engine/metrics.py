@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+Metrics - waktu per fase request, agregat per host, dan histogram
+
+Setiap request yang di-track mendapat RequestTiming di thread-local;
+lapisan di bawahnya (DnsCache, koneksi urllib3, HttpClient.download,
+extractor) menambahkan waktunya lewat record() tanpa perlu tahu siapa
+yang mengukur. Fase:
+
+- dns: lookup DNS (hanya terpisah jika DnsCache terpasang; tanpa itu
+  masuk ke connect), connect: TCP, tls: handshake TLS
+- ttfb: request terkirim sampai header response diterima
+- download: membaca body (tanpa waktu parsing streaming)
+- parse: membangun DOM / tokenizer streaming (satu pass dengan extract)
+- extract: menjalankan extractor pada DOM
+- store: menulis ke sink, ui: callback GUI per tick, total: seluruh request
+
+Hasilnya bisa dibaca sebagai dict (snapshot, untuk JSON/GUI) atau teks
+format Prometheus; MetricsServer dan JsonDumper mengeksposnya saat batch
+berjalan headless.
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+PHASES = ('dns', 'connect', 'tls', 'ttfb', 'download', 'parse', 'extract', 'store', 'ui', 'total')
+
+# Fase yang dijumlahkan untuk menebak bottleneck
+PHASE_GROUPS = {
+    'jaringan': ('dns', 'connect', 'tls', 'ttfb', 'download'),
+    'parsing': ('parse', 'extract'),
+    'penyimpanan': ('store',),
+    'UI': ('ui',),
+}
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+OTHER_HOSTS = '_lainnya'
+
+_local = threading.local()
+
+
+def current_timing():
+    """RequestTiming request yang sedang berjalan di thread ini, atau None"""
+    return getattr(_local, 'timing', None)
+
+
+def record(phase, seconds):
+    """Tambahkan waktu fase ke request aktif (tidak apa-apa jika tidak di-track)"""
+    timing = getattr(_local, 'timing', None)
+    if timing is not None:
+        timing.add(phase, seconds)
+
+
+class RequestTiming:
+    """Waktu per fase satu request; `with timing:` mengaktifkannya di thread ini"""
+
+    __slots__ = ('phases', 'bytes', '_previous')
+
+    def __init__(self):
+        self.phases = {}
+        self.bytes = 0
+        self._previous = None
+
+    def add(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0.0) + max(0.0, seconds)
+
+    def get(self, phase):
+        return self.phases.get(phase, 0.0)
+
+    def setup(self):
+        """Total dns + connect + tls sejauh ini (dipakai untuk memisahkan ttfb)"""
+        phases = self.phases
+        return phases.get('dns', 0.0) + phases.get('connect', 0.0) + phases.get('tls', 0.0)
+
+    def __enter__(self):
+        self._previous = getattr(_local, 'timing', None)
+        _local.timing = self
+        return self
+
+    def __exit__(self, *exc):
+        _local.timing = self._previous
+        self._previous = None
+
+
+class Histogram:
+    """Histogram bucket tetap (kumulatif saat di-export, seperti Prometheus)"""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count', 'max')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)   # slot terakhir = +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q):
+        """Perkiraan kuantil: batas atas bucket tempat kuantil itu jatuh"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def cumulative(self):
+        """List (batas, jumlah kumulatif); batas terakhir '+Inf'"""
+        total = 0
+        rows = []
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            total += count
+            rows.append((bound, total))
+        return rows
+
+
+def _host(url):
+    return urlparse(url).netloc.lower() if url else ''
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+    """Kumpulan metrics satu aplikasi/batch (aman dipakai lintas thread)
+
+    Host di atas `max_hosts` digabung ke host '_lainnya' supaya memory dan
+    jumlah label Prometheus tetap terbatas untuk batch ribuan domain.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, max_hosts=1000):
+        self.buckets = buckets
+        self.max_hosts = max_hosts
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.counters = {'requests': 0, 'errors': 0, 'bytes': 0, 'items': 0}
+            self.histograms = {phase: Histogram(self.buckets) for phase in PHASES}
+            self.hosts = {}     # host -> {'requests', 'errors', 'bytes', 'seconds': {fase: total}}
+
+    @contextmanager
+    def track(self, url):
+        """Ukur satu request: fase dari lapisan bawah + total, error dihitung jika raise"""
+        timing = RequestTiming()
+        start = time.perf_counter()
+        error = False
+        try:
+            with timing:
+                yield timing
+        except BaseException:
+            error = True
+            raise
+        finally:
+            timing.add('total', time.perf_counter() - start)
+            self.add(url, timing.phases, timing.bytes, error)
+
+    def _host_stats(self, host):
+        stats = self.hosts.get(host)
+        if stats is None:
+            if len(self.hosts) >= self.max_hosts:
+                host = OTHER_HOSTS
+                stats = self.hosts.get(host)
+            if stats is None:
+                stats = self.hosts[host] = {'requests': 0, 'errors': 0, 'bytes': 0, 'seconds': {}}
+        return stats
+
+    def add(self, url, phases, nbytes=0, error=False, request=True):
+        """Catat waktu fase untuk host URL; request=False untuk fase susulan (mis. parse di process pool)"""
+        with self._lock:
+            self.counters['requests'] += bool(request)
+            self.counters['errors'] += bool(error)
+            self.counters['bytes'] += nbytes
+            for phase, value in phases.items():
+                histogram = self.histograms.get(phase)
+                if histogram is None:
+                    histogram = self.histograms[phase] = Histogram(self.buckets)
+                histogram.observe(value)
+            if url is None:
+                return
+            host = self._host_stats(_host(url))
+            host['requests'] += bool(request)
+            host['errors'] += bool(error)
+            host['bytes'] += nbytes
+            seconds = host['seconds']
+            for phase, value in phases.items():
+                seconds[phase] = seconds.get(phase, 0.0) + value
+
+    def observe(self, url, phase, seconds):
+        """Satu fase di luar request yang di-track (store, ui); url None = tanpa host"""
+        self.add(url, {phase: seconds}, request=False)
+
+    def stored(self, url, seconds, items):
+        """Waktu tulis ke sink untuk hasil satu URL"""
+        self.add(url, {'store': seconds}, request=False)
+        with self._lock:
+            self.counters['items'] += items
+
+    def bottleneck(self):
+        """(grup, total detik, persen) grup fase dengan waktu terbanyak, atau None"""
+        with self._lock:
+            totals = {group: sum(self.histograms[phase].sum for phase in phases)
+                      for group, phases in PHASE_GROUPS.items()}
+        overall = sum(totals.values())
+        if not overall:
+            return None
+        group = max(totals, key=totals.get)
+        return group, totals[group], totals[group] * 100 / overall
+
+    def snapshot(self, top_hosts=None):
+        """Dict untuk JSON/GUI; host diurutkan dari total waktu terbesar"""
+        with self._lock:
+            phases = {}
+            for phase, histogram in self.histograms.items():
+                if not histogram.count:
+                    continue
+                phases[phase] = {
+                    'count': histogram.count,
+                    'sum': round(histogram.sum, 6),
+                    'avg': round(histogram.sum / histogram.count, 6),
+                    'p50': round(histogram.quantile(0.5), 6),
+                    'p95': round(histogram.quantile(0.95), 6),
+                    'max': round(histogram.max, 6),
+                    'buckets': [[bound, count] for bound, count in histogram.cumulative()],
+                }
+            hosts = sorted(self.hosts.items(), key=lambda item: -item[1]['seconds'].get('total', 0.0))
+            if top_hosts:
+                hosts = hosts[:top_hosts]
+            data = {
+                'started': self.started,
+                'uptime': round(time.time() - self.started, 3),
+                'counters': dict(self.counters),
+                'phases': phases,
+                'hosts': {host: {**stats, 'seconds': {phase: round(value, 6)
+                                                      for phase, value in stats['seconds'].items()}}
+                          for host, stats in hosts},
+            }
+        bottleneck = self.bottleneck()
+        if bottleneck is not None:
+            data['bottleneck'] = {'group': bottleneck[0], 'seconds': round(bottleneck[1], 6),
+                                  'percent': round(bottleneck[2], 1)}
+        return data
+
+    def to_prometheus(self, prefix='easyscraper'):
+        """Teks format exposition Prometheus (text/plain; version=0.0.4)"""
+        lines = []
+        with self._lock:
+            for name, value in self.counters.items():
+                metric = f"{prefix}_{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+
+            metric = f"{prefix}_phase_seconds"
+            lines.append(f"# HELP {metric} Durasi per fase request")
+            lines.append(f"# TYPE {metric} histogram")
+            for phase, histogram in self.histograms.items():
+                if not histogram.count:
+                    continue
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{metric}_bucket{{phase="{phase}",le="{bound}"}} {count}')
+                lines.append(f'{metric}_sum{{phase="{phase}"}} {histogram.sum:.6f}')
+                lines.append(f'{metric}_count{{phase="{phase}"}} {histogram.count}')
+
+            for name in ('requests', 'errors', 'bytes'):
+                metric = f"{prefix}_host_{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                for host, stats in self.hosts.items():
+                    lines.append(f'{metric}{{host="{_label(host)}"}} {stats[name]}')
+            metric = f"{prefix}_host_phase_seconds_total"
+            lines.append(f"# TYPE {metric} counter")
+            for host, stats in self.hosts.items():
+                for phase, value in stats['seconds'].items():
+                    lines.append(f'{metric}{{host="{_label(host)}",phase="{phase}"}} {value:.6f}')
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path):
+        """Tulis snapshot ke file JSON (atomic: file sementara lalu rename)"""
+        temp = f"{path}.tmp"
+        with open(temp, 'w', encoding='utf-8') as handle:
+            json.dump(self.snapshot(), handle, ensure_ascii=False, indent=2)
+        os.replace(temp, path)
+
+
+class MetricsServer:
+    """Endpoint HTTP /metrics (Prometheus) dan /metrics.json di thread latar belakang"""
+
+    def __init__(self, metrics, port=9100, host='127.0.0.1'):
+        # Diimport di sini: http.server (dan email) memperlambat import engine
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?', 1)[0]
+                if path == '/metrics':
+                    body = metrics.to_prometheus().encode('utf-8')
+                    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+                elif path == '/metrics.json':
+                    body = json.dumps(metrics.snapshot(), ensure_ascii=False).encode('utf-8')
+                    content_type = 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class JsonDumper:
+    """Tulis snapshot metrics ke file JSON setiap `interval` detik (dan sekali saat close)"""
+
+    def __init__(self, metrics, path, interval=10.0):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.metrics.write_json(self.path)
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self.metrics.write_json(self.path)
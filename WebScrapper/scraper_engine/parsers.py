@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Parser backend - abstraksi parser HTML untuk extractor
+
+Semua backend memberi hasil yang sama dengan BeautifulSoup (html.parser),
+hanya kecepatannya yang berbeda:
+
+- 'bs4'        : BeautifulSoup + html.parser (referensi, paling lambat)
+- 'lxml'       : lxml.html (libxml2), CSS selector butuh paket cssselect
+- 'selectolax' : selectolax.lexbor (lexbor), paling cepat
+
+Output str(element) untuk mode custom bisa berbeda format (kutip atribut,
+tag void) antar backend; teks, link, dan atribut identik. Satu pengecualian:
+lexbor menyimpan isi <template> di fragment terpisah sehingga elemen di
+dalamnya tidak ikut ditemukan oleh selectolax.
+"""
+
+import importlib.util
+import re
+
+# Isi tag ini tidak dihitung sebagai teks (sama dengan bs4 get_text)
+NON_TEXT_TAGS = frozenset(['script', 'style', 'template'])
+
+META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+
+
+def decode_html(content):
+    """Decode bytes HTML memakai charset dari <meta>, default UTF-8"""
+    if isinstance(content, str):
+        return content
+    if content.startswith(b'\xef\xbb\xbf'):
+        return content[3:].decode('utf-8', 'replace')
+    match = META_CHARSET.search(content[:2048])
+    if match:
+        try:
+            return content.decode(match.group(1).decode('ascii'), 'replace')
+        except LookupError:
+            pass
+    return content.decode('utf-8', 'replace')
+
+
+class ParserBackend:
+    """Interface backend: parse dokumen dan akses node dengan semantik bs4"""
+
+    name = None
+    supports_css = True
+
+    def parse(self, content):
+        raise NotImplementedError
+
+    def find_all(self, doc, tags, attr=None):
+        """Node dengan nama tag di `tags` (urutan dokumen), opsional wajib punya `attr`"""
+        raise NotImplementedError
+
+    def tag(self, node):
+        raise NotImplementedError
+
+    def get(self, node, attr, default=None):
+        """Nilai atribut sebagai string"""
+        raise NotImplementedError
+
+    def strings(self, node):
+        """Semua string teks di dalam node (tanpa script/style/komentar)"""
+        raise NotImplementedError
+
+    def text(self, node):
+        """Sama dengan bs4 get_text(strip=True)"""
+        return ''.join(part for part in (s.strip() for s in self.strings(node)) if part)
+
+    def string(self, node):
+        """Sama dengan bs4 .string: teks jika node hanya punya satu anak string"""
+        raise NotImplementedError
+
+    def outer_html(self, node):
+        raise NotImplementedError
+
+    def select(self, doc, selector):
+        raise NotImplementedError
+
+
+class Bs4Backend(ParserBackend):
+    name = 'bs4'
+
+    def parse(self, content):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(content, 'html.parser')
+
+    def find_all(self, doc, tags, attr=None):
+        if attr:
+            return doc.find_all(tags, **{attr: True})
+        return doc.find_all(tags)
+
+    def tag(self, node):
+        return node.name
+
+    def get(self, node, attr, default=None):
+        value = node.get(attr, default)
+        if isinstance(value, list):
+            value = ' '.join(value)
+        return value
+
+    def strings(self, node):
+        return node.strings
+
+    def text(self, node):
+        return node.get_text(strip=True)
+
+    def string(self, node):
+        return node.string
+
+    def outer_html(self, node):
+        return str(node)
+
+    def select(self, doc, selector):
+        return doc.select(selector)
+
+
+class LxmlBackend(ParserBackend):
+    name = 'lxml'
+
+    def __init__(self):
+        import lxml.html
+        self._html = lxml.html
+        self.supports_css = importlib.util.find_spec('cssselect') is not None
+
+    def parse(self, content):
+        text = decode_html(content)
+        if not text.strip():
+            return None
+        return self._html.document_fromstring(text)
+
+    def find_all(self, doc, tags, attr=None):
+        if doc is None:
+            return []
+        if isinstance(tags, str):
+            tags = [tags]
+        nodes = doc.iter(*tags)
+        if attr:
+            return [node for node in nodes if attr in node.attrib]
+        return list(nodes)
+
+    def tag(self, node):
+        return node.tag
+
+    def get(self, node, attr, default=None):
+        return node.attrib.get(attr, default)
+
+    def strings(self, node):
+        # Di bs4, teks di dalam <template> (dan script/style) bukan teks biasa
+        for ancestor in node.iterancestors(*NON_TEXT_TAGS):
+            return
+
+        # DFS iteratif: text elemen, lalu tiap anak diikuti tail-nya
+        stack = [node]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                yield item
+                continue
+            if not isinstance(item.tag, str) or item.tag in NON_TEXT_TAGS:
+                continue
+            children = []
+            for child in item:
+                children.append(child)
+                if child.tail:
+                    children.append(child.tail)
+            stack.extend(reversed(children))
+            if item.text:
+                yield item.text
+
+    def string(self, node):
+        while True:
+            children = list(node)
+            if not children:
+                return node.text or None
+            if node.text or len(children) > 1 or children[0].tail:
+                return None
+            node = children[0]
+            if not isinstance(node.tag, str):
+                return node.text  # komentar juga dihitung string oleh bs4
+
+    def outer_html(self, node):
+        return self._html.tostring(node, encoding='unicode', with_tail=False)
+
+    def select(self, doc, selector):
+        if doc is None:
+            return []
+        return doc.cssselect(selector)
+
+
+class SelectolaxBackend(ParserBackend):
+    name = 'selectolax'
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self._parser = LexborHTMLParser
+
+    def parse(self, content):
+        return self._parser(decode_html(content))
+
+    def find_all(self, doc, tags, attr=None):
+        if isinstance(tags, str):
+            tags = [tags]
+        suffix = f'[{attr}]' if attr else ''
+        return doc.css(', '.join(tag + suffix for tag in tags))
+
+    def tag(self, node):
+        return node.tag
+
+    def get(self, node, attr, default=None):
+        attributes = node.attributes
+        if attr not in attributes:
+            return default
+        value = attributes[attr]
+        return '' if value is None else value
+
+    def strings(self, node):
+        stack = []
+        current = node.child
+        while current is not None:
+            tag = current.tag
+            if tag == '-text':
+                yield current.text_content
+            elif (tag not in NON_TEXT_TAGS and not tag.startswith(('-', '!'))
+                  and current.child is not None):
+                if current.next is not None:
+                    stack.append(current.next)
+                current = current.child
+                continue
+            current = current.next
+            if current is None and stack:
+                current = stack.pop()
+
+    def string(self, node):
+        while True:
+            child = node.child
+            if child is None or child.next is not None:
+                return None
+            if child.tag == '-text':
+                return child.text_content
+            if child.tag == '-comment':
+                return child.comment_content  # komentar juga dihitung string oleh bs4
+            node = child
+
+    def outer_html(self, node):
+        return node.html
+
+    def select(self, doc, selector):
+        return doc.css(selector)
+
+
+BACKENDS = {
+    'bs4': Bs4Backend,
+    'lxml': LxmlBackend,
+    'selectolax': SelectolaxBackend,
+}
+
+# Urutan pilihan 'auto': yang tercepat dan terinstall
+_AUTO_ORDER = (('selectolax', 'selectolax'), ('lxml', 'lxml'), ('bs4', 'bs4'))
+
+_instances = {}
+
+
+def available_backends():
+    """Nama backend yang modulnya terinstall"""
+    return [name for name, module in _AUTO_ORDER if importlib.util.find_spec(module) is not None]
+
+
+def get_backend(name='auto'):
+    """Ambil instance backend (di-cache); 'auto' memilih yang tercepat"""
+    if name in (None, 'auto'):
+        installed = available_backends()
+        name = installed[0] if installed else 'bs4'
+    if name not in BACKENDS:
+        raise ValueError(f"Parser tidak dikenal: {name}")
+    if name not in _instances:
+        _instances[name] = BACKENDS[name]()
+    return _instances[name]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Pipeline parsing multi-core - fetch (thread, I/O) -> parse (process pool, CPU)
+
+Parsing HTML terikat GIL, jadi dengan thread saja satu batch hanya memakai
+satu core. ParsePool mengirim bytes hasil download ke process pool dan
+membatasi jumlah job yang menunggu: jika antrian penuh, thread fetch
+menunggu (backpressure) sehingga memory tetap terbatas.
+"""
+
+import os
+import threading
+
+from .extractor import extract
+from .metrics import RequestTiming
+
+
+def compact(results):
+    """Ubah list dict hasil extractor menjadi tuple ringkas untuk dikirim antar proses
+
+    Setiap item menjadi (type, content, nama, nilai); item dengan lebih dari
+    satu field tambahan (mis. tabel) menyimpan tuple pasangan (nama, nilai)
+    di posisi nama dan None di posisi nilai.
+    """
+    rows = []
+    for result in results:
+        extra = [(key, value) for key, value in result.items() if key not in ('type', 'content')]
+        if len(extra) > 1:
+            name, value = tuple(extra), None
+        else:
+            name, value = extra[0] if extra else (None, None)
+        rows.append((result['type'], result['content'], name, value))
+    return rows
+
+
+def expand(rows):
+    """Kebalikan compact(): tuple -> dict seperti output extractor"""
+    results = []
+    for type_, content, name, value in rows:
+        item = {'type': type_, 'content': content}
+        if isinstance(name, tuple):
+            item.update(name)
+        elif name is not None:
+            item[name] = value
+        results.append(item)
+    return results
+
+
+def extract_compact(url, content, mode, selector, parser):
+    """Dijalankan di proses worker: parse + extract, return (tuple ringkas, waktu per fase)"""
+    with RequestTiming() as timing:
+        rows = compact(extract(url, content, mode, selector, parser))
+    return rows, timing.phases
+
+
+def resolve_workers(workers):
+    """0 = tanpa process pool, angka negatif = semua core"""
+    workers = int(workers or 0)
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+class ParsePool:
+    """Process pool untuk parse/extract dengan antrian terbatas"""
+
+    def __init__(self, workers, queue_size=None):
+        self.workers = resolve_workers(workers)
+        self.queue_size = queue_size or self.workers * 2
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        # multiprocessing baru dimuat jika process pool benar-benar dipakai
+        from concurrent.futures import ProcessPoolExecutor
+
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def submit(self, url, content, mode, selector=None, parser='auto'):
+        """Kirim satu dokumen; blok jika antrian penuh. Return Future berisi (rows, fase)"""
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(extract_compact, url, content, mode, selector, parser)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self, cancel=False):
+        self._pool.shutdown(wait=True, cancel_futures=cancel)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        self.shutdown(cancel=exc_type is not None)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+RecordTable - penyimpanan item hasil scraping dalam bentuk kolom
+
+List dict per item boros: setiap dict membawa hash table sendiri dan string
+url/timestamp/type yang sama berulang jutaan kali pada crawl yang banyak
+link-nya. Di sini setiap field disimpan sebagai satu kolom:
+
+- url dan type di-encode dengan kamus (array kode int + list nilai unik)
+- timestamp disimpan sebagai int (detik, waktu lokal tanpa zona)
+- content dan field tambahan berupa list biasa
+
+Baris dibaca lewat Record (view ber-__slots__) yang berperilaku seperti
+dict read-only, jadi kode GUI/export tetap memakai item['url'] dst.
+"""
+
+import calendar
+import time
+from array import array
+from collections.abc import Mapping
+
+BASE_FIELDS = ('url', 'timestamp', 'type', 'content')
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class TimestampCodec:
+    """Konversi timestamp string <-> int dengan cache nilai terakhir
+
+    Semua item dari satu halaman memakai timestamp yang sama, jadi parsing
+    string hanya terjadi sekali per halaman.
+    """
+
+    def __init__(self):
+        self._last_text = None
+        self._last_value = None
+
+    def encode(self, text):
+        if text is None:
+            return 0
+        if isinstance(text, int):
+            return text
+        if text != self._last_text:
+            self._last_value = calendar.timegm(time.strptime(text, TIMESTAMP_FORMAT))
+            self._last_text = text
+        return self._last_value
+
+    @staticmethod
+    def decode(value):
+        return time.strftime(TIMESTAMP_FORMAT, time.gmtime(value))
+
+
+class Dictionary:
+    """Kamus nilai unik -> kode int (urutan sesuai kemunculan pertama)"""
+
+    __slots__ = ('values', '_codes')
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def encode(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __len__(self):
+        return len(self.values)
+
+
+class Record(Mapping):
+    """View satu baris RecordTable; tidak menyalin data"""
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, field):
+        return self._table.value(self._index, field)
+
+    def __iter__(self):
+        table = self._table
+        for field in table.fields:
+            if field in BASE_FIELDS or table._extras[field][self._index] is not None:
+                yield field
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"Record({dict(self)!r})"
+
+
+class RecordTable:
+    """Tabel item hasil scraping berbasis kolom"""
+
+    def __init__(self, items=()):
+        self._urls = Dictionary()
+        self._types = Dictionary()
+        self._url_codes = array('i')
+        self._type_codes = array('b')
+        self._timestamps = array('q')
+        self._content = []
+        self._extras = {}   # nama field -> list sejajar baris (None = tidak ada)
+        self._codec = TimestampCodec()
+        self.extend(items)
+
+    # --- Tambah data ---
+
+    def append(self, item):
+        self.append_row(item['url'], item['timestamp'], item['type'], item.get('content'),
+                        {key: value for key, value in item.items() if key not in BASE_FIELDS})
+
+    def append_row(self, url, timestamp, type_, content, extra=None):
+        """Tambah satu baris dari nilai kolom (timestamp boleh string atau int)"""
+        index = len(self._content)
+        self._url_codes.append(self._urls.encode(url))
+        self._type_codes.append(self._types.encode(type_))
+        self._timestamps.append(self._codec.encode(timestamp))
+        self._content.append(content)
+        if extra:
+            for key in extra:
+                if key not in self._extras:
+                    self._extras[key] = [None] * index
+        for key, column in self._extras.items():
+            column.append(extra.get(key) if extra else None)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def clear(self):
+        self.__init__()
+
+    # --- Akses data ---
+
+    def __len__(self):
+        return len(self._content)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Record(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return Record(self, index)
+
+    def __iter__(self):
+        return (Record(self, i) for i in range(len(self)))
+
+    @property
+    def fields(self):
+        return list(BASE_FIELDS) + list(self._extras)
+
+    def value(self, index, field):
+        if field == 'url':
+            return self._urls.values[self._url_codes[index]]
+        if field == 'type':
+            return self._types.values[self._type_codes[index]]
+        if field == 'timestamp':
+            return self._codec.decode(self._timestamps[index])
+        if field == 'content':
+            return self._content[index]
+        value = self._extras[field][index]
+        if value is None:
+            raise KeyError(field)
+        return value
+
+    def unique_urls(self):
+        return len(self._urls)
+
+    def as_dicts(self):
+        """Salinan berupa list dict (untuk kode lama / JSON)"""
+        return [dict(record) for record in self]
+
+    def nbytes(self):
+        """Perkiraan ukuran kolom numerik + pointer list (tanpa isi string)"""
+        arrays = (self._url_codes, self._type_codes, self._timestamps)
+        pointers = 8 * len(self) * (1 + len(self._extras))
+        return sum(a.itemsize * len(a) for a in arrays) + pointers
+
+    # --- Konversi ---
+
+    def to_pandas(self):
+        """DataFrame dengan url/type categorical dan timestamp datetime64
+
+        Kolom kode dan timestamp memakai buffer array yang sama (zero-copy);
+        selama DataFrame masih dipakai, tabel tidak bisa ditambah baris.
+        """
+        import numpy as np
+        import pandas as pd
+
+        codes = np.frombuffer(self._url_codes, dtype=np.int32)
+        type_codes = np.frombuffer(self._type_codes, dtype=np.int8)
+        timestamps = np.frombuffer(self._timestamps, dtype=np.int64).view('datetime64[s]')
+        columns = {
+            'url': pd.Categorical.from_codes(codes, categories=pd.Index(self._urls.values, dtype=object)),
+            'timestamp': timestamps,
+            'type': pd.Categorical.from_codes(type_codes, categories=pd.Index(self._types.values, dtype=object)),
+            'content': self._content,
+        }
+        columns.update(self._extras)
+        return pd.DataFrame(columns, copy=False)
+
+    def to_arrow(self):
+        """pyarrow.Table dengan kolom dictionary; butuh pyarrow"""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow belum terinstall. Install dengan: pip install pyarrow")
+
+        def dictionary(codes, values, type_):
+            indices = pa.Array.from_buffers(type_, len(codes), [None, pa.py_buffer(codes)])
+            return pa.DictionaryArray.from_arrays(indices, pa.array(values, pa.string()))
+
+        timestamps = pa.Array.from_buffers(pa.timestamp('s'), len(self._timestamps),
+                                           [None, pa.py_buffer(self._timestamps)])
+        columns = {
+            'url': dictionary(self._url_codes, self._urls.values, pa.int32()),
+            'timestamp': timestamps,
+            'type': dictionary(self._type_codes, self._types.values, pa.int8()),
+            'content': pa.array(self._content, pa.string()),
+        }
+        for name, column in self._extras.items():
+            columns[name] = pa.array(column)
+        return pa.table(columns)
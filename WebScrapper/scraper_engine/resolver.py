@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+DnsCache & Prewarmer - DNS dan koneksi host berikutnya disiapkan lebih awal
+
+Tanpa cache, setiap koneksi baru memanggil getaddrinfo() sistem yang
+blocking. DnsCache menyimpan hasilnya di memory per host selama `ttl`
+(getaddrinfo tidak memberi TTL record DNS, jadi TTL-nya tetap), termasuk
+host yang gagal di-resolve (`negative_ttl`) supaya ribuan URL ke domain
+mati tidak masing-masing menunggu timeout DNS. install() memasang cache
+di socket.getaddrinfo, jadi requests/urllib3, httpx, dan robots.txt ikut
+memakainya tanpa perubahan lain.
+
+Prewarmer dipanggil HostScheduler untuk host yang sebentar lagi
+dijalankan: DNS di-resolve (dan opsional koneksi TCP/TLS dibuka ke pool)
+di thread terpisah, sehingga latency DNS/connect tertutup oleh fetch yang
+sedang berjalan.
+"""
+
+import ipaddress
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from .fetcher import HostScheduler
+from .metrics import record
+
+
+def _is_ip(host):
+    try:
+        ipaddress.ip_address(host.strip('[]'))
+    except ValueError:
+        return False
+    return True
+
+
+class DnsCache:
+    """Cache getaddrinfo() per host dengan TTL (aman dipakai lintas thread)"""
+
+    def __init__(self, ttl=300, negative_ttl=30, max_entries=10000):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.stats = {'hits': 0, 'lookups': 0, 'failures': 0}
+        self._entries = {}      # host -> (expires_at, list addrinfo atau exception)
+        self._lock = threading.Lock()
+        self._locks = {}        # host -> lock supaya satu host tidak di-resolve bersamaan
+        self._original = None   # socket.getaddrinfo asli selama terpasang
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _cached(self, host):
+        entry = self._entries.get(host)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry
+        return None
+
+    def resolve(self, host):
+        """List addrinfo TCP (family, type, proto, canonname, sockaddr) host, port 0
+
+        Raise socket.gaierror jika host tidak bisa di-resolve (juga dari cache).
+        """
+        host = host.lower()
+        entry = self._cached(host)
+        if entry is None:
+            with self._lock:
+                host_lock = self._locks.setdefault(host, threading.Lock())
+            with host_lock:
+                # Thread lain mungkin sudah selesai resolve selama kita menunggu
+                entry = self._cached(host)
+                if entry is None:
+                    entry = self._lookup(host)
+                    return self._result(entry)
+        with self._lock:
+            self.stats['hits'] += 1
+        return self._result(entry)
+
+    @staticmethod
+    def _result(entry):
+        if isinstance(entry[1], Exception):
+            # Exception baru per pemanggil supaya traceback tidak menumpuk
+            raise socket.gaierror(*entry[1].args)
+        return entry[1]
+
+    def _lookup(self, host):
+        lookup = self._original or socket.getaddrinfo
+        start = time.perf_counter()
+        try:
+            result = lookup(host, 0, 0, socket.SOCK_STREAM)
+            entry = (time.monotonic() + self.ttl, result)
+        except socket.gaierror as e:
+            entry = (time.monotonic() + self.negative_ttl, e)
+        record('dns', time.perf_counter() - start)
+        with self._lock:
+            self.stats['lookups'] += 1
+            if isinstance(entry[1], Exception):
+                self.stats['failures'] += 1
+            if len(self._entries) >= self.max_entries:
+                # Buang entry tertua (dict menyimpan urutan insert)
+                oldest = next(iter(self._entries))
+                del self._entries[oldest]
+                self._locks.pop(oldest, None)
+            self._entries.pop(host, None)
+            self._entries[host] = entry
+        return entry
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        """Pengganti socket.getaddrinfo; hanya query TCP biasa yang di-cache
+
+        Query lain (UDP, flags khusus, nama service, IP literal) langsung
+        diteruskan ke getaddrinfo asli.
+        """
+        lookup = self._original or socket.getaddrinfo
+        if (not isinstance(host, str) or _is_ip(host) or type != socket.SOCK_STREAM
+                or proto not in (0, socket.IPPROTO_TCP) or flags
+                or not (port is None or isinstance(port, int) or str(port).isdigit())):
+            return lookup(host, port, family, type, proto, flags)
+        port = int(port or 0)
+        return [(af, kind, protocol, canonname, (sockaddr[0], port) + tuple(sockaddr[2:]))
+                for af, kind, protocol, canonname, sockaddr in self.resolve(host)
+                if family in (0, af)]
+
+    def install(self):
+        """Pasang cache di socket.getaddrinfo (untuk seluruh proses); return self"""
+        with self._lock:
+            if self._original is None:
+                self._original = socket.getaddrinfo
+                socket.getaddrinfo = self.getaddrinfo
+        return self
+
+    def uninstall(self):
+        """Kembalikan socket.getaddrinfo asli"""
+        with self._lock:
+            if self._original is not None:
+                if socket.getaddrinfo == self.getaddrinfo:
+                    socket.getaddrinfo = self._original
+                self._original = None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class Prewarmer:
+    """Siapkan host yang sebentar lagi di-fetch di thread latar belakang
+
+    warm(url) tidak blocking (aman dipanggil dari dalam lock scheduler).
+    DNS di-resolve lewat `dns`; dengan connect=True koneksi TCP/TLS juga
+    dibuka dan disimpan di pool HttpClient. Kegagalan diabaikan: error
+    yang sebenarnya tetap muncul saat fetch.
+    """
+
+    def __init__(self, http, dns=None, connect=False, workers=8, timeout=10):
+        self.http = http
+        self.dns = dns
+        self.connect = connect
+        self.timeout = timeout
+        self.stats = {'hosts': 0, 'connections': 0, 'failures': 0}
+        self._pool = ThreadPoolExecutor(max_workers=max(1, int(workers)),
+                                        thread_name_prefix='prewarm')
+        self._lock = threading.Lock()
+        self._pending = set()   # host yang sedang disiapkan
+
+    def warm(self, url):
+        host = HostScheduler.host_of(url)
+        with self._lock:
+            if host in self._pending:
+                return
+            self._pending.add(host)
+        self._pool.submit(self._warm, host, url)
+
+    def _warm(self, host, url):
+        try:
+            hostname = urlparse(url).hostname
+            if self.dns is not None and hostname and not _is_ip(hostname):
+                self.dns.resolve(hostname)
+            if self.connect and self.http.preconnect(url, timeout=self.timeout):
+                with self._lock:
+                    self.stats['connections'] += 1
+            with self._lock:
+                self.stats['hosts'] += 1
+        except Exception:
+            with self._lock:
+                self.stats['failures'] += 1
+        finally:
+            with self._lock:
+                self._pending.discard(host)
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
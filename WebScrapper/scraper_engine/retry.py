@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Retry dan kontrol laju per host
+
+- classify_error: kelompokkan error (timeout, koneksi, throttled, server, ...)
+- RetryPolicy: backoff eksponensial dengan jitter, menghormati Retry-After
+- RateController: AIMD per host - delay digandakan saat host menolak
+  (429/503/timeout), lalu dikurangi sedikit demi sedikit selama sukses
+- FailureReport: daftar URL yang akhirnya gagal, untuk laporan di akhir run
+- RetryHandler: gabungan di atas, dipakai scrape_many dan Crawler
+"""
+
+import csv
+import random
+import threading
+
+from .fetcher import DownloadRejected, HostScheduler, HttpError
+from .robots import RobotsDisallowed
+
+RETRYABLE = frozenset(('timeout', 'connection', 'throttled', 'server'))
+
+_TIMEOUT_NAMES = frozenset(('Timeout', 'ReadTimeout', 'ConnectTimeout', 'TimeoutException',
+                            'TimeoutError', 'timeout'))
+_CONNECTION_NAMES = frozenset(('ConnectionError', 'ConnectError', 'NetworkError',
+                               'RemoteProtocolError', 'ChunkedEncodingError'))
+
+
+def classify_error(error):
+    """Kategori error: robots, rejected, throttled, server, client, timeout, connection, other"""
+    if isinstance(error, RobotsDisallowed):
+        return 'robots'
+    if isinstance(error, DownloadRejected):
+        return 'rejected'
+    if isinstance(error, HttpError):
+        if error.status in (429, 503):
+            return 'throttled'
+        return 'server' if error.status >= 500 else 'client'
+    names = {cls.__name__ for cls in type(error).__mro__}
+    if names & _TIMEOUT_NAMES:
+        return 'timeout'
+    if names & _CONNECTION_NAMES:
+        return 'connection'
+    return 'other'
+
+
+class RetryPolicy:
+    """Backoff eksponensial dengan full jitter: acak(0, min(cap, base * 2^n))"""
+
+    def __init__(self, max_retries=3, base=1.0, cap=60.0, max_retry_after=300.0):
+        self.max_retries = max(0, int(max_retries))
+        self.base = base
+        self.cap = cap
+        self.max_retry_after = max_retry_after
+
+    def wait(self, attempt, retry_after=None):
+        """Lama menunggu sebelum percobaan ke-(attempt + 1)"""
+        backoff = random.uniform(0, min(self.cap, self.base * (2 ** attempt)))
+        if retry_after is not None:
+            return max(backoff, min(retry_after, self.max_retry_after))
+        return backoff
+
+
+class RateController:
+    """Delay adaptif per host (AIMD pada laju request)
+
+    Saat throttled, delay dikali dua (laju dibagi dua, minimal 1 detik).
+    Setiap request sukses menaikkan laju sebesar `increase` request/detik
+    sampai delay kembali ke batas bawah (delay global atau Crawl-delay).
+    """
+
+    def __init__(self, min_delay=0.0, max_delay=60.0, increase=0.1):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.increase = increase
+        self._delay = {}    # host -> delay saat ini
+        self._floor = {}    # host -> batas bawah (Crawl-delay)
+        self._lock = threading.Lock()
+
+    def floor(self, host):
+        return max(self.min_delay, self._floor.get(host, 0.0))
+
+    def set_floor(self, host, delay):
+        with self._lock:
+            self._floor[host] = float(delay)
+
+    def delay(self, host):
+        return max(self.floor(host), self._delay.get(host, 0.0))
+
+    def on_success(self, host):
+        with self._lock:
+            delay = self._delay.get(host)
+            if not delay:
+                return
+            delay = 1.0 / (1.0 / delay + self.increase)
+            if delay <= self.floor(host):
+                del self._delay[host]
+            else:
+                self._delay[host] = delay
+
+    def on_throttle(self, host):
+        with self._lock:
+            current = max(self.floor(host), self._delay.get(host, 0.0))
+            self._delay[host] = min(self.max_delay, max(1.0, current * 2))
+
+
+class FailureReport:
+    """Kumpulan URL yang gagal setelah semua percobaan"""
+
+    FIELDS = ('url', 'category', 'attempts', 'error')
+
+    def __init__(self):
+        self.entries = []
+
+    def add(self, url, error, attempts):
+        self.entries.append({'url': url, 'category': classify_error(error),
+                             'attempts': attempts, 'error': str(error)})
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def counts(self):
+        """Jumlah kegagalan per kategori"""
+        counts = {}
+        for entry in self.entries:
+            counts[entry['category']] = counts.get(entry['category'], 0) + 1
+        return counts
+
+    def summary(self):
+        return ', '.join(f"{category}: {count}" for category, count in
+                         sorted(self.counts().items(), key=lambda kv: -kv[1]))
+
+    def write_csv(self, path):
+        with open(path, 'w', newline='', encoding='utf-8') as handle:
+            writer = csv.DictWriter(handle, fieldnames=self.FIELDS)
+            writer.writeheader()
+            writer.writerows(self.entries)
+
+
+class RetryHandler:
+    """Retry + AIMD untuk satu run HostScheduler
+
+    Dipanggil dari thread pemanggil scheduler (on_result), kecuali
+    set_crawl_delay yang boleh dipanggil dari worker.
+    """
+
+    def __init__(self, scheduler, policy=None, rate=None):
+        self.scheduler = scheduler
+        self.policy = policy or RetryPolicy()
+        self.rate = rate or RateController(min_delay=scheduler.delay)
+        self.report = FailureReport()
+        self.retries = 0
+        self._attempts = {}
+
+    def set_crawl_delay(self, url, delay):
+        host = HostScheduler.host_of(url)
+        self.rate.set_floor(host, delay)
+        self.scheduler.set_host_delay(host, self.rate.delay(host))
+
+    def success(self, url):
+        host = HostScheduler.host_of(url)
+        self._attempts.pop(url, None)
+        self.rate.on_success(host)
+        self.scheduler.set_host_delay(host, self.rate.delay(host))
+
+    def retry(self, url, error, should_continue=lambda: True):
+        """Jadwalkan ulang URL jika error bisa di-retry; return True jika dijadwalkan
+
+        Jika tidak, URL dicatat di laporan kegagalan.
+        """
+        host = HostScheduler.host_of(url)
+        category = classify_error(error)
+        attempt = self._attempts.get(url, 0)
+        if category in ('throttled', 'timeout'):
+            self.rate.on_throttle(host)
+            self.scheduler.set_host_delay(host, self.rate.delay(host))
+
+        if category in RETRYABLE and attempt < self.policy.max_retries and should_continue():
+            self._attempts[url] = attempt + 1
+            self.retries += 1
+            wait = self.policy.wait(attempt, getattr(error, 'retry_after', None))
+            self.scheduler.defer_host(host, wait)
+            self.scheduler.add(url, front=True)
+            return True
+
+        self._attempts.pop(url, None)
+        self.report.add(url, error, attempt + 1)
+        return False
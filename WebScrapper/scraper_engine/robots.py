@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+RobotsPolicy - cache robots.txt per host untuk semua cek dan fetch
+
+robots.txt setiap host hanya di-download sekali per `ttl`. Cek berikutnya
+cukup satu lookup dict, jadi engine bisa memanggil can_fetch() sebelum
+setiap request. Host yang robots.txt-nya gagal diambil (timeout, DNS, 5xx)
+juga di-cache, dengan TTL lebih pendek (`error_ttl`), supaya tidak dicoba
+ulang di setiap URL.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .fetcher import HostScheduler, robots_url_for
+
+
+class RobotsDisallowed(Exception):
+    """URL dilarang oleh robots.txt"""
+
+    def __init__(self, url):
+        super().__init__(f"Diblokir robots.txt: {url}")
+        self.url = url
+
+
+class RobotsEntry:
+    """Hasil robots.txt satu host
+
+    status = kode HTTP (None jika request gagal), text = isi robots.txt
+    (hanya jika status 200), error = exception jika request gagal.
+    """
+
+    __slots__ = ('robots_url', 'parser', 'status', 'text', 'error', 'expires_at')
+
+    def __init__(self, robots_url, parser, status=None, text='', error=None, expires_at=0.0):
+        self.robots_url = robots_url
+        self.parser = parser
+        self.status = status
+        self.text = text
+        self.error = error
+        self.expires_at = expires_at
+
+    @property
+    def found(self):
+        return self.status == 200
+
+    def can_fetch(self, url, user_agent='*'):
+        return self.parser.can_fetch(user_agent, url)
+
+    def crawl_delay(self, user_agent='*'):
+        """Crawl-delay (atau Request-rate yang dikonversi) dalam detik, atau None"""
+        delay = self.parser.crawl_delay(user_agent)
+        if delay:
+            return float(delay)
+        rate = self.parser.request_rate(user_agent)
+        if rate and rate.requests:
+            return rate.seconds / rate.requests
+        return None
+
+    def sitemaps(self):
+        return self.parser.site_maps() or []
+
+
+class RobotsCheck:
+    """Hasil cek robots.txt satu URL (dipakai batch checker)"""
+
+    __slots__ = ('url', 'host', 'allowed', 'crawl_delay', 'status', 'error')
+
+    def __init__(self, url, host, allowed=None, crawl_delay=None, status=None, error=None):
+        self.url = url
+        self.host = host
+        self.allowed = allowed
+        self.crawl_delay = crawl_delay
+        self.status = status
+        self.error = error
+
+    @property
+    def outcome(self):
+        """'allowed', 'blocked', atau 'error'"""
+        if self.error is not None:
+            return 'error'
+        return 'allowed' if self.allowed else 'blocked'
+
+
+class RobotsPolicy:
+    """Cache kebijakan robots.txt per host (aman dipakai lintas thread)
+
+    Aturan status mengikuti HttpClient.fetch_robots: 401/403 = semua
+    dilarang, 4xx lainnya = semua boleh, 5xx = dilarang sementara. Jika
+    robots.txt tidak bisa diambil sama sekali, semua URL dianggap boleh.
+    """
+
+    def __init__(self, http, ttl=3600, error_ttl=300, timeout=10):
+        self.http = http
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.timeout = timeout
+        self._entries = {}      # robots_url -> RobotsEntry
+        self._locks = {}        # robots_url -> Lock, supaya satu host di-fetch sekali
+        self._lock = threading.Lock()
+
+    def entry(self, url, user_agent='EasyScraper/1.0', timeout=None):
+        """RobotsEntry untuk host dari URL; download jika belum ada/kedaluwarsa"""
+        robots_url = robots_url_for(url)
+        entry = self._entries.get(robots_url)
+        if entry is not None and entry.expires_at > time.monotonic():
+            return entry
+
+        with self._lock:
+            host_lock = self._locks.setdefault(robots_url, threading.Lock())
+        with host_lock:
+            # Thread lain mungkin sudah selesai fetch selama kita menunggu
+            entry = self._entries.get(robots_url)
+            if entry is not None and entry.expires_at > time.monotonic():
+                return entry
+            entry = self._fetch(robots_url, user_agent, timeout or self.timeout)
+            self._entries[robots_url] = entry
+            return entry
+
+    def _fetch(self, robots_url, user_agent, timeout):
+        try:
+            parser, response = self.http.fetch_robots(robots_url, user_agent=user_agent,
+                                                      timeout=timeout)
+        except Exception as e:
+            from urllib.robotparser import RobotFileParser
+
+            parser = RobotFileParser(robots_url)
+            parser.allow_all = True
+            return RobotsEntry(robots_url, parser, error=e,
+                               expires_at=time.monotonic() + self.error_ttl)
+
+        ttl = self.error_ttl if response.status_code >= 500 else self.ttl
+        text = response.text if response.status_code == 200 else ''
+        return RobotsEntry(robots_url, parser, response.status_code, text,
+                           expires_at=time.monotonic() + ttl)
+
+    def can_fetch(self, url, user_agent='*'):
+        return self.entry(url).can_fetch(url, user_agent)
+
+    def crawl_delay(self, url, user_agent='*'):
+        return self.entry(url).crawl_delay(user_agent)
+
+    def invalidate(self, url=None):
+        """Lupakan robots.txt satu host (atau semua jika url=None)"""
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(robots_url_for(url), None)
+
+    def check(self, url, rules_agent='*', user_agent='EasyScraper/1.0', timeout=None):
+        """Cek satu URL; error jaringan dikembalikan di RobotsCheck.error"""
+        entry = self.entry(url, user_agent, timeout)
+        host = HostScheduler.host_of(url)
+        if entry.error is not None:
+            return RobotsCheck(url, host, status=entry.status, error=entry.error)
+        return RobotsCheck(url, host, entry.can_fetch(url, rules_agent),
+                           entry.crawl_delay(rules_agent), entry.status)
+
+    def check_many(self, urls, rules_agent='*', user_agent='EasyScraper/1.0', workers=16,
+                   timeout=None, on_result=None, should_continue=lambda: True):
+        """Cek banyak URL secara paralel (setiap URL biasanya host berbeda)
+
+        on_result(index, RobotsCheck) dipanggil di thread pemanggil begitu
+        satu cek selesai. Return list RobotsCheck sesuai urutan input
+        (None untuk URL yang tidak sempat dicek karena dihentikan).
+        """
+        results = [None] * len(urls)
+        pool = ThreadPoolExecutor(max_workers=max(1, int(workers)))
+        try:
+            futures = {pool.submit(self.check, url, rules_agent, user_agent, timeout): index
+                       for index, url in enumerate(urls)}
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                if on_result:
+                    on_result(index, results[index])
+                if not should_continue():
+                    break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return results
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Result sink - tujuan penyimpanan item hasil scraping
+"""
+
+import json
+import sys
+
+
+class ResultSink:
+    """Base class sink; engine memanggil add_many() dari satu thread saja"""
+
+    def add_many(self, items):
+        raise NotImplementedError
+
+    def add_result(self, url, items, error=None):
+        """Hasil satu URL (items dari engine, atau error jika gagal)
+
+        Default hanya menyimpan items; JobStore memakainya untuk mencatat
+        status per URL dalam transaksi yang sama.
+        """
+        if error is None:
+            self.add_many(items)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ListSink(ResultSink):
+    """Simpan item ke list di memory (dipakai GUI)"""
+
+    def __init__(self, items=None):
+        self.items = items if items is not None else []
+
+    def add_many(self, items):
+        self.items.extend(items)
+
+
+class JsonlSink(ResultSink):
+    """Tulis item sebagai JSON lines ke file atau stdout"""
+
+    def __init__(self, path=None):
+        self.path = path
+        if path in (None, '-'):
+            self._file = sys.stdout
+        else:
+            self._file = open(path, 'a', encoding='utf-8')
+
+    def add_many(self, items):
+        for item in items:
+            self._file.write(json.dumps(item, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def close(self):
+        if self._file is not sys.stdout:
+            self._file.close()
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""
+Sitemap - temukan URL halaman dari sitemap.xml tanpa crawling
+
+Sitemap dibaca per chunk selama download: XMLPullParser (iterparse versi
+push) mengeluarkan setiap <url> begitu tag-nya tertutup lalu elemennya
+langsung dibuang, jadi sitemap 50.000 URL tetap memakai memory konstan.
+File .gz didekompresi bertahap dengan zlib (dibatasi MAX_SITEMAP_BYTES).
+
+Sitemap index diikuti sampai `max_depth`, dan dengan `since` hanya URL
+yang lastmod-nya sama atau lebih baru yang diambil; child sitemap yang
+lastmod-nya lebih lama bahkan tidak di-download. Sitemap format teks
+(satu URL per baris) juga didukung.
+"""
+
+import os
+import re
+import time
+import zlib
+from collections import deque
+from datetime import date, datetime, timedelta, timezone
+from urllib.parse import urlsplit
+from xml.etree.ElementTree import XMLPullParser
+
+from .crawl import BloomFilter, canonicalize_url
+from .fetcher import CHUNK_SIZE, HostScheduler, normalize_url
+
+# Batas protokol sitemap: 50.000 URL / 50 MB tanpa kompresi
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+_W3C_DATETIME = re.compile(
+    r'^(\d{4})(?:-(\d{2})(?:-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?\s*(Z|[+-]\d{2}:?\d{2})?)?)?)?$')
+
+
+def parse_lastmod(text):
+    """Tanggal W3C Datetime (2024, 2024-05-01, 2024-05-01T10:00+07:00) -> datetime UTC, atau None
+
+    Tanggal tanpa zona waktu dianggap UTC.
+    """
+    match = _W3C_DATETIME.match(text.strip()) if text else None
+    if not match:
+        return None
+    year, month, day, hour, minute, second, zone = match.groups()
+    try:
+        value = datetime(int(year), int(month or 1), int(day or 1), int(hour or 0),
+                         int(minute or 0), int(second or 0), tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    if zone and zone != 'Z':
+        digits = zone[1:].replace(':', '')
+        offset = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        value = value - offset if zone[0] == '+' else value + offset
+    return value
+
+
+def to_utc(value):
+    """datetime/date/teks -> datetime UTC (untuk parameter since)"""
+    if value is None or isinstance(value, datetime):
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+    parsed = parse_lastmod(str(value))
+    if parsed is None:
+        raise ValueError(f"Format tanggal tidak dikenal: {value} (contoh: 2024-05-01)")
+    return parsed
+
+
+def is_sitemap_url(url):
+    """True jika URL/path terlihat seperti file sitemap, bukan halaman situs"""
+    path = url.split('?', 1)[0].lower()
+    return path.endswith(('.xml', '.xml.gz', '.gz', '.txt')) or 'sitemap' in path.rsplit('/', 1)[-1]
+
+
+def is_remote_url(url):
+    return urlsplit(url).scheme.lower() in ('http', 'https')
+
+
+class SitemapEntry:
+    """Satu <url> (kind 'url') atau <sitemap> dari sitemap index (kind 'sitemap')"""
+
+    __slots__ = ('loc', 'lastmod', 'kind')
+
+    def __init__(self, loc, lastmod=None, kind='url'):
+        self.loc = loc
+        self.lastmod = lastmod
+        self.kind = kind
+
+    def __repr__(self):
+        return f"SitemapEntry({self.loc!r}, {self.lastmod!r}, {self.kind!r})"
+
+
+class SitemapParser:
+    """Parser sitemap incremental; feed(chunk) return entry yang sudah lengkap
+
+    Gzip dan format (XML atau teks) dideteksi dari byte pertama, jadi tidak
+    bergantung pada Content-Type atau ekstensi file.
+    """
+
+    def __init__(self, max_bytes=MAX_SITEMAP_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0           # byte setelah dekompresi
+        self._head = b''        # byte awal sampai gzip/format bisa ditentukan
+        self._inflate = None
+        self._format = None     # 'xml' / 'text'
+        self._xml = None
+        self._root = None
+        self._line = b''
+        self._entries = []
+
+    def feed(self, data):
+        if self._head is not None:
+            data = self._head + data
+            if len(data) < 2:
+                self._head = data
+                return []
+            self._head = None
+            if data.startswith(_GZIP_MAGIC):
+                self._inflate = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._inflate is None:
+            self._feed_plain(data)
+        else:
+            # max_length menjaga memory tetap kecil walau rasio kompresinya ekstrem
+            while data:
+                self._feed_plain(self._inflate.decompress(data, CHUNK_SIZE))
+                data = self._inflate.unconsumed_tail
+        return self._take()
+
+    def close(self):
+        """Selesaikan parsing; return entry yang tersisa"""
+        if self._head:
+            head, self._head = self._head, None
+            self._feed_plain(head)
+        if self._inflate is not None:
+            self._feed_plain(self._inflate.flush())
+        if self._format == 'xml':
+            self._xml.close()
+            self._read_events()
+        elif self._format == 'text':
+            self._text_line(self._line)
+            self._line = b''
+        return self._take()
+
+    def _take(self):
+        entries, self._entries = self._entries, []
+        return entries
+
+    def _feed_plain(self, data):
+        if not data:
+            return
+        self.size += len(data)
+        if self.max_bytes and self.size > self.max_bytes:
+            raise ValueError(f"Sitemap lebih dari {self.max_bytes // (1024 * 1024)} MB")
+        if self._format is None:
+            start = data.lstrip(b'\xef\xbb\xbf \t\r\n')
+            if not start:
+                return
+            self._format = 'xml' if start.startswith(b'<') else 'text'
+            if self._format == 'xml':
+                self._xml = XMLPullParser(events=('start', 'end'))
+        if self._format == 'xml':
+            self._xml.feed(data)
+            self._read_events()
+        else:
+            lines = (self._line + data).split(b'\n')
+            self._line = lines.pop()
+            for line in lines:
+                self._text_line(line)
+
+    def _read_events(self):
+        for event, elem in self._xml.read_events():
+            if event == 'start':
+                if self._root is None:
+                    self._root = elem
+                continue
+            kind = elem.tag.rpartition('}')[2]
+            if kind not in ('url', 'sitemap') or elem is self._root:
+                continue
+            loc = lastmod = None
+            for child in elem:
+                name = child.tag.rpartition('}')[2]
+                if name == 'loc':
+                    loc = (child.text or '').strip()
+                elif name == 'lastmod':
+                    lastmod = parse_lastmod(child.text or '')
+            if loc:
+                self._entries.append(SitemapEntry(loc, lastmod, kind))
+            # Buang elemen yang sudah dibaca supaya tree tidak tumbuh
+            self._root.clear()
+
+    def _text_line(self, line):
+        # BOM di awal file ikut di baris pertama
+        line = line.strip().decode('utf-8', 'replace').lstrip('\ufeff')
+        if line.startswith(('http://', 'https://')):
+            self._entries.append(SitemapEntry(line))
+
+
+class _Stop(Exception):
+    """Hentikan download sitemap (max_urls tercapai atau dihentikan)"""
+
+
+class SitemapReader:
+    """Kumpulkan URL halaman dari sitemap untuk scrape_many
+
+    sources boleh berupa URL sitemap (.xml, .xml.gz, .txt), file sitemap
+    lokal, atau URL situs biasa; untuk yang terakhir sitemap dicari di
+    robots.txt (baris Sitemap:) dan jika tidak ada dipakai /sitemap.xml.
+    URL tanpa lastmod ikut diambil kecuali keep_undated=False.
+    """
+
+    def __init__(self, engine, since=None, max_urls=None, max_depth=3, keep_undated=True,
+                 max_bytes=MAX_SITEMAP_BYTES):
+        self.engine = engine
+        self.since = to_utc(since)
+        self.max_urls = max_urls
+        self.max_depth = max_depth
+        self.keep_undated = keep_undated
+        self.max_bytes = max_bytes
+        self.stats = {'sitemaps': 0, 'urls': 0, 'old': 0, 'old_sitemaps': 0, 'duplicates': 0}
+        self.errors = []        # (sitemap, exception)
+        self._last_fetch = {}   # host -> waktu download sitemap terakhir
+
+    def discover(self, source):
+        """Daftar sitemap untuk satu source
+
+        File lokal hanya diterima di sini (source dari pengguna); sitemap
+        dari robots.txt adalah URL dari server dan dicek lagi di read().
+        """
+        if os.path.isfile(source):
+            return [source]
+        url = normalize_url(source)
+        if is_sitemap_url(url):
+            return [url]
+        entry = self.engine.robots.entry(url, self.engine.user_agent)
+        sitemaps = entry.sitemaps()
+        if sitemaps:
+            return list(sitemaps)
+        return [entry.robots_url[:-len('robots.txt')] + 'sitemap.xml']
+
+    def is_old(self, entry):
+        if self.since is None:
+            return False
+        if entry.lastmod is None:
+            return not self.keep_undated
+        return entry.lastmod < self.since
+
+    def read(self, sources, should_continue=lambda: True, on_url=None):
+        """Return list URL halaman (tanpa duplikat) dari semua sources
+
+        on_url(url) dipanggil setiap URL ditemukan. Sitemap yang gagal
+        dicatat di self.errors dan tidak menghentikan sitemap lain.
+        """
+        urls = []
+        seen = BloomFilter()
+        visited = set()
+        queue = deque()         # (sitemap, depth, file lokal dari pengguna)
+        for source in sources:
+            try:
+                if os.path.isfile(source):
+                    queue.append((source, 0, True))
+                else:
+                    queue.extend((sitemap, 0, False) for sitemap in self.discover(source))
+            except Exception as e:
+                self.errors.append((source, e))
+
+        def on_entry(entry, depth):
+            if entry.kind == 'sitemap':
+                if self.is_old(entry):
+                    self.stats['old_sitemaps'] += 1
+                elif depth < self.max_depth:
+                    queue.append((entry.loc, depth + 1, False))
+                return
+            if self.is_old(entry):
+                self.stats['old'] += 1
+                return
+            if not seen.add(canonicalize_url(entry.loc)):
+                self.stats['duplicates'] += 1
+                return
+            urls.append(entry.loc)
+            self.stats['urls'] += 1
+            if on_url:
+                on_url(entry.loc)
+            if self.max_urls and len(urls) >= self.max_urls:
+                raise _Stop()
+
+        while queue and should_continue():
+            sitemap, depth, local = queue.popleft()
+            if sitemap in visited:
+                continue
+            visited.add(sitemap)
+            try:
+                self.read_one(sitemap, lambda entry: on_entry(entry, depth), should_continue,
+                              local)
+            except _Stop:
+                break
+            except Exception as e:
+                self.errors.append((sitemap, e))
+        return urls
+
+    def read_one(self, sitemap, on_entry, should_continue=lambda: True, local=False):
+        """Download satu sitemap; on_entry(SitemapEntry) per entry
+
+        File lokal hanya dibuka dengan local=True. Sitemap dari server
+        (child sitemap index, baris Sitemap: robots.txt) wajib http/https,
+        supaya server tidak bisa membuat reader membaca file di disk.
+        """
+        if not local and not is_remote_url(sitemap):
+            raise ValueError(f"Sitemap bukan URL http/https: {sitemap}")
+        parser = SitemapParser(self.max_bytes)
+
+        def feed(chunk):
+            if not should_continue():
+                raise _Stop()
+            for entry in parser.feed(chunk):
+                on_entry(entry)
+
+        self.stats['sitemaps'] += 1
+        if local:
+            with open(sitemap, 'rb') as handle:
+                for chunk in iter(lambda: handle.read(CHUNK_SIZE), b''):
+                    feed(chunk)
+        else:
+            self._wait_turn(sitemap)
+            self.engine.http.download(sitemap, headers={'User-Agent': self.engine.user_agent},
+                                      timeout=self.engine.timeout, max_bytes=self.max_bytes,
+                                      content_types=None, on_chunk=feed, keep_body=False)
+        for entry in parser.close():
+            on_entry(entry)
+
+    def _wait_turn(self, url):
+        """Delay engine antar download sitemap ke host yang sama"""
+        host = HostScheduler.host_of(url)
+        last = self._last_fetch.get(host)
+        if last is not None:
+            wait = self.engine.delay - (time.monotonic() - last)
+            if wait > 0:
+                time.sleep(wait)
+        self._last_fetch[host] = time.monotonic()
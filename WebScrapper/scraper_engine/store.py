@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+ResultStore - sink streaming ke SQLite dengan jendela kecil di memory
+
+Item ditulis ke disk begitu datang, jadi memory tetap datar berapa pun
+jumlah URL yang di-scrape. GUI hanya memegang `window` item terakhir untuk
+ditampilkan; export dan viewer membaca ulang dari file.
+
+Skema ringkas: url dan type disimpan sekali di tabel kamus, baris item hanya
+memegang id-nya, dan timestamp berupa int (lihat records.TimestampCodec).
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from collections import deque
+
+from .records import BASE_FIELDS, Dictionary, RecordTable, TimestampCodec
+from .sinks import ResultSink
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (id INTEGER PRIMARY KEY, url TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS types (id INTEGER PRIMARY KEY, type TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    url_id INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    type_id INTEGER NOT NULL,
+    content TEXT,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS extra_fields (name TEXT PRIMARY KEY);
+"""
+
+
+class ResultStore(ResultSink):
+    """Penyimpanan item hasil scraping di SQLite (aman dipakai lintas thread)
+
+    path=None membuat file sementara yang dihapus saat close().
+    """
+
+    def __init__(self, path=None, window=1000):
+        self._temporary = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='easyscraper_', suffix='.sqlite')
+            os.close(fd)
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._window = deque(maxlen=window)
+        self._codec = TimestampCodec()
+        self._urls = self._load_dictionary('SELECT url FROM urls ORDER BY id')
+        self._types = self._load_dictionary('SELECT type FROM types ORDER BY id')
+        self._extra_fields = [row[0] for row in self._conn.execute(
+            'SELECT name FROM extra_fields ORDER BY rowid')]
+        self._count = self._conn.execute('SELECT COUNT(*) FROM items').fetchone()[0]
+
+    def _load_dictionary(self, query):
+        dictionary = Dictionary()
+        for (value,) in self._conn.execute(query):
+            dictionary.encode(value)
+        return dictionary
+
+    @staticmethod
+    def _encode(dictionary, value, new_values):
+        """Kode untuk value; nilai yang baru muncul dicatat untuk di-INSERT"""
+        size = len(dictionary)
+        code = dictionary.encode(value)
+        if code == size:
+            new_values.append((code, value))
+        return code
+
+    # --- ResultSink ---
+
+    def add_many(self, items):
+        with self._lock:
+            with self._conn:
+                self._insert(items)
+
+    def _insert(self, items):
+        """INSERT item tanpa commit; pemanggil memegang lock dan transaksi"""
+        rows = []
+        new_fields = []
+        new_urls = []
+        new_types = []
+        for item in items:
+            extra = {key: value for key, value in item.items() if key not in BASE_FIELDS}
+            for key in extra:
+                if key not in self._extra_fields and key not in new_fields:
+                    new_fields.append(key)
+            rows.append((self._encode(self._urls, item['url'], new_urls),
+                         self._codec.encode(item['timestamp']),
+                         self._encode(self._types, item['type'], new_types),
+                         item.get('content'),
+                         json.dumps(extra, ensure_ascii=False) if extra else None))
+            self._window.append(item)
+        if not rows:
+            return
+        if new_urls:
+            self._conn.executemany('INSERT INTO urls (id, url) VALUES (?, ?)', new_urls)
+        if new_types:
+            self._conn.executemany('INSERT INTO types (id, type) VALUES (?, ?)', new_types)
+        self._conn.executemany(
+            'INSERT INTO items (url_id, timestamp, type_id, content, extra) '
+            'VALUES (?, ?, ?, ?, ?)', rows)
+        if new_fields:
+            self._conn.executemany('INSERT OR IGNORE INTO extra_fields (name) VALUES (?)',
+                                   [(name,) for name in new_fields])
+        self._extra_fields.extend(new_fields)
+        self._count += len(rows)
+
+    def close(self):
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.close()
+            self._conn = None
+        if self._temporary:
+            for suffix in ('', '-wal', '-shm'):
+                try:
+                    os.remove(self.path + suffix)
+                except OSError:
+                    pass
+
+    def discard(self):
+        """Tutup lalu hapus file database (juga untuk path yang diberikan user)"""
+        self._temporary = True
+        self.close()
+
+    # --- Akses data ---
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return self.iter_items()
+
+    @property
+    def fields(self):
+        """Semua nama kolom yang pernah muncul (kolom dasar dulu)"""
+        return list(BASE_FIELDS) + list(self._extra_fields)
+
+    def recent(self, limit=50):
+        """Item terakhir dari jendela di memory (tanpa akses disk)"""
+        items = list(self._window)
+        return items[-limit:] if limit else items
+
+    def _iter_row_batches(self, batch_size):
+        """List baris mentah (id, url_id, timestamp, type_id, content, extra) per batch"""
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    'SELECT id, url_id, timestamp, type_id, content, extra FROM items '
+                    'WHERE id > ? ORDER BY id LIMIT ?', (last_id, batch_size)).fetchall()
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1][0]
+
+    def _iter_rows(self, batch_size):
+        """Baris mentah (url_id, timestamp, type_id, content, extra) per batch"""
+        for rows in self._iter_row_batches(batch_size):
+            for row in rows:
+                yield row[1:]
+
+    def iter_batches(self, batch_size=10000, fields=None):
+        """List tuple nilai sesuai urutan `fields` (default self.fields), per batch
+
+        Dipakai export: tidak membuat dict per item, dan timestamp yang sama
+        (satu halaman) hanya di-format sekali.
+        """
+        urls, types, decode = self._urls.values, self._types.values, self._codec.decode
+        extra_fields = list(fields or self.fields)[len(BASE_FIELDS):]
+        last_timestamp = last_text = None
+        for rows in self._iter_row_batches(batch_size):
+            batch = []
+            for _, url_id, timestamp, type_id, content, extra in rows:
+                if timestamp != last_timestamp:
+                    last_timestamp, last_text = timestamp, decode(timestamp)
+                row = (urls[url_id], last_text, types[type_id], content)
+                if extra_fields:
+                    extra = json.loads(extra) if extra else {}
+                    row += tuple(extra.get(name) for name in extra_fields)
+                batch.append(row)
+            yield batch
+
+    def _to_item(self, row):
+        url_id, timestamp, type_id, content, extra = row
+        item = {'url': self._urls.values[url_id], 'timestamp': self._codec.decode(timestamp),
+                'type': self._types.values[type_id], 'content': content}
+        if extra:
+            item.update(json.loads(extra))
+        return item
+
+    def iter_items(self, batch_size=1000):
+        """Iterasi semua item (dict) sesuai urutan masuk, dibaca per batch dari disk"""
+        for row in self._iter_rows(batch_size):
+            yield self._to_item(row)
+
+    def page(self, offset, limit):
+        """Item ke-offset s/d offset+limit (0-based) tanpa memuat data lain
+
+        Item tidak pernah dihapus satu per satu, jadi id berurutan dan satu
+        halaman cukup dicari lewat index primary key.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT url_id, timestamp, type_id, content, extra FROM items '
+                'WHERE id >= (SELECT MIN(id) FROM items) + ? ORDER BY id LIMIT ?',
+                (offset, limit)).fetchall()
+        return [self._to_item(row) for row in rows]
+
+    def to_table(self, batch_size=10000):
+        """Muat semua item ke RecordTable (kolom ringkas di memory)"""
+        table = RecordTable()
+        urls, types = self._urls.values, self._types.values
+        for url_id, timestamp, type_id, content, extra in self._iter_rows(batch_size):
+            table.append_row(urls[url_id], timestamp, types[type_id], content,
+                             json.loads(extra) if extra else None)
+        return table
+
+    def to_pandas(self):
+        """DataFrame semua item (lewat RecordTable, kolom url/type categorical)"""
+        return self.to_table().to_pandas()
+
+    def unique_urls(self):
+        """Jumlah URL unik, langsung dari ukuran kamus url"""
+        return len(self._urls)
+
+    def clear(self):
+        with self._lock:
+            with self._conn:
+                for table in ('items', 'urls', 'types', 'extra_fields'):
+                    self._conn.execute(f'DELETE FROM {table}')
+            self._urls = Dictionary()
+            self._types = Dictionary()
+            self._extra_fields = []
+            self._count = 0
+            self._window.clear()
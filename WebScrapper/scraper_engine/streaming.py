@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming extractor - teks, link, dan gambar dalam satu pass tanpa membangun DOM
+
+Parser dipakai dalam mode event (start/end/data), jadi memory tidak
+bergantung pada ukuran tree. Setiap text node hanya masuk ke satu blok:
+blok terdalam dari `block_tags` yang sedang terbuka. Dengan begitu teks
+paragraf di dalam div bersarang tidak lagi muncul berkali-kali. Tag
+inline (span) hanya menjadi blok jika tidak ada blok yang terbuka; di
+dalam paragraf teksnya tetap bagian dari kalimat paragraf itu.
+"""
+
+import codecs
+import importlib.util
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from .parsers import META_CHARSET, NON_TEXT_TAGS
+from .tables import TableExtractor
+
+TEXT_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'span', 'div')
+BASIC_TEXT_TAGS = ('p', 'h1', 'h2', 'h3')
+INLINE_TAGS = frozenset(('span',))
+
+STREAM_MODES = ('text', 'links', 'images', 'tables', 'basic')
+
+
+class StreamExtractor:
+    """Target parser (API start/end/data/close ala lxml) yang mengumpulkan item"""
+
+    def __init__(self, base_url, block_tags=(), min_length=10, max_length=None,
+                 include_tag=True, links=False, link_requires_text=False, images=False):
+        self.base_url = base_url
+        self.block_tags = frozenset(block_tags)
+        self.min_length = min_length
+        self.max_length = max_length
+        self.include_tag = include_tag
+        self.collect_links = links
+        self.link_requires_text = link_requires_text
+        self.collect_images = images
+
+        self._texts = []        # slot per blok, urutan sesuai tag pembuka
+        self._blocks = []       # stack (tag, index slot, parts)
+        self._inline = {}       # tag inline terbuka di dalam blok -> jumlah (bukan blok sendiri)
+        self._links = []        # stack (href, slot, parts) untuk <a> yang terbuka
+        self._link_items = []
+        self._image_items = []
+        self._skip = 0          # kedalaman di dalam script/style/template
+        self._pending = []      # potongan data dari satu text node
+
+    # --- API target ---
+
+    def start(self, tag, attrs):
+        self._flush_text()
+        tag = tag.lower() if isinstance(tag, str) else tag
+        if self._skip or tag in NON_TEXT_TAGS:
+            if tag in NON_TEXT_TAGS:
+                self._skip += 1
+            return
+
+        if tag in self.block_tags and tag in INLINE_TAGS and self._blocks:
+            self._inline[tag] = self._inline.get(tag, 0) + 1
+        elif tag in self.block_tags:
+            self._texts.append(None)
+            self._blocks.append((tag, len(self._texts) - 1, []))
+        elif tag == 'a' and self.collect_links:
+            href = attrs.get('href')
+            # Slot dibuat sekarang supaya urutan link sesuai dokumen
+            slot = None
+            if href is not None:
+                self._link_items.append(None)
+                slot = len(self._link_items) - 1
+            self._links.append((urljoin(self.base_url, href or ''), slot, []))
+        elif tag == 'img' and self.collect_images:
+            src = attrs.get('src')
+            if src is not None:
+                self._image_items.append({
+                    'type': 'image',
+                    'content': urljoin(self.base_url, src),
+                    'alt': attrs.get('alt') or ''
+                })
+
+    def end(self, tag):
+        self._flush_text()
+        tag = tag.lower() if isinstance(tag, str) else tag
+        if tag in NON_TEXT_TAGS:
+            if self._skip:
+                self._skip -= 1
+            return
+        if self._skip:
+            return
+
+        if self._inline.get(tag):
+            self._inline[tag] -= 1
+        elif tag in self.block_tags:
+            self._close_until(self._blocks, tag, self._emit_block)
+            if not self._blocks:
+                # HTML tidak rapi: span yang belum ditutup ikut selesai bersama bloknya
+                self._inline.clear()
+        elif tag == 'a' and self.collect_links:
+            self._close_until(self._links, None, self._emit_link)
+
+    def data(self, text):
+        if not self._skip:
+            self._pending.append(text)
+
+    def comment(self, text):
+        self._flush_text()
+
+    def close(self):
+        """Tutup blok/link yang belum ditutup lalu return list item"""
+        self._flush_text()
+        while self._blocks:
+            self._emit_block(self._blocks.pop())
+        while self._links:
+            self._emit_link(self._links.pop())
+        results = [item for item in self._texts if item is not None]
+        results.extend(item for item in self._link_items if item is not None)
+        results.extend(self._image_items)
+        return results
+
+    # --- internal ---
+
+    def _flush_text(self):
+        """Satu text node selesai: strip sekali lalu bagikan ke blok dan link"""
+        if not self._pending:
+            return
+        text = ''.join(self._pending).strip()
+        self._pending = []
+        if not text:
+            return
+        if self._blocks:
+            self._blocks[-1][2].append(text)
+        for _, _, parts in self._links:
+            parts.append(text)
+
+    @staticmethod
+    def _close_until(stack, tag, emit):
+        """Pop stack sampai elemen dengan tag tersebut (toleran HTML tidak rapi)"""
+        if tag is not None and not any(entry[0] == tag for entry in stack):
+            return
+        while stack:
+            entry = stack.pop()
+            emit(entry)
+            if tag is None or entry[0] == tag:
+                return
+
+    def _emit_block(self, entry):
+        tag, slot, parts = entry
+        text = ''.join(parts)
+        if text and len(text) > self.min_length:
+            if self.max_length and len(text) > self.max_length:
+                text = text[:self.max_length] + '...'
+            item = {'type': 'text', 'content': text}
+            if self.include_tag:
+                item['tag'] = tag
+            self._texts[slot] = item
+
+    def _emit_link(self, entry):
+        href, slot, parts = entry
+        if slot is None:
+            return
+        text = ''.join(parts)
+        if self.link_requires_text and not text:
+            return
+        self._link_items[slot] = {'type': 'link', 'content': href, 'text': text}
+
+
+class LinkCollector:
+    """Pembungkus target: teruskan event ke `target` sambil mencatat URL <a href>
+
+    Dipakai crawl supaya link untuk diikuti didapat dari pass yang sama
+    dengan item, apa pun mode extractor-nya. Aturannya sama dengan mode
+    links (href di-resolve terhadap URL halaman, isi script/style/template
+    diabaikan).
+    """
+
+    def __init__(self, target, base_url):
+        self.target = target
+        self.base_url = base_url
+        self.links = []
+        self._skip = 0
+
+    def start(self, tag, attrs):
+        tag = tag.lower() if isinstance(tag, str) else tag
+        if tag in NON_TEXT_TAGS:
+            self._skip += 1
+        elif tag == 'a' and not self._skip:
+            href = attrs.get('href')
+            if href is not None:
+                self.links.append(urljoin(self.base_url, href))
+        self.target.start(tag, attrs)
+
+    def end(self, tag):
+        if self._skip and (tag.lower() if isinstance(tag, str) else tag) in NON_TEXT_TAGS:
+            self._skip -= 1
+        self.target.end(tag)
+
+    def data(self, text):
+        self.target.data(text)
+
+    def comment(self, text):
+        self.target.comment(text)
+
+    def close(self):
+        return self.target.close()
+
+
+def make_extractor(url, mode):
+    """StreamExtractor dengan aturan yang sama seperti extractor mode tersebut"""
+    if mode == 'text':
+        return StreamExtractor(url, TEXT_TAGS, min_length=10)
+    if mode == 'links':
+        return StreamExtractor(url, links=True)
+    if mode == 'images':
+        return StreamExtractor(url, images=True)
+    if mode == 'tables':
+        return TableExtractor(url)
+    if mode == 'basic':
+        return StreamExtractor(url, BASIC_TEXT_TAGS, min_length=20, max_length=200,
+                               include_tag=False, links=True, link_requires_text=True)
+    raise ValueError(f"Mode {mode} tidak didukung streaming extractor")
+
+
+class _StdlibDriver(HTMLParser):
+    """Adaptor html.parser (stdlib) ke API target ala lxml"""
+
+    def __init__(self, target):
+        super().__init__(convert_charrefs=True)
+        self.target = target
+
+    def handle_starttag(self, tag, attrs):
+        self.target.start(tag, {name: value or '' for name, value in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self.target.end(tag)
+
+    def handle_endtag(self, tag):
+        self.target.end(tag)
+
+    def handle_data(self, data):
+        self.target.data(data)
+
+    def handle_comment(self, data):
+        self.target.comment(data)
+
+    def close(self):
+        super().close()
+        return self.target.close()
+
+
+class StreamParser:
+    """Parser inkremental: feed(bytes) berkali-kali lalu close() -> list item
+
+    Memakai lxml (libxml2, mode target tanpa tree) jika ada, atau html.parser.
+    Encoding ditebak dari <meta charset> di chunk pertama.
+    """
+
+    def __init__(self, target, encoding=None, use_lxml=None):
+        if use_lxml is None:
+            use_lxml = importlib.util.find_spec('lxml') is not None
+        self._target = target
+        if use_lxml:
+            from lxml import etree
+            self._parser = etree.HTMLParser(target=target, recover=True)
+        else:
+            self._parser = _StdlibDriver(target)
+        self._encoding = encoding
+        self._decoder = None
+
+    def feed(self, chunk):
+        if not chunk:
+            return
+        if isinstance(chunk, bytes):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder(self._sniff(chunk))('replace')
+            chunk = self._decoder.decode(chunk)
+        if chunk:
+            self._parser.feed(chunk)
+
+    def _sniff(self, chunk):
+        if self._encoding:
+            return self._encoding
+        if chunk.startswith(b'\xef\xbb\xbf'):
+            return 'utf-8-sig'
+        match = META_CHARSET.search(chunk[:2048])
+        if match:
+            try:
+                return codecs.lookup(match.group(1).decode('ascii')).name
+            except LookupError:
+                pass
+        return 'utf-8'
+
+    def close(self):
+        if self._decoder is not None:
+            tail = self._decoder.decode(b'', final=True)
+            if tail:
+                self._parser.feed(tail)
+        try:
+            return self._parser.close()
+        except Exception:
+            # lxml menolak dokumen kosong; hasilnya tetap dari target
+            return self._target.close()
+
+
+def stream_extract(url, content, mode, chunk_size=64 * 1024, links=None):
+    """Extract satu dokumen (bytes atau iterable chunk) dalam satu pass
+
+    Jika `links` berupa list, URL semua <a href> ikut ditambahkan ke
+    dalamnya dari pass yang sama.
+    """
+    target = make_extractor(url, mode)
+    if links is not None:
+        target = LinkCollector(target, url)
+    parser = StreamParser(target)
+    if isinstance(content, (bytes, str)):
+        content = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+    for chunk in content:
+        parser.feed(chunk)
+    results = parser.close()
+    if links is not None:
+        links.extend(target.links)
+    return results
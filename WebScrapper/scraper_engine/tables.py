@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+"""
+Extractor tabel - baris dan cell dibaca sekali dalam mode streaming
+
+TableExtractor adalah target StreamParser (start/end/data/close), jadi
+tabel diambil tanpa membangun DOM dan tanpa bolak-balik lewat
+pd.read_html. colspan/rowspan diratakan menjadi grid (nilai cell diulang
+di setiap posisi yang ditutupinya, seperti pandas), baris header diambil
+dari <thead> atau baris yang semua cell-nya <th>, dan tipe setiap kolom
+(int/float/str) ditebak dari isinya.
+
+Setiap tabel disimpan sebagai satu item: content = CSV (baris pertama
+nama kolom), dtypes = tipe per kolom dipisah koma. Table.from_item()
+mengembalikan data per kolom dengan tipe aslinya.
+"""
+
+import csv
+import io
+import re
+
+from .parsers import NON_TEXT_TAGS
+
+MAX_COLSPAN = 1000
+MAX_ROWSPAN = 65534
+
+_INT = re.compile(r'^[-+]?\d+$')
+_FLOAT = re.compile(r'^[-+]?(\d+\.\d*|\.\d+|\d+)([eE][-+]?\d+)?$')
+_THOUSANDS = re.compile(r'^[-+]?\d{1,3}(,\d{3})+(\.\d+)?$')
+
+# Tag yang memisahkan kata di dalam cell (<td>a<br>b</td> -> "a b")
+_BREAK_TAGS = frozenset(('br', 'p', 'div', 'li', 'ul', 'ol', 'tr', 'hr'))
+
+
+def _span(value, limit):
+    try:
+        value = int(str(value).strip() or 1)
+    except ValueError:
+        return 1
+    return min(max(value, 1), limit)
+
+
+def _number(text):
+    """int/float dari teks angka (boleh pemisah ribuan koma), atau None"""
+    if _INT.match(text):
+        return int(text)
+    if _FLOAT.match(text):
+        return float(text)
+    if _THOUSANDS.match(text):
+        text = text.replace(',', '')
+        return float(text) if '.' in text else int(text)
+    return None
+
+
+def infer_column(values):
+    """Tebak tipe satu kolom; return (dtype, nilai yang sudah dikonversi)"""
+    numbers = []
+    for value in values:
+        if value is None or value == '':
+            numbers.append(None)
+            continue
+        number = _number(value)
+        if number is None:
+            return 'str', [value if value != '' else None for value in values]
+        numbers.append(number)
+    if all(value is None for value in numbers):
+        return 'str', numbers
+    if all(value is None or isinstance(value, int) for value in numbers):
+        return 'int', numbers
+    return 'float', [None if value is None else float(value) for value in numbers]
+
+
+def _convert(text, dtype):
+    if text == '':
+        return None
+    if dtype == 'int':
+        return int(text)
+    if dtype == 'float':
+        return float(text)
+    return text
+
+
+def layout(rows):
+    """Ratakan baris [(teks, colspan, rowspan), ...] menjadi grid persegi"""
+    grid = []
+    pending = {}    # kolom -> [sisa baris, nilai] dari rowspan di atasnya
+
+    for cells in rows:
+        line = []
+
+        def take_pending():
+            while len(line) in pending:
+                span = pending[len(line)]
+                line.append(span[1])
+                span[0] -= 1
+                if not span[0]:
+                    del pending[len(line) - 1]
+
+        for text, colspan, rowspan in cells:
+            take_pending()
+            for _ in range(colspan):
+                if rowspan > 1:
+                    pending[len(line)] = [rowspan - 1, text]
+                line.append(text)
+        take_pending()
+        for col in sorted(col for col in pending if col >= len(line)):
+            line.extend([None] * (col - len(line)))
+            take_pending()
+        grid.append(line)
+
+    width = max((len(line) for line in grid), default=0)
+    for line in grid:
+        line.extend([None] * (width - len(line)))
+    return grid
+
+
+class Table:
+    """Tabel hasil extract: nama kolom, tipe per kolom, dan data per kolom"""
+
+    __slots__ = ('columns', 'dtypes', 'data', 'caption')
+
+    def __init__(self, columns, dtypes, data, caption=''):
+        self.columns = columns
+        self.dtypes = dtypes
+        self.data = data        # list kolom, sejajar dengan columns
+        self.caption = caption
+
+    @classmethod
+    def from_grid(cls, header_rows, body_rows, caption=''):
+        """Bangun tabel dari grid header dan isi; tipe kolom ditebak"""
+        width = len((header_rows or body_rows)[0]) if (header_rows or body_rows) else 0
+        columns = []
+        for col in range(width):
+            parts = []
+            for row in header_rows:
+                if row[col] and row[col] not in parts:
+                    parts.append(row[col])
+            columns.append(' / '.join(parts) or f"kolom_{col + 1}")
+        seen = {}
+        for col, name in enumerate(columns):
+            if name in seen:
+                seen[name] += 1
+                columns[col] = f"{name}_{seen[name]}"
+            else:
+                seen[name] = 1
+
+        dtypes, data = [], []
+        for col in range(width):
+            dtype, values = infer_column([row[col] for row in body_rows])
+            dtypes.append(dtype)
+            data.append(values)
+        return cls(columns, dtypes, data, caption)
+
+    @classmethod
+    def from_item(cls, item):
+        """Kebalikan to_item(): parse CSV di content dengan tipe dari dtypes"""
+        reader = csv.reader(io.StringIO(item['content']))
+        columns = next(reader, [])
+        dtypes = item.get('dtypes', '').split(',') if item.get('dtypes') else ['str'] * len(columns)
+        data = [[] for _ in columns]
+        for row in reader:
+            for col, text in enumerate(row[:len(columns)]):
+                data[col].append(_convert(text, dtypes[col]))
+        return cls(columns, dtypes, data, item.get('caption', ''))
+
+    def __len__(self):
+        return len(self.data[0]) if self.data else 0
+
+    def rows(self):
+        """Iterasi baris (tuple) sesuai urutan kolom"""
+        return zip(*self.data)
+
+    def to_csv(self):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(self.columns)
+        writer.writerows(self.rows())
+        return buffer.getvalue()
+
+    def to_item(self, table_id):
+        item = {'type': 'table', 'content': self.to_csv(), 'table_id': table_id,
+                'dtypes': ','.join(self.dtypes)}
+        if self.caption:
+            item['caption'] = self.caption
+        return item
+
+    def to_pandas(self):
+        import pandas as pd
+
+        return pd.DataFrame({name: values for name, values in zip(self.columns, self.data)},
+                            columns=self.columns)
+
+
+class _TableBuilder:
+    """Kumpulan baris satu <table> yang sedang dibaca"""
+
+    def __init__(self):
+        self.rows = []          # (cells, header), cells = [(teks, colspan, rowspan)]
+        self.caption = []
+        self.section = None     # 'thead' / 'tbody' / 'tfoot'
+        self.in_caption = False
+        self._row = None        # [cells, semua <th>]
+        self._cell = None       # [parts, colspan, rowspan]
+
+    def start_row(self):
+        self.end_row()
+        self._row = [[], True]
+
+    def end_row(self):
+        self.end_cell()
+        if self._row is not None:
+            cells, all_th = self._row
+            if cells:
+                self.rows.append((cells, self.section == 'thead' or all_th))
+            self._row = None
+
+    def start_cell(self, header, attrs):
+        self.end_cell()
+        if self._row is None:
+            self.start_row()
+        if not header:
+            self._row[1] = False
+        self._cell = [[], _span(attrs.get('colspan', 1), MAX_COLSPAN),
+                      _span(attrs.get('rowspan', 1), MAX_ROWSPAN)]
+
+    def end_cell(self):
+        if self._cell is not None:
+            parts, colspan, rowspan = self._cell
+            self._row[0].append((' '.join(''.join(parts).split()), colspan, rowspan))
+            self._cell = None
+
+    def data(self, text):
+        if self._cell is not None:
+            self._cell[0].append(text)
+        elif self.in_caption:
+            self.caption.append(text)
+
+    def build(self):
+        """Table, atau None jika tidak ada cell sama sekali"""
+        self.end_row()
+        if not self.rows:
+            return None
+        grid = layout([cells for cells, _ in self.rows])
+        header_count = 0
+        for _, header in self.rows:
+            if not header:
+                break
+            header_count += 1
+        if header_count == len(grid):
+            # Semua baris <th>: anggap baris pertama saja sebagai header
+            header_count = 1 if len(grid) > 1 else 0
+        caption = ' '.join(''.join(self.caption).split())
+        return Table.from_grid(grid[:header_count], grid[header_count:], caption)
+
+
+class TableExtractor:
+    """Target parser (API start/end/data/close ala lxml) yang mengumpulkan tabel
+
+    Tabel bersarang menjadi tabel tersendiri; teksnya tidak ikut masuk ke
+    cell tabel luar. Urutan tabel sesuai tag <table> pembuka.
+    """
+
+    def __init__(self, base_url=None):
+        self.base_url = base_url
+        self._open = []         # stack _TableBuilder
+        self._builders = []     # semua tabel sesuai urutan dokumen
+        self._skip = 0
+
+    def start(self, tag, attrs):
+        tag = tag.lower() if isinstance(tag, str) else tag
+        if self._skip or tag in NON_TEXT_TAGS:
+            if tag in NON_TEXT_TAGS:
+                self._skip += 1
+            return
+        if tag == 'table':
+            builder = _TableBuilder()
+            self._open.append(builder)
+            self._builders.append(builder)
+            return
+        if not self._open:
+            return
+        builder = self._open[-1]
+        if tag == 'tr':
+            builder.start_row()
+        elif tag in ('td', 'th'):
+            builder.start_cell(tag == 'th', attrs)
+        elif tag in ('thead', 'tbody', 'tfoot'):
+            builder.end_row()
+            builder.section = tag
+        elif tag == 'caption':
+            builder.in_caption = True
+        elif tag in _BREAK_TAGS:
+            builder.data(' ')
+
+    def end(self, tag):
+        tag = tag.lower() if isinstance(tag, str) else tag
+        if tag in NON_TEXT_TAGS:
+            if self._skip:
+                self._skip -= 1
+            return
+        if self._skip or not self._open:
+            return
+        builder = self._open[-1]
+        if tag == 'table':
+            self._open.pop()
+        elif tag in ('td', 'th'):
+            builder.end_cell()
+        elif tag == 'tr':
+            builder.end_row()
+        elif tag in ('thead', 'tbody', 'tfoot'):
+            builder.end_row()
+            builder.section = None
+        elif tag == 'caption':
+            builder.in_caption = False
+        elif tag in _BREAK_TAGS:
+            builder.data(' ')
+
+    def data(self, text):
+        if not self._skip and self._open:
+            self._open[-1].data(text)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        """Return list item tabel (type 'table')"""
+        results = []
+        for builder in self._builders:
+            table = builder.build()
+            if table is not None:
+                results.append(table.to_item(len(results)))
+        return results
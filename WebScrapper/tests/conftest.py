@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Fixture bersama: server HTTP lokal untuk test engine"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class Site:
+    """Halaman statis di server lokal; path -> body (bytes atau str)
+
+    Setiap halaman punya ETag sehingga request bersyarat dijawab 304.
+    `errors[path]` = list (status, header) yang dijawab lebih dulu, satu per
+    request; `types[path]` mengganti Content-Type halaman.
+    """
+
+    def __init__(self):
+        self.pages = {}
+        self.errors = {}
+        self.types = {}
+        self.requests = []      # (method, path, status) per request
+        self.headers = []       # header request per request
+        self.connections = set()  # alamat klien (satu per koneksi TCP)
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if site.errors.get(self.path):
+                    status, headers = site.errors[self.path].pop(0)
+                    site.requests.append(('GET', self.path, status))
+                    site.headers.append(dict(self.headers))
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = site.pages.get(self.path)
+                if body is None:
+                    status, body, etag = 404, b'', None
+                else:
+                    body = body.encode('utf-8') if isinstance(body, str) else body
+                    etag = '"%x"' % hash(body)
+                    status = 304 if self.headers.get('If-None-Match') == etag else 200
+                site.requests.append(('GET', self.path, status))
+                site.headers.append(dict(self.headers))
+                site.connections.add(self.client_address)
+                self.send_response(status)
+                if etag:
+                    self.send_header('ETag', etag)
+                if status == 304:
+                    self.end_headers()
+                    return
+                self.send_header('Content-Type',
+                                 site.types.get(self.path, 'text/html; charset=utf-8'))
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self.base = 'http://127.0.0.1:%d' % self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def url(self, path):
+        return self.base + path
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def site():
+    server = Site()
+    yield server
+    server.close()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Test HttpCache: simpan response bervalidator dan revalidasi 304"""
+
+from scraper_engine import HttpCache, HttpClient, ListSink, ScraperEngine
+
+PAGE = '<html><body><p>Paragraf yang cukup panjang untuk diambil.</p></body></html>'
+
+
+class FakeResponse:
+    def __init__(self, body=b'isi', status_code=200, **headers):
+        self.status_code = status_code
+        self.headers = {name.replace('_', '-'): value for name, value in headers.items()}
+        self.content = body
+
+
+def test_revalidation_serves_304_from_cache(site, tmp_path):
+    site.pages['/'] = PAGE
+    cache = HttpCache(str(tmp_path))
+    client = HttpClient()
+    first = client.get(site.url('/'), cache=cache)
+    second = client.get(site.url('/'), cache=cache)
+    assert [status for _, _, status in site.requests] == [200, 304]
+    assert site.headers[1]['If-None-Match'] == first.headers['ETag']
+    assert second.from_cache and second.content == first.content
+    assert second.text == PAGE
+    assert cache.stats['hits'] == 1 and cache.stats['bytes_saved'] == len(PAGE)
+    cache.close()
+
+
+def test_changed_page_is_downloaded_again(site, tmp_path):
+    site.pages['/'] = PAGE
+    cache = HttpCache(str(tmp_path))
+    client = HttpClient()
+    client.get(site.url('/'), cache=cache)
+    site.pages['/'] = PAGE.replace('cukup', 'sangat')
+    response = client.get(site.url('/'), cache=cache)
+    assert site.requests[-1][2] == 200
+    assert b'sangat' in response.content
+    assert b'sangat' in cache.lookup(site.url('/'))['body']
+    cache.close()
+
+
+def test_engine_uses_cache(site, tmp_path):
+    site.pages['/'] = PAGE
+    cache = HttpCache(str(tmp_path))
+    engine = ScraperEngine(delay=0, respect_robots=False, cache=cache)
+    sink = ListSink()
+    engine.scrape_many([site.url('/')], sink, mode='text')
+    engine.scrape_many([site.url('/')], sink, mode='text')
+    assert [status for _, _, status in site.requests] == [200, 304]
+    assert sink.items[0]['content'] == sink.items[1]['content']
+    engine.close()
+    cache.close()
+
+
+def test_uncacheable_responses_are_skipped(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    cache.store('http://a/1', None, FakeResponse())
+    cache.store('http://a/2', None, FakeResponse(ETag='"x"', Cache_Control='no-store'))
+    cache.store('http://a/3', None, FakeResponse(ETag='"x"', status_code=404))
+    cache.store('http://a/4', None, FakeResponse(ETag='"x"', Vary='*'))
+    assert len(cache) == 0
+    cache.store('http://a/5', None, FakeResponse(Last_Modified='Mon, 01 Jan 2024 00:00:00 GMT'))
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_vary_matches_request_headers(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    cache.store('http://a/', {'Accept-Language': 'id'},
+                FakeResponse(ETag='"x"', Vary='Accept-Language'))
+    assert cache.lookup('http://a/', {'accept-language': 'id'}) is not None
+    assert cache.lookup('http://a/', {'Accept-Language': 'en'}) is None
+    assert cache.lookup('http://a/') is None
+    cache.close()
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = HttpCache(str(tmp_path), max_size=1000)
+    for n in range(3):
+        cache.store(f'http://a/{n}', None, FakeResponse(b'x' * 90, ETag='"x"'))
+    cache.hit('http://a/0', cache.lookup('http://a/0'))
+    for n in range(3, 12):
+        cache.store(f'http://a/{n}', None, FakeResponse(b'x' * 90, ETag='"x"'))
+    assert cache.size <= 1000
+    assert cache.lookup('http://a/0') is not None
+    assert cache.lookup('http://a/1') is None
+    # Body lebih dari 1/10 max_size tidak disimpan
+    cache.store('http://a/big', None, FakeResponse(b'x' * 200, ETag='"x"'))
+    assert cache.lookup('http://a/big') is None
+    cache.close()
+
+
+def test_entries_persist_and_expire(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    cache.store('http://a/', None, FakeResponse(ETag='"x"'))
+    cache.close()
+    cache = HttpCache(str(tmp_path))
+    assert cache.lookup('http://a/')['etag'] == '"x"'
+    cache.max_age = -1
+    assert cache.lookup('http://a/') is None
+    cache.prune()
+    assert len(cache) == 0 and cache.size == 0
+    cache.close()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Test crawl: frontier, batas kedalaman/domain, dedup URL, dan parse sekali per halaman"""
+
+import pytest
+
+from scraper_engine import BloomFilter, ListSink, ScraperEngine, StreamParser, canonicalize_url
+from scraper_engine.extractor import extract
+from scraper_engine.parsers import Bs4Backend
+
+
+def chain_site(site, pages=5):
+    """/page/0 -> /page/1 -> ...; setiap halaman juga link ke luar dan ke dirinya sendiri"""
+    for n in range(pages):
+        links = f'<a href="/page/{n + 1}">Berikutnya</a>' if n + 1 < pages else ''
+        site.pages[f'/page/{n}'] = (
+            f'<html><body><h1>Halaman nomor {n} dari rangkaian</h1>'
+            f'<p>Isi paragraf halaman {n} yang cukup panjang untuk mode teks.</p>'
+            f'{links}<a href="/page/{n}#atas">Ke atas</a>'
+            f'<a href="https://luar.test/x">Situs luar</a><a href="/file.pdf">PDF</a>'
+            f'</body></html>')
+
+
+def crawl(site, mode='text', parser='auto', **options):
+    sink = ListSink()
+    engine = ScraperEngine(delay=0, respect_robots=False, parser=parser)
+    stats = engine.crawl([site.url('/page/0')], sink, mode=mode, **options)
+    engine.close()
+    return stats, sink.items
+
+
+def fetched(site):
+    return [path for _, path, _ in site.requests]
+
+
+def test_follows_links_up_to_max_depth(site):
+    chain_site(site)
+    stats, items = crawl(site, max_depth=2)
+    assert fetched(site) == ['/page/0', '/page/1', '/page/2']
+    assert stats['urls'] == 3 and stats['failed'] == 0
+    assert {item['url'] for item in items} == {site.url(f'/page/{n}') for n in range(3)}
+
+
+def test_max_pages_and_same_domain(site):
+    chain_site(site, pages=10)
+    stats, _ = crawl(site, max_depth=20, max_pages=4)
+    # Link luar, PDF, dan fragment ke halaman sendiri tidak diikuti
+    assert fetched(site) == ['/page/0', '/page/1', '/page/2', '/page/3']
+    assert stats['urls'] == 4
+
+
+@pytest.mark.parametrize('mode', ['text', 'basic', 'images', 'tables'])
+def test_links_followed_in_every_mode(site, mode):
+    chain_site(site)
+    crawl(site, mode=mode, max_depth=10)
+    assert len(fetched(site)) == 5
+
+
+def test_stream_page_parsed_once(site, monkeypatch):
+    chain_site(site)
+    parsers = []
+    original = StreamParser.__init__
+
+    def init(self, *args, **kwargs):
+        parsers.append(1)
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(StreamParser, '__init__', init)
+    crawl(site, mode='text', max_depth=10)
+    assert len(parsers) == 5
+
+
+def test_dom_page_parsed_once(site, monkeypatch):
+    chain_site(site)
+    calls = []
+    original = Bs4Backend.parse
+
+    def parse(self, content):
+        calls.append(1)
+        return original(self, content)
+
+    monkeypatch.setattr(Bs4Backend, 'parse', parse)
+    crawl(site, mode='custom', parser='bs4', selector='h1', max_depth=10)
+    assert len(calls) == 5
+
+
+@pytest.mark.parametrize('parser', ['stream', 'bs4'])
+def test_collected_links_match_links_mode(parser):
+    html = (b'<div><p>Teks <a href="/a">A</a></p><a href="b?x=1">B</a><a name="n">tanpa href</a>'
+            b'<script>var s = "<a href=/bukan>";</script><a href="">kosong</a></div>')
+    links = []
+    extract('https://contoh.test/dir/', html, 'text', parser=parser, links=links)
+    expected = [item['content'] for item in extract('https://contoh.test/dir/', html, 'links', parser='bs4')]
+    assert links == expected
+
+
+def test_canonicalize_url():
+    assert canonicalize_url('HTTP://Contoh.TEST:80/a/./b/../c?z=1&a=2#bagian') == \
+        'http://contoh.test/a/c?a=2&z=1'
+    assert canonicalize_url('https://contoh.test') == 'https://contoh.test/'
+    assert canonicalize_url('https://contoh.test:8443/dir/') == 'https://contoh.test:8443/dir/'
+
+
+def test_bloom_filter_grows_without_false_negatives():
+    bloom = BloomFilter(capacity=100, error_rate=1e-3)
+    urls = [f'https://contoh.test/{i}' for i in range(1000)]
+    added = sum(bloom.add(url) for url in urls)
+    assert added >= 990 and len(bloom) == added
+    assert all(url in bloom for url in urls)
+    assert not bloom.add(urls[0])
+    false_positives = sum(f'https://lain.test/{i}' in bloom for i in range(2000))
+    assert false_positives < 20
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""Test Deduplicator: item sama, boilerplate, halaman mirip, dan data paginasi"""
+
+from scraper_engine import DedupSink, Deduplicator, ListSink, ScraperEngine, SimHashIndex
+from scraper_engine.dedup import simhash, tokenize
+
+FOOTER = 'Hak cipta 2024 Toko Contoh semua hak dilindungi hubungi kami di email atau telepon kantor pusat'
+
+
+def text(content, tag='p'):
+    return {'type': 'text', 'content': content, 'tag': tag}
+
+
+def link(href, label):
+    return {'type': 'link', 'content': href, 'text': label}
+
+
+def paginated_page(number):
+    """Halaman daftar /page/N: judul, lima artikel, footer berjam, dan link"""
+    items = [text(f'Daftar artikel halaman {number}', 'h1')]
+    for k in range(number * 5, number * 5 + 5):
+        items.append(text(f'Artikel nomor {k} membahas topik menarik dengan ringkasan '
+                          f'panjang yang ditulis oleh tim redaksi edisi {k}'))
+    items.append(text(f'{FOOTER} diperbarui {number + 8}:00', 'div'))
+    items.extend(link(f'https://contoh.test/artikel/{k}', f'Baca artikel {k}')
+                 for k in range(number * 5, number * 5 + 5))
+    return items
+
+
+def test_exact_duplicates_dropped():
+    dedup = Deduplicator()
+    first = dedup.filter('https://a.test/1', [text('Paragraf yang sama persis di dua halaman')])
+    second = dedup.filter('https://a.test/2', [text('Paragraf yang sama persis di dua halaman')])
+    assert len(first) == 1 and second == []
+    assert dedup.stats['exact'] == 1
+
+
+def test_paginated_pages_differing_only_in_numbers_are_kept():
+    dedup = Deduplicator()
+    kept = [dedup.filter(f'https://contoh.test/page/{n}', paginated_page(n)) for n in range(7)]
+    # Semua artikel dan link tetap; hanya footer yang berulang (beda jam) dibuang
+    for n, items in enumerate(kept):
+        articles = [item for item in items if item['content'].startswith('Artikel nomor')]
+        links = [item for item in items if item['type'] == 'link']
+        assert len(articles) == 5 and len(links) == 5, n
+    assert dedup.stats['near_pages'] == 0
+    assert dedup.stats['near_blocks'] == 6
+
+
+def test_page_dedup_is_opt_in_and_ignores_numbers_only_changes():
+    dedup = Deduplicator(pages=True)
+    kept = [dedup.filter(f'https://contoh.test/page/{n}', paginated_page(n)) for n in range(7)]
+    assert all(kept)
+    assert dedup.stats['near_pages'] == 0
+    assert Deduplicator().pages is False
+
+
+def test_near_duplicate_page_dropped_when_enabled():
+    words = ' '.join(f'kata{i}' for i in range(200))
+    page = [text(words), text('Paragraf kedua tentang hal lain yang cukup panjang juga')]
+    mirror = [text(words + ' tambahan'), text('Paragraf kedua tentang hal lain yang cukup panjang juga')]
+    dedup = Deduplicator(pages=True)
+    assert dedup.filter('https://a.test/artikel', page)
+    assert dedup.filter('https://a.test/artikel?print=1', mirror) == []
+    assert dedup.duplicate_pages == [('https://a.test/artikel?print=1', 'https://a.test/artikel')]
+
+
+def test_links_only_pages_never_dropped_as_pages():
+    dedup = Deduplicator(pages=True)
+    for n in range(5):
+        items = [link(f'https://a.test/p/{n}/{k}', f'Item {k}') for k in range(5)]
+        assert len(dedup.filter(f'https://a.test/p/{n}', items)) == 5
+
+
+def test_wrapper_block_dropped():
+    child = 'Paragraf di dalam div pembungkus yang cukup panjang'
+    items = [text(child + ' dan ekor', 'div'), text(child)]
+    assert Deduplicator().filter('https://a.test/', items) == [text(child)]
+
+
+def test_removed_items_always_pass():
+    dedup = Deduplicator()
+    item = dict(text('Item lama yang sudah dihapus dari halaman'), change='removed')
+    assert dedup.filter('https://a.test/', [item, item]) == [item, item]
+
+
+def test_simhash_index_finds_near_values():
+    index = SimHashIndex(distance=3)
+    value = simhash(tokenize('satu dua tiga empat lima enam tujuh delapan sembilan sepuluh'))
+    index.add(value, 'a')
+    assert index.find(value ^ 0b101) == 'a'
+    assert index.find(value ^ 0b1111) is None
+    assert index.find(value, exclude='a') is None
+
+
+def test_crawl_paginated_site_with_dedup(site):
+    # Tujuh halaman /page/N yang hanya beda angka dan link: tidak ada yang dibuang
+    for n in range(7):
+        next_link = f'<a href="/page/{n + 1}">Halaman berikutnya</a>' if n < 6 else ''
+        # Link artikel ke domain lain: tidak di-crawl (same_domain), hanya dikumpulkan
+        articles = ''.join(f'<li><a href="https://arsip.test/artikel/{n * 5 + k}">'
+                           f'Artikel {n * 5 + k}</a></li>' for k in range(5))
+        site.pages[f'/page/{n}'] = f'<html><body><ul>{articles}</ul>{next_link}</body></html>'
+    sink = ListSink()
+    dedup = Deduplicator(pages=True)
+    engine = ScraperEngine(delay=0, respect_robots=False)
+    stats = engine.crawl([site.url('/page/0')], DedupSink(sink, dedup), mode='links',
+                         max_depth=10, max_pages=100)
+    engine.close()
+
+    assert stats['urls'] == 7
+    articles = {item['content'] for item in sink.items if '/artikel/' in item['content']}
+    assert len(articles) == 35
+    assert dedup.stats['near_pages'] == 0
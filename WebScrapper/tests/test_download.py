@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Test HttpClient.download: batas ukuran dan penolakan body non-HTML"""
+
+import pytest
+
+from scraper_engine import DownloadRejected, HttpClient, HttpError, ListSink, ScraperEngine
+from scraper_engine.fetcher import looks_binary
+
+PAGE = '<html><body><p>Paragraf yang cukup panjang untuk diambil.</p></body></html>'
+
+
+@pytest.fixture
+def client():
+    client = HttpClient()
+    yield client
+    client.close()
+
+
+def test_download_streams_chunks(site, client):
+    site.pages['/a'] = PAGE
+    chunks = []
+    body = client.download(site.url('/a'), on_chunk=chunks.append)
+    assert body == PAGE.encode('utf-8') == b''.join(chunks)
+    assert client.download(site.url('/a'), keep_body=False) == b''
+
+
+def test_content_length_over_limit_is_rejected(site, client):
+    site.pages['/besar'] = 'x' * 5000
+    with pytest.raises(DownloadRejected) as info:
+        client.download(site.url('/besar'), max_bytes=2048)
+    assert info.value.reason == '4 KB > batas 2 KB'
+    assert client.download(site.url('/besar'), max_bytes=8192) == b'x' * 5000
+
+
+def test_non_html_content_type_is_rejected(site, client):
+    site.pages['/file.zip'] = b'PK\x03\x04isi'
+    site.types['/file.zip'] = 'application/zip'
+    with pytest.raises(DownloadRejected) as info:
+        client.download(site.url('/file.zip'))
+    assert info.value.reason == 'application/zip'
+    assert client.download(site.url('/file.zip'), content_types=None) == b'PK\x03\x04isi'
+
+
+def test_binary_body_without_content_type_is_rejected(site, client):
+    site.pages['/tanpa-tipe'] = b'%PDF-1.7 isi'
+    site.types['/tanpa-tipe'] = ''
+    with pytest.raises(DownloadRejected) as info:
+        client.download(site.url('/tanpa-tipe'))
+    assert info.value.reason == 'file biner'
+
+
+def test_http_error_status(site, client):
+    with pytest.raises(HttpError) as info:
+        client.download(site.url('/hilang'))
+    assert info.value.status == 404
+
+
+def test_looks_binary():
+    assert looks_binary(b'\x89PNG\r\n')
+    assert looks_binary(b'teks\x00biner')
+    assert not looks_binary(b'<!doctype html><html>')
+
+
+def test_engine_does_not_retry_rejected_downloads(site):
+    site.pages['/besar'] = 'x' * 5000
+    site.pages['/a'] = PAGE
+    engine = ScraperEngine(delay=0, respect_robots=False, max_bytes=2048, backoff=0.01)
+    stats = engine.scrape_many([site.url('/besar'), site.url('/a')], ListSink(), mode='text')
+    assert stats['failed'] == 1 and stats['retries'] == 0 and stats['items'] == 1
+    assert stats['failures'].counts() == {'rejected': 1}
+    engine.close()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Test ScraperEngine dan CLI tanpa GUI"""
+
+import json
+
+import pytest
+
+from scraper_engine import ListSink, ScraperEngine, normalize_url
+from scraper_engine.cli import main
+
+PAGE = ('<html><body><h1>Judul halaman contoh yang cukup panjang</h1>'
+        '<p>Paragraf pertama yang cukup panjang untuk lolos filter teks.</p>'
+        '<a href="/lain">Halaman lain</a></body></html>')
+
+
+@pytest.fixture
+def engine():
+    engine = ScraperEngine(delay=0, respect_robots=False)
+    yield engine
+    engine.close()
+
+
+def test_scrape_url_adds_url_and_timestamp(site, engine):
+    site.pages['/a'] = PAGE
+    items = engine.scrape_url(site.url('/a'), 'basic')
+    assert [item['type'] for item in items] == ['text', 'text', 'link']
+    assert all(item['url'] == site.url('/a') and item['timestamp'] for item in items)
+    assert items[2]['content'] == site.url('/lain')
+
+
+def test_scrape_many_reports_progress_and_failures(site, engine):
+    site.pages['/a'] = PAGE
+    site.pages['/b'] = PAGE
+    sink = ListSink()
+    progress = []
+    engine.configure(max_retries=0)
+    stats = engine.scrape_many([site.url('/a'), site.url('/b'), site.url('/hilang'), '  '], sink,
+                               mode='basic', on_progress=lambda *args: progress.append(args))
+    assert stats['urls'] == 3 and stats['done'] == 3 and stats['failed'] == 1
+    assert stats['items'] == len(sink.items) == 6
+    assert [done for done, *_ in progress] == [1, 2, 3]
+    assert {total for _, total, *_ in progress} == {3}
+    failed = [args for args in progress if args[4] is not None]
+    assert failed[0][2] == site.url('/hilang')
+
+
+def test_configure_rejects_unknown_and_private_options(engine):
+    engine.configure(delay=0.5, max_workers=2)
+    assert engine.delay == 0.5 and engine.max_workers == 2
+    for name in ('tidak_ada', 'http', '_prewarmer'):
+        with pytest.raises(AttributeError):
+            engine.configure(**{name: 1})
+
+
+def test_normalize_url_adds_https():
+    assert normalize_url('  contoh.test/a ') == 'https://contoh.test/a'
+    assert normalize_url('http://contoh.test/a') == 'http://contoh.test/a'
+
+
+def test_cli_writes_jsonl(site, tmp_path, capsys):
+    site.pages['/a'] = PAGE
+    site.pages['/b'] = PAGE
+    urls = tmp_path / 'urls.txt'
+    urls.write_text(f"{site.url('/a')}\n\n{site.url('/b')}\n", encoding='utf-8')
+    output = tmp_path / 'hasil.jsonl'
+    main(['-i', str(urls), '-o', str(output), '--delay', '0', '-m', 'text'])
+    rows = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+    assert len(rows) == 4
+    assert {row['url'] for row in rows} == {site.url('/a'), site.url('/b')}
+    assert 'Selesai' in capsys.readouterr().err
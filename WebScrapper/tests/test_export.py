@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Test export streaming: CSV, JSONL, JSON, Excel, dan Parquet per batch"""
+
+import csv
+import json
+
+import pytest
+
+from scraper_engine import EXPORT_FORMATS, ResultStore, export_data
+from scraper_engine.export import format_for
+
+
+def items(count):
+    result = []
+    for i in range(count):
+        item = {'url': f'https://a.test/{i % 3}', 'timestamp': '2024-05-01 10:00:00',
+                'type': 'link' if i % 2 else 'text', 'content': f'Isi, "{i}"\nbaris'}
+        if i % 2:
+            item['text'] = f'Link {i}'
+        result.append(item)
+    return result
+
+
+@pytest.fixture(params=['list', 'store'])
+def source(request, tmp_path):
+    if request.param == 'list':
+        yield items(25)
+        return
+    store = ResultStore(str(tmp_path / 'hasil.sqlite'), window=0)
+    store.add_many(items(25))
+    yield store
+    store.close()
+
+
+def test_format_for():
+    assert format_for('hasil.CSV') == 'csv'
+    assert format_for('hasil.ndjson') == 'jsonl'
+    assert format_for('hasil.txt') is None
+    assert set(EXPORT_FORMATS) == {'csv', 'jsonl', 'json', 'parquet', 'xlsx'}
+
+
+def test_csv(source, tmp_path):
+    path = tmp_path / 'hasil.csv'
+    progress = []
+    assert export_data(source, str(path), batch_size=10, on_progress=progress.append) == 25
+    assert progress == [10, 20, 25]
+    with open(path, newline='', encoding='utf-8-sig') as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0] == ['url', 'timestamp', 'type', 'content', 'text']
+    assert rows[1] == ['https://a.test/0', '2024-05-01 10:00:00', 'text', 'Isi, "0"\nbaris', '']
+    assert rows[2][4] == 'Link 1'
+    assert len(rows) == 26
+
+
+@pytest.mark.parametrize('extension', ['.jsonl', '.json'])
+def test_json_formats_roundtrip(source, tmp_path, extension):
+    path = tmp_path / ('hasil' + extension)
+    assert export_data(source, str(path), batch_size=7) == 25
+    text = path.read_text(encoding='utf-8')
+    if extension == '.json':
+        rows = json.loads(text)
+    else:
+        rows = [json.loads(line) for line in text.splitlines()]
+    # Field tambahan yang kosong tidak ditulis
+    assert rows == items(25)
+
+
+def test_empty_json_is_valid(tmp_path):
+    path = tmp_path / 'kosong.json'
+    assert export_data([], str(path)) == 0
+    assert json.loads(path.read_text(encoding='utf-8')) == []
+
+
+def test_excel(source, tmp_path):
+    openpyxl = pytest.importorskip('openpyxl')
+    path = tmp_path / 'hasil.xlsx'
+    data = list(source) + [{'url': 'https://a.test/', 'timestamp': '2024-05-01 10:00:00',
+                            'type': 'text', 'content': '=SUM(A1:A2)'}]
+    assert export_data(data, str(path), format_type='excel') == 26
+    sheet = openpyxl.load_workbook(path)['Data']
+    rows = list(sheet.values)
+    assert rows[0] == ('url', 'timestamp', 'type', 'content', 'text')
+    assert rows[2][4] == 'Link 1'
+    # Teks berawalan '=' tetap string, bukan formula
+    assert sheet.cell(len(rows), 4).data_type == 's'
+    assert len(rows) == 27
+
+
+def test_parquet(source, tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = tmp_path / 'hasil.parquet'
+    assert export_data(source, str(path), batch_size=10) == 25
+    table = pq.read_table(path)
+    assert table.num_rows == 25
+    assert table.column('text').to_pylist()[:2] == [None, 'Link 1']
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        export_data(items(1), str(tmp_path / 'hasil.txt'))
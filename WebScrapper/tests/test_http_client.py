@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Test HttpClient: session keep-alive bersama dan robots.txt lewat session yang sama"""
+
+from scraper_engine import HttpClient
+
+
+def test_requests_reuse_one_connection(site):
+    site.pages['/a'] = '<p>a</p>'
+    site.pages['/b'] = '<p>b</p>'
+    client = HttpClient()
+    for path in ('/a', '/b', '/a', '/b'):
+        assert client.get(site.url(path)).status_code == 200
+    client.close()
+    assert len(site.requests) == 4
+    assert len(site.connections) == 1
+
+
+def test_robots_fetched_through_shared_session(site):
+    site.pages['/robots.txt'] = 'User-agent: *\nDisallow: /rahasia\n'
+    site.pages['/a'] = '<p>a</p>'
+    client = HttpClient()
+    rp, response = client.fetch_robots(site.url('/robots.txt'), user_agent='TesBot')
+    client.get(site.url('/a'))
+    client.close()
+    assert response.status_code == 200
+    assert not rp.can_fetch('TesBot', site.url('/rahasia/x'))
+    assert rp.can_fetch('TesBot', site.url('/a'))
+    assert site.headers[0]['User-Agent'] == 'TesBot'
+    assert len(site.connections) == 1
+
+
+def test_missing_robots_allows_all(site):
+    client = HttpClient()
+    rp, response = client.fetch_robots(site.url('/robots.txt'))
+    client.close()
+    assert response.status_code == 404
+    assert rp.can_fetch('*', site.url('/apa-saja'))
+
+
+def test_configure_keeps_session_when_unchanged(site):
+    site.pages['/a'] = '<p>a</p>'
+    client = HttpClient()
+    client.get(site.url('/a'))
+    session = client._get_session()
+    client.configure()
+    assert client._get_session() is session
+    client.configure(pool_connections=50)
+    assert client._get_session() is not session
+    client.close()
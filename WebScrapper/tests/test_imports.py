@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Test cold start: paket berat baru di-import saat pertama dipakai"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ('requests', 'bs4', 'pandas', 'lxml', 'selectolax', 'openpyxl', 'pyarrow', 'httpx',
+         'certifi', 'urllib.request', 'http.client', 'email', 'multiprocessing')
+
+
+def loaded_after(code):
+    """Modul berat yang baru masuk sys.modules karena `code` (interpreter baru)
+
+    Modul yang sudah dimuat saat startup (mis. oleh file .pth) tidak dihitung.
+    """
+    script = (f"import sys\nbefore = set(sys.modules)\n{code}\n"
+              f"print(' '.join(m for m in {HEAVY!r} if m in sys.modules and m not in before))")
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=ROOT, check=True).stdout
+    return set(output.split())
+
+
+def test_engine_import_loads_no_heavy_package():
+    assert loaded_after('import scraper_engine') == set()
+
+
+def test_stream_extract_needs_no_dom_backend():
+    code = ('from scraper_engine.extractor import extract\n'
+            'extract("http://x/", b"<p>teks yang cukup panjang</p>", "text")')
+    assert not loaded_after(code) & {'bs4', 'pandas', 'requests', 'selectolax'}
+
+
+def test_gui_module_import_is_light():
+    pytest.importorskip('tkinter')
+    assert loaded_after('import easyscraper') == set()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Test scrape incremental: halaman tidak berubah dilewati, hanya delta yang dikirim"""
+
+import pytest
+
+from scraper_engine import FingerprintStore, ListSink, ScraperEngine
+from scraper_engine.incremental import body_digest, diff_snapshots, make_snapshot
+
+PAGE = """<html><head><script>var nonce = '{nonce}';</script></head><body>
+<!-- dibuat {nonce} -->
+<p>Paragraf pertama yang cukup panjang untuk diambil.</p>
+<p>{second}</p>
+<a href="/lain">{link}</a>
+</body></html>"""
+
+
+def page(nonce='1', second='Paragraf kedua yang juga cukup panjang.', link='Halaman lain'):
+    return PAGE.format(nonce=nonce, second=second, link=link)
+
+
+def test_body_digest_ignores_volatile_parts():
+    assert body_digest(page('1').encode()) == body_digest(page('2').encode())
+    assert body_digest(b'<p>a</p>\n\n  <p>b</p>') == body_digest(b'<p>a</p> <p>b</p>')
+    assert body_digest(page(link='Baru').encode()) != body_digest(page().encode())
+    # Mode custom tetap menghitung isi <script>
+    assert body_digest(page('1').encode(), 'custom') != body_digest(page('2').encode(), 'custom')
+
+
+def test_diff_snapshots():
+    old = make_snapshot([{'type': 'text', 'content': 'a'}, {'type': 'text', 'content': 'a'},
+                         {'type': 'link', 'content': 'u', 'text': 'lama'}])
+    new = make_snapshot([{'type': 'text', 'content': 'a'}, {'type': 'text', 'content': 'b'},
+                         {'type': 'link', 'content': 'u', 'text': 'baru'}])
+    changes = diff_snapshots(old, new)
+    assert sorted((item['change'], item['content']) for item in changes) == [
+        ('changed', 'u'), ('new', 'b'), ('removed', 'a')]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    fingerprints = FingerprintStore(str(tmp_path))
+    engine = ScraperEngine(delay=0, respect_robots=False, fingerprints=fingerprints)
+    yield engine
+    engine.close()
+    fingerprints.close()
+
+
+def run(engine, site):
+    sink = ListSink()
+    stats = engine.scrape_many([site.url('/a')], sink, mode='basic')
+    return stats, sorted((item['change'], item['content']) for item in sink.items)
+
+
+def test_scrape_many_sends_only_changes(site, engine):
+    site.pages['/a'] = page()
+    stats, items = run(engine, site)
+    assert [change for change, _ in items] == ['new'] * 3
+
+    site.pages['/a'] = page(nonce='2')
+    stats, items = run(engine, site)
+    assert stats['unchanged'] == 1 and items == []
+
+    site.pages['/a'] = page(second='Paragraf kedua yang isinya sudah diganti.', link='Lain')
+    stats, items = run(engine, site)
+    assert stats['unchanged'] == 0
+    assert items == [('changed', site.url('/lain')),
+                     ('new', 'Paragraf kedua yang isinya sudah diganti.'),
+                     ('removed', 'Paragraf kedua yang juga cukup panjang.')]
+    assert engine.fingerprints.stats == {'unchanged': 1, 'changed': 1, 'new': 1}
+
+
+def test_scrape_url_and_forget(site, engine):
+    site.pages['/a'] = page()
+    assert len(engine.scrape_url(site.url('/a'), 'text')) == 2
+    assert engine.scrape_url(site.url('/a'), 'text') == []
+    # Mode lain punya snapshot sendiri
+    assert len(engine.scrape_url(site.url('/a'), 'links')) == 1
+    engine.fingerprints.forget(site.url('/a'))
+    assert len(engine.fingerprints) == 0
+    assert len(engine.scrape_url(site.url('/a'), 'text')) == 2
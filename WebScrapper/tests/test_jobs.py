@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Test JobStore: status per URL supaya batch bisa dilanjutkan"""
+
+from scraper_engine import JobStore, ScraperEngine
+from scraper_engine.cli import main
+
+PAGE = '<html><body><p>Paragraf yang cukup panjang untuk diambil.</p></body></html>'
+
+
+def items_for(url, count):
+    return [{'url': url, 'timestamp': '2024-05-01 10:00:00', 'type': 'text',
+             'content': f'Item {i}'} for i in range(count)]
+
+
+def test_pending_urls_skip_done_and_exhausted(tmp_path):
+    job = JobStore(str(tmp_path / 'job.sqlite'), max_attempts=2)
+    urls = job.add_urls(['a.test/1', ' ', 'a.test/2', 'a.test/3'])
+    assert urls == ['https://a.test/1', 'https://a.test/2', 'https://a.test/3']
+    job.add_result(urls[0], items_for(urls[0], 2))
+    job.add_result(urls[1], None, ValueError('gagal'))
+    assert job.pending_urls() == urls[1:]
+    job.add_result(urls[1], None, ValueError('gagal lagi'))
+    assert job.pending_urls() == urls[2:]
+    assert job.progress() == {'pending': 1, 'done': 1, 'failed': 1}
+    assert job.failures() == [(urls[1], 2, 'gagal lagi')]
+    assert len(job) == 2
+    job.add_urls(urls, reset=True)
+    assert job.pending_urls() == urls
+    job.close()
+
+
+def test_results_survive_reopen(tmp_path):
+    path = str(tmp_path / 'job.sqlite')
+    job = JobStore(path)
+    urls = job.add_urls(['a.test/1', 'a.test/2'])
+    job.add_result(urls[0], items_for(urls[0], 3))
+    job.close()
+    job = JobStore(path)
+    job.add_urls(urls)
+    assert job.pending_urls() == urls[1:]
+    assert [item['content'] for item in job] == ['Item 0', 'Item 1', 'Item 2']
+    job.close()
+
+
+def test_cli_resumes_job(site, tmp_path, capsys):
+    site.pages['/a'] = PAGE
+    path = str(tmp_path / 'job.sqlite')
+    args = [site.url('/a'), site.url('/b'), '--job', path, '--delay', '0', '-m', 'text',
+            '--retries', '0']
+    main(args)
+    site.pages['/b'] = PAGE
+    main(args)
+    assert 'Melanjutkan job: 1 URL sudah selesai, 1 tersisa' in capsys.readouterr().err
+    assert [path for _, path, _ in site.requests if path != '/robots.txt'] == ['/a', '/b', '/b']
+    job = JobStore(path)
+    assert job.progress() == {'pending': 0, 'done': 2, 'failed': 0}
+    assert len(job) == 2
+    job.close()
+    assert main(args) == 0
+    assert 'Tidak ada URL tersisa' in capsys.readouterr().err
+
+
+def test_resume_keeps_counting_attempts(tmp_path):
+    # Alur GUI: offer_resume mendaftarkan ulang URL pending tanpa reset
+    job = JobStore(str(tmp_path / 'job.sqlite'), max_attempts=3)
+    job.add_urls(['a.test/gagal'], reset=True)
+    for _ in range(3):
+        urls = job.add_urls(job.pending_urls())
+        job.add_result(urls[0], None, ValueError('gagal'))
+    assert job.pending_urls() == []
+    assert job.failures() == [('https://a.test/gagal', 3, 'gagal')]
+    job.close()
+
+
+def test_crawled_pages_do_not_become_job_urls(site, tmp_path):
+    site.pages['/'] = '<html><body><a href="/hilang">rusak</a><a href="/b">b</a></body></html>'
+    site.pages['/b'] = PAGE
+    job = JobStore(str(tmp_path / 'job.sqlite'))
+    engine = ScraperEngine(delay=0, respect_robots=False, max_retries=0)
+    stats = engine.crawl([site.url('/')], job, mode='text', max_depth=1)
+    engine.close()
+    assert stats['failed'] == 1 and stats['items'] == 1
+    assert job.pending_urls() == [] and job.failures() == []
+    assert job.progress() == {'pending': 0, 'done': 0, 'failed': 0}
+    assert len(job) == 1
+    job.close()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Test waktu per fase (Metrics) dan server metrics"""
+
+import json
+import os
+import subprocess
+import sys
+import urllib.request
+
+from scraper_engine import HttpCache, ListSink, Metrics, MetricsServer, ScraperEngine
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGE = '<html><body>' + ''.join('<p>Paragraf nomor %d dari halaman test</p>' % i for i in range(200)) + '</body></html>'
+
+
+def make_engine(metrics, **options):
+    return ScraperEngine(delay=0, respect_robots=False, metrics=metrics, **options)
+
+
+def test_phases_recorded_per_request(site):
+    site.pages['/a'] = PAGE
+    metrics = Metrics()
+    engine = make_engine(metrics)
+    items = engine.scrape_url(site.url('/a'), 'text')
+    engine.close()
+
+    snapshot = metrics.snapshot()
+    assert len(items) == 200
+    assert snapshot['counters']['requests'] == 1
+    assert snapshot['counters']['bytes'] == len(PAGE)
+    for phase in ('connect', 'ttfb', 'download', 'parse', 'total'):
+        assert snapshot['phases'][phase]['count'] == 1
+    assert snapshot['phases']['total']['max'] < 5
+    assert list(snapshot['hosts']) == [site.base.split('//')[1]]
+
+
+def test_cache_revalidation_timings(site, tmp_path):
+    # 304: body dari cache di-replay ke parser, waktu download tetap wajar
+    site.pages['/a'] = PAGE
+    metrics = Metrics()
+    cache = HttpCache(str(tmp_path / 'cache.sqlite'))
+    engine = make_engine(metrics, cache=cache)
+    first = engine.scrape_url(site.url('/a'), 'text')
+    second = engine.scrape_url(site.url('/a'), 'text')
+    engine.close()
+    cache.close()
+
+    assert [status for _, _, status in site.requests] == [200, 304]
+    assert len(second) == len(first) == 200
+    snapshot = metrics.snapshot()
+    assert snapshot['phases']['download']['count'] == 2
+    assert snapshot['phases']['download']['max'] < 5
+    assert snapshot['phases']['total']['sum'] < 10
+    assert snapshot['phases']['download']['sum'] <= snapshot['phases']['total']['sum']
+
+
+def test_errors_counted_per_host(site):
+    metrics = Metrics()
+    engine = make_engine(metrics, max_retries=0)
+    stats = engine.scrape_many([site.url('/tidak-ada')], ListSink(), mode='text')
+    engine.close()
+
+    assert stats['failed'] == 1
+    snapshot = metrics.snapshot()
+    assert snapshot['counters']['errors'] == 1
+    assert snapshot['hosts'][site.base.split('//')[1]]['errors'] == 1
+
+
+def test_bottleneck_group():
+    metrics = Metrics()
+    metrics.add('http://a.test/', {'ttfb': 0.1, 'parse': 0.5, 'total': 0.6})
+    group, seconds, percent = metrics.bottleneck()
+    assert group == 'parsing'
+    assert abs(seconds - 0.5) < 1e-9
+    assert round(percent) == 83
+
+
+def test_metrics_server(site):
+    metrics = Metrics()
+    metrics.add('http://a.test/', {'ttfb': 0.02, 'total': 0.03}, nbytes=100)
+    server = MetricsServer(metrics, port=0)
+    try:
+        base = 'http://127.0.0.1:%d' % server.port
+        text = urllib.request.urlopen(base + '/metrics').read().decode()
+        data = json.loads(urllib.request.urlopen(base + '/metrics.json').read())
+    finally:
+        server.close()
+    assert 'easyscraper_requests_total 1' in text
+    assert 'easyscraper_phase_seconds_bucket' in text
+    assert data['counters']['bytes'] == 100
+
+
+
+def test_engine_import_does_not_load_http_server():
+    code = 'import sys, scraper_engine; print("http.server" in sys.modules)'
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=ROOT, check=True).stdout
+    assert output.strip() == 'False'
+
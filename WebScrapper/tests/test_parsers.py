@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Conformance parser backend: hasil extractor lxml/selectolax harus sama dengan bs4"""
+
+import pytest
+
+from scraper_engine.extractor import extract
+from scraper_engine.parsers import available_backends, decode_html
+
+BASE_URL = 'https://example.com/kategori/'
+
+SAMPLES = {
+    'dasar': """<html><head><title>Contoh</title><style>p { color: red }</style></head>
+<body><h1>Judul halaman contoh yang panjang</h1>
+<div><p>Paragraf pertama yang cukup panjang untuk lolos filter.</p>
+<span>teks span pendek sekali ya</span></div>
+<a href="/a.html">Link A</a> <a href="b.html?x=1&amp;y=2">Link &amp; B</a>
+<a href>kosong</a><a name="anchor">tanpa href</a>
+<img src="x.png" alt="gambar"><img src="//cdn.example.com/y.jpg"><img alt="tanpa src">
+</body></html>""",
+    'nested': """<html><body><div class="a"><div class="b"><div class="c">
+<p>Teks <b>tebal</b> dan <i>miring</i> di dalam paragraf panjang.</p>
+<span>Span dengan <a href="/dalam">link di dalam span</a> ekor</span>
+</div> tail setelah c </div><!-- komentar yang tidak dihitung --> tail b</div></body></html>""",
+    'script': """<html><body><div>Sebelum script yang panjang <script>var x = "<p>bukan teks</p>";</script>
+sesudah script <template><b>isi template</b></template> akhir</div>
+<p>Entitas &lt;tag&gt; &copy; 2024 &nbsp; unicode: héllo wörld 日本語</p></body></html>""",
+    'listing': '<html><body><ul>' + ''.join(
+        f'<li><div class="item"><h2>Produk nomor {i} dengan nama panjang</h2>'
+        f'<p>Deskripsi produk {i} yang cukup panjang untuk lolos filter teks.</p>'
+        f'<a href="/produk/{i}">Lihat produk {i}</a><img src="/img/{i}.jpg" alt="foto {i}">'
+        f'<span class="harga">Rp {i * 1000:,}</span></div></li>'
+        for i in range(50)) + '</ul></body></html>',
+    'latin1': '<html><head><meta charset="iso-8859-1"></head><body>'
+              '<p>Caf\xe9 dengan cr\xe8me br\xfbl\xe9e yang enak sekali</p></body></html>',
+}
+
+BACKENDS = [name for name in ('lxml', 'selectolax') if name in available_backends()]
+
+MODES = ['text', 'links', 'images', 'basic']
+CUSTOM_SELECTORS = ['h1, h2', 'a[href]', '.harga', 'p']
+
+
+def encode(name):
+    return SAMPLES[name].encode('iso-8859-1' if name == 'latin1' else 'utf-8')
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('mode', MODES)
+@pytest.mark.parametrize('sample', list(SAMPLES))
+def test_backend_matches_bs4(backend, mode, sample):
+    content = encode(sample)
+    assert extract(BASE_URL, content, mode, parser=backend) == \
+        extract(BASE_URL, content, mode, parser='bs4')
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('selector', CUSTOM_SELECTORS)
+@pytest.mark.parametrize('sample', list(SAMPLES))
+def test_custom_selector_matches_bs4(backend, selector, sample):
+    content = encode(sample)
+    expected = extract(BASE_URL, content, 'custom', selector, parser='bs4')
+    actual = extract(BASE_URL, content, 'custom', selector, parser=backend)
+    # Format str(element) boleh beda; item berupa teks harus sama persis
+    assert len(actual) == len(expected)
+    assert [i['content'] for i in actual if not i['content'].startswith('<')] == \
+        [i['content'] for i in expected if not i['content'].startswith('<')]
+
+
+@pytest.mark.parametrize('mode', ['links', 'images'])
+@pytest.mark.parametrize('sample', list(SAMPLES))
+def test_stream_links_and_images_match_bs4(mode, sample):
+    content = encode(sample)
+    assert extract(BASE_URL, content, mode, parser='stream') == \
+        extract(BASE_URL, content, mode, parser='bs4')
+
+
+def test_decode_html_uses_meta_charset():
+    assert 'Café' in decode_html(encode('latin1'))
+
+
+def test_bs4_is_always_available():
+    assert 'bs4' in available_backends()
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        extract(BASE_URL, b'<p>x</p>', 'semua')
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Test parse di process pool: hasil sama dengan parse di thread, antrian terbatas"""
+
+from scraper_engine import ListSink, ScraperEngine
+from scraper_engine.extractor import extract
+from scraper_engine.pipeline import ParsePool, compact, expand, resolve_workers
+
+PAGE = ('<html><body><h1>Judul halaman contoh yang cukup panjang</h1>'
+        '<p>Paragraf pertama yang cukup panjang untuk lolos filter teks.</p>'
+        '<table><tr><th>Nama</th><th>Harga</th></tr><tr><td>Buku</td><td>10</td></tr></table>'
+        '<a href="/lain">Halaman lain</a><img src="x.png" alt="gambar"></body></html>')
+
+
+def test_compact_roundtrip():
+    for mode in ('text', 'links', 'images', 'basic', 'tables'):
+        results = extract('https://contoh.test/', PAGE.encode(), mode)
+        assert expand(compact(results)) == results
+
+
+def test_resolve_workers():
+    assert resolve_workers(0) == 0
+    assert resolve_workers(None) == 0
+    assert resolve_workers(3) == 3
+    assert resolve_workers(-1) >= 1
+
+
+def test_parse_pool_matches_inline_extract():
+    expected = extract('https://contoh.test/', PAGE.encode(), 'basic', parser='bs4')
+    with ParsePool(2, queue_size=1) as pool:
+        futures = [pool.submit('https://contoh.test/', PAGE.encode(), 'basic', parser='bs4')
+                   for _ in range(6)]
+        outputs = [future.result() for future in futures]
+    for rows, phases in outputs:
+        assert expand(rows) == expected
+        assert 'parse' in phases
+
+
+def test_scrape_many_with_parse_pool(site):
+    for i in range(4):
+        site.pages[f'/p{i}'] = PAGE
+    sink = ListSink()
+    engine = ScraperEngine(delay=0, respect_robots=False, parse_workers=2, parser='bs4')
+    stats = engine.scrape_many([site.url(f'/p{i}') for i in range(4)], sink, mode='text')
+    engine.close()
+    assert stats['failed'] == 0
+    assert len(sink.items) == 4 * len(extract(site.url('/p0'), PAGE.encode(), 'text', parser='bs4'))
+    assert {item['url'] for item in sink.items} == {site.url(f'/p{i}') for i in range(4)}
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Test RecordTable: penyimpanan kolom ringkas dengan tampilan dict per baris"""
+
+import pytest
+
+from scraper_engine import RecordTable
+
+ITEMS = [
+    {'url': 'https://a.test/', 'timestamp': '2024-05-01 10:00:00', 'type': 'text', 'content': 'Satu'},
+    {'url': 'https://a.test/', 'timestamp': '2024-05-01 10:00:00', 'type': 'link',
+     'content': 'https://b.test/', 'text': 'Ke B'},
+    {'url': 'https://b.test/', 'timestamp': '2024-05-01 10:00:05', 'type': 'image',
+     'content': 'https://b.test/x.png', 'alt': 'gambar'},
+]
+
+
+def test_records_behave_like_original_dicts():
+    table = RecordTable(ITEMS)
+    assert len(table) == 3
+    assert table.as_dicts() == ITEMS
+    assert dict(table[-1]) == ITEMS[-1]
+    assert [dict(record) for record in table[0:2]] == ITEMS[:2]
+    assert table[1]['text'] == 'Ke B'
+    assert 'text' not in table[0]
+    with pytest.raises(KeyError):
+        table[0]['alt']
+    with pytest.raises(IndexError):
+        table[3]
+
+
+def test_fields_and_unique_urls():
+    table = RecordTable(ITEMS)
+    assert table.fields == ['url', 'timestamp', 'type', 'content', 'text', 'alt']
+    assert table.unique_urls() == 2
+    assert table.nbytes() > 0
+
+
+def test_clear_and_append_row_with_int_timestamp():
+    table = RecordTable(ITEMS)
+    table.clear()
+    assert len(table) == 0 and table.fields == ['url', 'timestamp', 'type', 'content']
+    table.append_row('https://c.test/', 0, 'text', 'Epoch')
+    assert table[0]['timestamp'] == '1970-01-01 00:00:00'
+
+
+def test_to_pandas_uses_categoricals():
+    pd = pytest.importorskip('pandas')
+    frame = RecordTable(ITEMS).to_pandas()
+    assert list(frame.columns) == ['url', 'timestamp', 'type', 'content', 'text', 'alt']
+    assert isinstance(frame['url'].dtype, pd.CategoricalDtype)
+    assert frame['timestamp'].iloc[2] == pd.Timestamp('2024-05-01 10:00:05')
+    assert frame['text'].isna().tolist() == [True, False, True]
+    assert frame['text'].iloc[1] == 'Ke B'
+
+
+def test_to_arrow():
+    pytest.importorskip('pyarrow')
+    table = RecordTable(ITEMS).to_arrow()
+    assert table.num_rows == 3
+    assert table.column('url').to_pylist() == [item['url'] for item in ITEMS]
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Test DnsCache, Prewarmer, dan lookahead on_upcoming di HostScheduler"""
+
+import socket
+import threading
+import time
+
+import pytest
+
+from scraper_engine import DnsCache, HostScheduler, HttpClient, ListSink, Prewarmer, ScraperEngine
+
+ADDR = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', 0))]
+PAGE = '<html><body><p>Paragraf yang cukup panjang untuk diambil.</p></body></html>'
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """getaddrinfo palsu: host 'mati.test' gagal, host lain -> 10.0.0.1"""
+    calls = []
+
+    def fake(host, port, family=0, type=0, proto=0, flags=0):
+        calls.append((host, port, type))
+        if host == 'mati.test':
+            raise socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        return ADDR
+
+    monkeypatch.setattr(socket, 'getaddrinfo', fake)
+    return calls
+
+
+def test_resolve_is_cached_until_ttl(lookups):
+    dns = DnsCache(ttl=0.2)
+    assert dns.resolve('A.test') == ADDR
+    assert dns.resolve('a.test') == ADDR
+    assert len(lookups) == 1 and dns.stats == {'hits': 1, 'lookups': 1, 'failures': 0}
+    time.sleep(0.25)
+    dns.resolve('a.test')
+    assert len(lookups) == 2
+
+
+def test_failures_are_cached_with_negative_ttl(lookups):
+    dns = DnsCache(negative_ttl=60)
+    for _ in range(3):
+        with pytest.raises(socket.gaierror):
+            dns.resolve('mati.test')
+    assert len(lookups) == 1 and dns.stats['failures'] == 1
+
+
+def test_max_entries_drops_oldest(lookups):
+    dns = DnsCache(max_entries=2)
+    for host in ('a.test', 'b.test', 'c.test'):
+        dns.resolve(host)
+    assert len(dns) == 2
+    dns.resolve('a.test')
+    assert len(lookups) == 4
+
+
+def test_install_routes_tcp_queries_through_cache(lookups):
+    original = socket.getaddrinfo
+    dns = DnsCache().install()
+    try:
+        assert socket.getaddrinfo != original
+        result = socket.getaddrinfo('a.test', 443, 0, socket.SOCK_STREAM)
+        assert result[0][4] == ('10.0.0.1', 443)
+        socket.getaddrinfo('a.test', '80', socket.AF_INET, socket.SOCK_STREAM)
+        assert len(lookups) == 1
+        # UDP dan IP literal langsung ke getaddrinfo asli
+        socket.getaddrinfo('a.test', 53, 0, socket.SOCK_DGRAM)
+        socket.getaddrinfo('127.0.0.1', 80, 0, socket.SOCK_STREAM)
+        assert [host for host, _, _ in lookups] == ['a.test', 'a.test', '127.0.0.1']
+        assert socket.getaddrinfo('a.test', 80, socket.AF_INET6, socket.SOCK_STREAM) == []
+    finally:
+        dns.uninstall()
+    assert socket.getaddrinfo == original
+    dns.uninstall()
+
+
+def test_upcoming_hosts_are_announced_ahead(lookups):
+    announced = []
+    started = []
+    lock = threading.Lock()
+    scheduler = HostScheduler(max_workers=1, delay=0, on_upcoming=announced.append, lookahead=2)
+    urls = [f'https://h{n}.test/{page}' for n in range(6) for page in range(2)]
+    for url in urls:
+        scheduler.add(url)
+
+    def task(url):
+        with lock:
+            started.append((url, len(announced)))
+        return url
+
+    scheduler.run(task, lambda url, result, error: None)
+    # Sekali per host, URL pertamanya, sesuai urutan antrian
+    assert announced == [f'https://h{n}.test/0' for n in range(6)]
+    # Saat request pertama host ke-n mulai, paling banyak `lookahead` host di depannya
+    first = [count for url, count in started if url.endswith('/0')]
+    assert first == sorted(first)
+    assert all(n + 1 <= count <= n + 3 for n, count in enumerate(first))
+
+
+def test_prewarmer_opens_pooled_connection(site):
+    site.pages['/a'] = PAGE
+    client = HttpClient()
+    warmer = Prewarmer(client, connect=True)
+    warmer.warm(site.url('/a'))
+    deadline = time.monotonic() + 5
+    while warmer.stats['hosts'] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert warmer.stats == {'hosts': 1, 'connections': 1, 'failures': 0}
+    assert client.preconnect(site.url('/a')) is False
+    client.get(site.url('/a'))
+    client.get(site.url('/a'))
+    assert len(site.connections) == 1
+    warmer.close()
+    client.close()
+
+
+def test_engine_prewarm_stats(site):
+    site.pages['/a'] = PAGE
+    engine = ScraperEngine(delay=0, respect_robots=False, prewarm=True)
+    assert engine.prewarm_stats is None
+    stats = engine.scrape_many([site.url('/a')], ListSink(), mode='text')
+    assert stats['failed'] == 0
+    assert engine.prewarm_stats['failures'] == 0
+    engine.close()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Test retry: klasifikasi error, backoff, AIMD per host, dan laporan kegagalan"""
+
+import csv
+import socket
+import time
+
+import pytest
+import requests
+
+from scraper_engine import (DownloadRejected, FailureReport, HttpError, ListSink, RateController,
+                            RetryPolicy, RobotsDisallowed, ScraperEngine, classify_error)
+from scraper_engine.fetcher import parse_retry_after
+
+PAGE = '<html><body><p>Paragraf yang cukup panjang untuk diambil.</p></body></html>'
+
+
+@pytest.mark.parametrize('error, category', [
+    (RobotsDisallowed('u'), 'robots'),
+    (DownloadRejected('u', 'terlalu besar'), 'rejected'),
+    (HttpError('u', 429), 'throttled'),
+    (HttpError('u', 503), 'throttled'),
+    (HttpError('u', 500), 'server'),
+    (HttpError('u', 404), 'client'),
+    (requests.ReadTimeout(), 'timeout'),
+    (socket.timeout(), 'timeout'),
+    (requests.ConnectionError(), 'connection'),
+    (ValueError('x'), 'other'),
+])
+def test_classify_error(error, category):
+    assert classify_error(error) == category
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('120') == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('bukan tanggal') is None
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+
+
+def test_policy_wait_is_capped_and_honours_retry_after():
+    policy = RetryPolicy(base=1.0, cap=4.0, max_retry_after=10.0)
+    assert all(0 <= policy.wait(attempt) <= min(4.0, 2 ** attempt) for attempt in range(6)
+               for _ in range(20))
+    assert policy.wait(0, retry_after=5) >= 5
+    assert policy.wait(0, retry_after=3600) <= 10.0
+    assert RetryPolicy(max_retries=-1).max_retries == 0
+
+
+def test_rate_controller_aimd():
+    rate = RateController(min_delay=0.0, max_delay=5.0, increase=0.5)
+    assert rate.delay('a') == 0.0
+    rate.on_throttle('a')
+    assert rate.delay('a') == 1.0
+    rate.on_throttle('a')
+    assert rate.delay('a') == 2.0
+    assert rate.delay('b') == 0.0
+    rate.on_success('a')
+    assert rate.delay('a') == pytest.approx(1.0)
+    for _ in range(3):
+        rate.on_throttle('a')
+    assert rate.delay('a') == 5.0
+    delays = []
+    for _ in range(20):
+        rate.on_success('a')
+        delays.append(rate.delay('a'))
+    assert delays == sorted(delays, reverse=True) and delays[-1] < 0.1
+
+
+def test_rate_controller_never_goes_below_floor():
+    rate = RateController(min_delay=0.2)
+    rate.set_floor('a', 3)
+    assert rate.delay('a') == 3.0 and rate.delay('b') == 0.2
+    rate.on_throttle('a')
+    assert rate.delay('a') == 6.0
+    for _ in range(50):
+        rate.on_success('a')
+    assert rate.delay('a') == 3.0
+
+
+def test_failure_report(tmp_path):
+    report = FailureReport()
+    report.add('https://a.test/1', HttpError('https://a.test/1', 500), 3)
+    report.add('https://a.test/2', HttpError('https://a.test/2', 502), 3)
+    report.add('https://a.test/3', HttpError('https://a.test/3', 404), 1)
+    assert len(report) == 3
+    assert report.counts() == {'server': 2, 'client': 1}
+    assert report.summary() == 'server: 2, client: 1'
+    path = tmp_path / 'gagal.csv'
+    report.write_csv(str(path))
+    with open(path, encoding='utf-8') as handle:
+        rows = list(csv.DictReader(handle))
+    assert rows[2] == {'url': 'https://a.test/3', 'category': 'client', 'attempts': '1',
+                       'error': 'HTTP 404 untuk https://a.test/3'}
+
+
+def test_engine_retries_after_retry_after(site):
+    site.pages['/a'] = PAGE
+    site.errors['/a'] = [(503, {'Retry-After': '1'})]
+    engine = ScraperEngine(delay=0, respect_robots=False, max_retries=2, backoff=0.01)
+    sink = ListSink()
+    start = time.monotonic()
+    stats = engine.scrape_many([site.url('/a')], sink, mode='text')
+    assert time.monotonic() - start >= 0.9
+    assert [status for _, _, status in site.requests] == [503, 200]
+    assert stats['retries'] == 1 and stats['failed'] == 0 and len(sink.items) == 1
+    engine.close()
+
+
+def test_engine_reports_exhausted_and_permanent_failures(site):
+    site.errors['/rusak'] = [(500, {})] * 3
+    engine = ScraperEngine(delay=0, respect_robots=False, max_retries=2, backoff=0.01)
+    stats = engine.scrape_many([site.url('/rusak'), site.url('/hilang')], ListSink(), mode='text')
+    assert stats['failed'] == 2 and stats['retries'] == 2
+    assert [path for _, path, _ in site.requests].count('/hilang') == 1
+    failures = {entry['url']: entry for entry in stats['failures']}
+    assert failures[site.url('/rusak')]['category'] == 'server'
+    assert failures[site.url('/rusak')]['attempts'] == 3
+    assert failures[site.url('/hilang')]['category'] == 'client'
+    assert failures[site.url('/hilang')]['attempts'] == 1
+    engine.close()
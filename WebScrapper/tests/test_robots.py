@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Test RobotsPolicy: robots.txt di-cache per host dan dicek sebelum setiap fetch"""
+
+import time
+
+import pytest
+
+from scraper_engine import HttpClient, ListSink, RobotsDisallowed, RobotsPolicy, ScraperEngine
+
+PAGE = '<html><body><p>Paragraf yang cukup panjang untuk diambil.</p></body></html>'
+ROBOTS = 'User-agent: *\nDisallow: /rahasia\nCrawl-delay: 1\n'
+
+
+def robots_requests(site):
+    return [path for _, path, _ in site.requests if path == '/robots.txt']
+
+
+def test_robots_fetched_once_per_host(site):
+    site.pages['/robots.txt'] = ROBOTS
+    policy = RobotsPolicy(HttpClient())
+    assert policy.can_fetch(site.url('/a'))
+    assert not policy.can_fetch(site.url('/rahasia/b'))
+    assert policy.crawl_delay(site.url('/a')) == 1.0
+    assert len(robots_requests(site)) == 1
+    policy.invalidate(site.url('/'))
+    policy.can_fetch(site.url('/a'))
+    assert len(robots_requests(site)) == 2
+
+
+def test_expired_entry_is_refetched(site):
+    site.pages['/robots.txt'] = ROBOTS
+    policy = RobotsPolicy(HttpClient(), ttl=0)
+    policy.can_fetch(site.url('/a'))
+    policy.can_fetch(site.url('/a'))
+    assert len(robots_requests(site)) == 2
+
+
+def test_status_rules(site):
+    policy = RobotsPolicy(HttpClient())
+    entry = policy.entry(site.url('/a'))
+    assert entry.status == 404 and not entry.found
+    assert entry.can_fetch(site.url('/rahasia'))
+
+
+def test_unreachable_host_is_cached_as_error():
+    policy = RobotsPolicy(HttpClient(), timeout=2)
+    entry = policy.entry('http://127.0.0.1:1/a')
+    assert entry.error is not None and entry.status is None
+    assert entry.can_fetch('http://127.0.0.1:1/a')
+    assert policy.entry('http://127.0.0.1:1/b') is entry
+
+
+def test_engine_blocks_disallowed_urls(site):
+    site.pages['/robots.txt'] = ROBOTS
+    site.pages['/rahasia'] = PAGE
+    engine = ScraperEngine(delay=0, max_retries=2)
+    with pytest.raises(RobotsDisallowed):
+        engine.scrape_url(site.url('/rahasia'), 'text')
+    progress = []
+    stats = engine.scrape_many([site.url('/rahasia')], ListSink(), mode='text',
+                               on_progress=lambda *args: progress.append(args))
+    assert stats['failed'] == 1 and stats['retries'] == 0
+    assert isinstance(progress[0][4], RobotsDisallowed)
+    assert robots_requests(site) == [p for _, p, _ in site.requests]
+    engine.close()
+
+
+def test_engine_applies_crawl_delay(site):
+    site.pages['/robots.txt'] = ROBOTS
+    site.pages['/a'] = site.pages['/b'] = PAGE
+    engine = ScraperEngine(delay=0)
+    start = time.monotonic()
+    stats = engine.scrape_many([site.url('/a'), site.url('/b')], ListSink(),
+                               mode='text')
+    assert stats['done'] == 2 and stats['failed'] == 0
+    assert time.monotonic() - start >= 0.9
+    engine.close()
+
+
+def test_check_many_returns_results_in_input_order(site):
+    site.pages['/robots.txt'] = ROBOTS
+    other = site.url('/a').replace('127.0.0.1', 'localhost')
+    urls = [site.url('/a'), site.url('/rahasia'), 'http://127.0.0.1:1/a', other]
+    policy = RobotsPolicy(HttpClient(), timeout=2)
+    seen = []
+    results = policy.check_many(urls, workers=4, on_result=lambda i, check: seen.append(i))
+    assert sorted(seen) == [0, 1, 2, 3]
+    assert [check.url for check in results] == urls
+    assert [check.outcome for check in results] == ['allowed', 'blocked', 'error', 'allowed']
+    assert results[0].crawl_delay == 1.0 and results[0].status == 200
+    assert results[0].host != results[3].host
+    # Satu robots.txt per host walau dicek paralel
+    assert len(robots_requests(site)) == 2
+
+
+def test_check_many_stops_early(site):
+    urls = [site.url(f'/{n}') for n in range(10)]
+    policy = RobotsPolicy(HttpClient())
+    results = policy.check_many(urls, workers=1, should_continue=lambda: False)
+    assert sum(check is not None for check in results) == 1
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Test HostScheduler: batas global, batas per host, delay per host, stop"""
+
+import threading
+import time
+
+from scraper_engine import HostScheduler
+
+
+class Recorder:
+    """Task palsu yang mencatat waktu mulai dan concurrency per host"""
+
+    def __init__(self, duration=0.05):
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.total = 0
+        self.peak_total = 0
+        self.starts = {}
+
+    def __call__(self, url):
+        host = HostScheduler.host_of(url)
+        with self.lock:
+            self.starts.setdefault(host, []).append(time.monotonic())
+            self.active[host] = self.active.get(host, 0) + 1
+            self.total += 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+            self.peak_total = max(self.peak_total, self.total)
+        time.sleep(self.duration)
+        with self.lock:
+            self.active[host] -= 1
+            self.total -= 1
+        if url.endswith('/gagal'):
+            raise ValueError(url)
+        return url.upper()
+
+
+def run(scheduler, urls, task, should_continue=lambda: True):
+    results = {}
+    for url in urls:
+        scheduler.add(url)
+    scheduler.run(task, lambda url, result, error: results.__setitem__(url, (result, error)),
+                  should_continue)
+    return results
+
+
+def test_every_url_delivered_with_result_or_error():
+    urls = [f'http://h{i % 3}.test/{i}' for i in range(9)] + ['http://h0.test/gagal']
+    results = run(HostScheduler(max_workers=4, delay=0), urls, Recorder(0.01))
+    assert set(results) == set(urls)
+    assert results['http://h1.test/1'] == ('HTTP://H1.TEST/1', None)
+    assert isinstance(results['http://h0.test/gagal'][1], ValueError)
+
+
+def test_per_host_and_global_limits():
+    task = Recorder()
+    urls = [f'http://h{i % 4}.test/{i}' for i in range(24)]
+    run(HostScheduler(max_workers=6, per_host=2, delay=0), urls, task)
+    assert max(task.peak.values()) == 2
+    assert task.peak_total <= 6
+    # Host berbeda tetap berjalan paralel
+    assert task.peak_total > 2
+
+
+def test_delay_between_requests_to_same_host():
+    task = Recorder(0.01)
+    urls = [f'http://a.test/{i}' for i in range(3)] + [f'http://b.test/{i}' for i in range(3)]
+    start = time.monotonic()
+    run(HostScheduler(max_workers=8, per_host=1, delay=0.1), urls, task)
+    elapsed = time.monotonic() - start
+    for starts in task.starts.values():
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        # Delay dihitung dari selesainya request sebelumnya (durasi 0.01 s)
+        assert all(gap >= 0.1 for gap in gaps)
+    # Dua host berjalan bersamaan, bukan 6 x delay berurutan
+    assert elapsed < 0.5
+
+
+def test_host_delay_override():
+    task = Recorder(0)
+    scheduler = HostScheduler(max_workers=4, delay=0)
+    scheduler.set_host_delay('lambat.test', 0.15)
+    run(scheduler, ['http://lambat.test/1', 'http://lambat.test/2', 'http://cepat.test/1'], task)
+    starts = task.starts['lambat.test']
+    assert starts[1] - starts[0] >= 0.15
+    assert scheduler.delay_for('cepat.test') == 0
+
+
+def test_front_puts_url_first_for_its_host():
+    order = []
+    scheduler = HostScheduler(max_workers=1, delay=0)
+    scheduler.add('http://a.test/1')
+    scheduler.add('http://a.test/2')
+    scheduler.add('http://a.test/0', front=True)
+    scheduler.run(lambda url: url, lambda url, result, error: order.append(url))
+    assert order == ['http://a.test/0', 'http://a.test/1', 'http://a.test/2']
+
+
+def test_stop_drops_queue_but_finishes_running_requests():
+    results = {}
+    scheduler = HostScheduler(max_workers=2, delay=0)
+    for i in range(50):
+        scheduler.add(f'http://h{i}.test/')
+    scheduler.run(Recorder(0.02), lambda url, result, error: results.__setitem__(url, error),
+                  should_continue=lambda: len(results) < 4)
+    # Berhenti setelah 4 hasil; request yang sudah berjalan tetap dilaporkan
+    assert 4 <= len(results) <= 6
+    assert all(error is None for error in results.values())
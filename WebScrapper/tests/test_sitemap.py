@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Test sitemap: parser incremental, gzip, sitemap index, dan filter lastmod"""
+
+import gzip
+from datetime import date, datetime, timezone
+
+import pytest
+
+from scraper_engine import ScraperEngine, SitemapParser, SitemapReader
+from scraper_engine.sitemap import is_sitemap_url, parse_lastmod
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def urlset(*entries):
+    body = ''.join(f'<url><loc>{loc}</loc>' + (f'<lastmod>{lastmod}</lastmod>' if lastmod else '')
+                   + '</url>' for loc, lastmod in entries)
+    return f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset {NS}>{body}</urlset>'
+
+
+def index(*entries):
+    body = ''.join(f'<sitemap><loc>{loc}</loc><lastmod>{lastmod}</lastmod></sitemap>'
+                   for loc, lastmod in entries)
+    return f'<sitemapindex {NS}>{body}</sitemapindex>'
+
+
+def parse_all(data, size):
+    parser = SitemapParser()
+    entries = []
+    for start in range(0, len(data), size):
+        entries.extend(parser.feed(data[start:start + size]))
+    return entries + parser.close()
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('2024', datetime(2024, 1, 1, tzinfo=timezone.utc)),
+    ('2024-05-01', datetime(2024, 5, 1, tzinfo=timezone.utc)),
+    ('2024-05-01T10:00+07:00', datetime(2024, 5, 1, 3, tzinfo=timezone.utc)),
+    ('2024-05-01T10:00:30.5Z', datetime(2024, 5, 1, 10, 0, 30, tzinfo=timezone.utc)),
+    ('2024-13-01', None),
+    ('kemarin', None),
+])
+def test_parse_lastmod(text, expected):
+    assert parse_lastmod(text) == expected
+
+
+def test_is_sitemap_url():
+    assert is_sitemap_url('https://a.test/sitemap.xml.gz')
+    assert is_sitemap_url('https://a.test/sitemap_index?page=2')
+    assert not is_sitemap_url('https://a.test/berita/1')
+
+
+@pytest.mark.parametrize('size', [1, 7, 4096])
+def test_parser_any_chunk_size(size):
+    data = urlset(('https://a.test/1', '2024-05-01'), ('https://a.test/2', None)).encode()
+    entries = parse_all(data, size)
+    assert [(e.loc, e.kind) for e in entries] == [('https://a.test/1', 'url'),
+                                                  ('https://a.test/2', 'url')]
+    assert entries[0].lastmod == datetime(2024, 5, 1, tzinfo=timezone.utc)
+    assert entries[1].lastmod is None
+
+
+def test_parser_gzip_and_text_formats():
+    data = gzip.compress(urlset(*[(f'https://a.test/{n}', None) for n in range(500)]).encode())
+    assert len(parse_all(data, 100)) == 500
+    text = b'\xef\xbb\xbfhttps://a.test/1\r\n\nbukan url\nhttps://a.test/2'
+    assert [e.loc for e in parse_all(text, 5)] == ['https://a.test/1', 'https://a.test/2']
+
+
+def test_parser_size_limit():
+    parser = SitemapParser(max_bytes=100)
+    with pytest.raises(ValueError):
+        parser.feed(urlset(*[(f'https://a.test/{n}', None) for n in range(10)]).encode())
+
+
+@pytest.fixture
+def engine():
+    engine = ScraperEngine(delay=0, respect_robots=False)
+    yield engine
+    engine.close()
+
+
+def test_reader_follows_index_and_filters_lastmod(site, engine):
+    site.pages['/robots.txt'] = f'Sitemap: {site.url("/index.xml")}\n'
+    site.pages['/index.xml'] = index((site.url('/baru.xml.gz'), '2024-06-01'),
+                                     (site.url('/lama.xml'), '2023-01-01'))
+    site.pages['/baru.xml.gz'] = gzip.compress(urlset(
+        (site.url('/a'), '2024-06-01'), (site.url('/b'), '2024-04-01'),
+        (site.url('/c'), None), (site.url('/a#atas'), '2024-06-01')).encode())
+    site.pages['/lama.xml'] = urlset((site.url('/lama'), '2023-01-01'))
+    reader = SitemapReader(engine, since=date(2024, 5, 1))
+    found = []
+    urls = reader.read([site.base], on_url=found.append)
+    assert urls == found == [site.url('/a'), site.url('/c')]
+    assert reader.stats == {'sitemaps': 2, 'urls': 2, 'old': 1, 'old_sitemaps': 1,
+                            'duplicates': 1}
+    assert '/lama.xml' not in [path for _, path, _ in site.requests]
+
+
+def test_reader_defaults_to_sitemap_xml_and_records_errors(site, engine, tmp_path):
+    site.pages['/sitemap.xml'] = urlset((site.url('/a'), None), (site.url('/b'), None))
+    local = tmp_path / 'peta.txt'
+    local.write_text('https://lokal.test/1\n', encoding='utf-8')
+    reader = SitemapReader(engine, keep_undated=False, max_urls=2)
+    assert reader.read([site.base, str(local), site.url('/hilang.xml')]) == [
+        site.url('/a'), site.url('/b')]
+    reader = SitemapReader(engine)
+    assert reader.read([str(local), site.url('/hilang.xml')]) == ['https://lokal.test/1']
+    assert [sitemap for sitemap, _ in reader.errors] == [site.url('/hilang.xml')]
+
+
+def test_since_rejects_bad_dates(engine):
+    with pytest.raises(ValueError):
+        SitemapReader(engine, since='kemarin')
+
+
+def test_remote_sitemaps_cannot_open_local_files(site, engine, tmp_path):
+    local = tmp_path / 'lokal.txt'
+    local.write_text('https://rahasia.test/1\n', encoding='utf-8')
+    site.pages['/index.xml'] = index((str(local), '2024-06-01'),
+                                     (f'file://{local}', '2024-06-01'),
+                                     (site.url('/a.xml'), '2024-06-01'))
+    site.pages['/a.xml'] = urlset((site.url('/a'), None))
+    reader = SitemapReader(engine)
+    assert reader.read([site.url('/index.xml')]) == [site.url('/a')]
+    assert [sitemap for sitemap, _ in reader.errors] == [str(local), f'file://{local}']
+    assert all(isinstance(error, ValueError) for _, error in reader.errors)
+
+
+def test_robots_sitemap_lines_must_be_urls(site, engine, tmp_path):
+    local = tmp_path / 'lokal.txt'
+    local.write_text('https://rahasia.test/1\n', encoding='utf-8')
+    site.pages['/robots.txt'] = f'Sitemap: {local}\n'
+    reader = SitemapReader(engine)
+    assert reader.read([site.base]) == []
+    assert [sitemap for sitemap, _ in reader.errors] == [str(local)]
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Test ResultStore: item streaming ke SQLite, dibaca ulang per batch"""
+
+import os
+
+from scraper_engine import ResultStore
+
+
+def items_for(url, count, start=0, **extra):
+    return [{'url': url, 'timestamp': '2024-05-01 10:00:00', 'type': 'text',
+             'content': f'Item {i}', **extra} for i in range(start, start + count)]
+
+
+def test_items_roundtrip_in_order(tmp_path):
+    store = ResultStore(str(tmp_path / 'hasil.sqlite'), window=5)
+    store.add_many(items_for('https://a.test/', 3))
+    store.add_many([{'url': 'https://b.test/', 'timestamp': '2024-05-01 10:00:01',
+                     'type': 'link', 'content': 'https://c.test/', 'text': 'Ke C'}])
+    assert len(store) == 4
+    assert store.unique_urls() == 2
+    items = list(store)
+    assert [item['content'] for item in items] == ['Item 0', 'Item 1', 'Item 2', 'https://c.test/']
+    assert items[3] == {'url': 'https://b.test/', 'timestamp': '2024-05-01 10:00:01',
+                        'type': 'link', 'content': 'https://c.test/', 'text': 'Ke C'}
+    assert 'text' not in items[0]
+    assert store.fields == ['url', 'timestamp', 'type', 'content', 'text']
+    store.close()
+
+
+def test_window_keeps_only_recent_items(tmp_path):
+    store = ResultStore(str(tmp_path / 'hasil.sqlite'), window=3)
+    store.add_many(items_for('https://a.test/', 10))
+    assert [item['content'] for item in store.recent(0)] == ['Item 7', 'Item 8', 'Item 9']
+    assert [item['content'] for item in store.recent(2)] == ['Item 8', 'Item 9']
+    assert len(store) == 10
+    store.close()
+
+
+def test_page_and_batches(tmp_path):
+    store = ResultStore(str(tmp_path / 'hasil.sqlite'))
+    store.add_many(items_for('https://a.test/', 25, harga=5))
+    assert [item['content'] for item in store.page(10, 3)] == ['Item 10', 'Item 11', 'Item 12']
+    batches = list(store.iter_batches(batch_size=10))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert batches[0][0] == ('https://a.test/', '2024-05-01 10:00:00', 'text', 'Item 0', 5)
+    store.close()
+
+
+def test_reopen_existing_file(tmp_path):
+    path = str(tmp_path / 'hasil.sqlite')
+    store = ResultStore(path)
+    store.add_many(items_for('https://a.test/', 2, label='x'))
+    store.close()
+    store = ResultStore(path)
+    assert len(store) == 2
+    store.add_many(items_for('https://b.test/', 1, start=2))
+    assert [item['url'] for item in store] == ['https://a.test/'] * 2 + ['https://b.test/']
+    assert store.fields[-1] == 'label'
+    store.close()
+
+
+def test_temporary_store_removed_on_close():
+    store = ResultStore()
+    store.add_many(items_for('https://a.test/', 1))
+    path = store.path
+    assert os.path.exists(path)
+    store.close()
+    assert not os.path.exists(path)
+
+
+def test_clear(tmp_path):
+    store = ResultStore(str(tmp_path / 'hasil.sqlite'))
+    store.add_many(items_for('https://a.test/', 4))
+    store.clear()
+    assert len(store) == 0 and list(store) == []
+    store.add_many(items_for('https://a.test/', 1))
+    assert [item['content'] for item in store] == ['Item 0']
+    store.close()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Test streaming extractor dibanding extractor DOM (bs4)"""
+
+import pytest
+
+from scraper_engine.extractor import extract
+from scraper_engine.streaming import StreamParser, make_extractor
+
+BASE_URL = 'https://example.com/kategori/'
+
+NESTED_INLINE = [
+    '<p>This is a <span>very important</span> sentence about things</p>',
+    '<div><p>Paragraf dengan <span>span <span>bersarang</span> dua</span> lapis di dalamnya</p></div>',
+    '<h2>Judul <span class="x">dengan</span> <b>tebal</b> dan <i>miring</i> sekali</h2>',
+    '<p>Harga <span>Rp <span>10.000</span></span> per <a href="/unit">unit barang</a> saja</p>',
+]
+
+PARAGRAPH_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+
+def stream(html, mode):
+    return extract(BASE_URL, html.encode('utf-8'), mode, parser='stream')
+
+
+def dom(html, mode):
+    return extract(BASE_URL, html.encode('utf-8'), mode, parser='bs4')
+
+
+@pytest.mark.parametrize('html', NESTED_INLINE)
+def test_inline_text_stays_in_paragraph(html):
+    # Setiap paragraf/judul sama persis dengan get_text(strip=True) bs4
+    expected = [item for item in dom(html, 'text') if item['tag'] in PARAGRAPH_TAGS]
+    actual = [item for item in stream(html, 'text') if item['tag'] in PARAGRAPH_TAGS]
+    assert actual == expected
+
+
+def test_inline_span_is_not_split_out():
+    items = stream(NESTED_INLINE[0], 'text')
+    assert items == [{'type': 'text', 'content': 'This is avery importantsentence about things',
+                      'tag': 'p'}]
+
+
+def test_standalone_span_is_a_block():
+    html = '<body><span>Span di luar blok <span>dalam</span> ekor</span><p>Paragraf sesudahnya</p></body>'
+    assert stream(html, 'text') == dom(html, 'text')
+
+
+def test_basic_mode_matches_dom():
+    html = ''.join(NESTED_INLINE) + '<h1>Judul utama halaman <span>ini</span> panjang</h1>'
+    assert stream(html, 'basic') == dom(html, 'basic')
+
+
+@pytest.mark.parametrize('mode', ['links', 'images'])
+def test_links_and_images_match_dom(mode):
+    html = ('<div><a href="/a">Link <span>A</span></a><a href>kosong</a><a name="x">tanpa</a>'
+            '<img src="x.png" alt="gambar"><img alt="tanpa src"><p><a href="b?x=1&amp;y=2">B</a></p></div>')
+    assert stream(html, mode) == dom(html, mode)
+
+
+def test_text_node_counted_once():
+    html = '<div><div><div><p>Teks paragraf yang hanya sekali muncul</p></div></div></div>'
+    assert stream(html, 'text') == [
+        {'type': 'text', 'content': 'Teks paragraf yang hanya sekali muncul', 'tag': 'p'}]
+
+
+def test_unclosed_inline_tag_does_not_leak():
+    # html.parser (tanpa lxml) tidak menyeimbangkan tag; span terbuka ikut selesai dengan bloknya
+    parser = StreamParser(make_extractor(BASE_URL, 'text'), use_lxml=False)
+    parser.feed(b'<p>Paragraf dengan <span>span tidak ditutup</p>'
+                b'<span>Span mandiri yang cukup panjang</span>')
+    contents = [item['content'] for item in parser.close()]
+    assert contents == ['Paragraf denganspan tidak ditutup', 'Span mandiri yang cukup panjang']
+
+
+def test_chunked_feed_matches_single_feed():
+    html = ''.join(NESTED_INLINE * 50).encode('utf-8')
+    whole = extract(BASE_URL, html, 'basic', parser='stream')
+    parser = StreamParser(make_extractor(BASE_URL, 'basic'))
+    for i in range(0, len(html), 7):
+        parser.feed(html[i:i + 7])
+    assert parser.close() == whole
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Test TableExtractor: colspan/rowspan, header, tipe kolom, tabel bersarang"""
+
+import json
+
+import pytest
+
+from scraper_engine import Table, export_tables, stream_extract
+from scraper_engine.tables import infer_column, layout
+
+
+def tables_of(html):
+    return [Table.from_item(item) for item in stream_extract('https://a.test/', html, 'tables')]
+
+
+def test_layout_spreads_colspan_and_rowspan():
+    grid = layout([
+        [('A', 2, 1), ('B', 1, 2)],
+        [('c', 1, 1), ('d', 1, 1)],
+        [('e', 1, 1)],
+    ])
+    assert grid == [['A', 'A', 'B'], ['c', 'd', 'B'], ['e', None, None]]
+
+
+def test_rowspan_at_row_end():
+    grid = layout([[('a', 1, 1), ('b', 1, 3)], [('c', 1, 1)], [('d', 1, 1)]])
+    assert grid == [['a', 'b'], ['c', 'b'], ['d', 'b']]
+
+
+@pytest.mark.parametrize('values, dtype, converted', [
+    (['1', '2', ''], 'int', [1, 2, None]),
+    (['1', '2.5'], 'float', [1.0, 2.5]),
+    (['1,234', '5'], 'int', [1234, 5]),
+    (['1,234.5', '-3'], 'float', [1234.5, -3.0]),
+    (['1', 'dua'], 'str', ['1', 'dua']),
+    (['', ''], 'str', [None, None]),
+])
+def test_infer_column(values, dtype, converted):
+    assert infer_column(values) == (dtype, converted)
+
+
+def test_table_with_header_spans_and_types():
+    html = """<table><caption> Data   kota </caption>
+        <thead><tr><th rowspan="2">Kota</th><th colspan="2">Penduduk</th></tr>
+        <tr><th>2010</th><th>2020</th></tr></thead>
+        <tbody><tr><td>Bandung</td><td>2,394,873</td><td>2444160</td></tr>
+        <tr><td>Bogor<br>Kota</td><td>950334</td><td>1043070.5</td></tr></tbody></table>"""
+    [table] = tables_of(html)
+    assert table.caption == 'Data kota'
+    assert table.columns == ['Kota', 'Penduduk / 2010', 'Penduduk / 2020']
+    assert table.dtypes == ['str', 'int', 'float']
+    assert table.data == [['Bandung', 'Bogor Kota'], [2394873, 950334], [2444160.0, 1043070.5]]
+
+
+def test_headerless_table_and_duplicate_columns():
+    [plain] = tables_of('<table><tr><td>a</td><td>1</td></tr><tr><td>b</td><td>2</td></tr></table>')
+    assert plain.columns == ['kolom_1', 'kolom_2']
+    assert len(plain) == 2
+    [dup] = tables_of('<table><tr><th>x</th><th>x</th></tr><tr><td>1</td><td>2</td></tr></table>')
+    assert dup.columns == ['x', 'x_2']
+
+
+def test_nested_tables_are_separate():
+    html = """<table><tr><th>Luar</th></tr><tr><td>sel
+        <table><tr><th>Dalam</th></tr><tr><td>isi</td></tr></table></td></tr></table>
+        <script>var t = '<table><tr><td>x</td></tr></table>';</script>"""
+    tables = tables_of(html)
+    assert [table.columns for table in tables] == [['Luar'], ['Dalam']]
+    assert tables[0].data == [['sel']]
+    assert tables[1].data == [['isi']]
+
+
+def test_item_roundtrip_keeps_types():
+    table = Table(['nama', 'jumlah', 'harga'], ['str', 'int', 'float'],
+                  [['a, b', None], [1, 2], [1.5, None]], caption='Harga')
+    item = table.to_item(3)
+    assert item['table_id'] == 3 and item['dtypes'] == 'str,int,float'
+    back = Table.from_item(item)
+    assert back.data == table.data and back.caption == 'Harga'
+    assert list(back.rows()) == [('a, b', 1, 1.5), (None, 2, None)]
+
+
+def test_to_pandas_dtypes():
+    pytest.importorskip('pandas')
+    [table] = tables_of('<table><tr><th>n</th><th>x</th></tr>'
+                        '<tr><td>1</td><td>0.5</td></tr><tr><td>2</td><td>1</td></tr></table>')
+    frame = table.to_pandas()
+    assert list(frame.columns) == ['n', 'x']
+    assert str(frame['n'].dtype) == 'int64' and str(frame['x'].dtype) == 'float64'
+
+
+def test_export_tables(tmp_path):
+    html = ('<table><tr><th>n</th></tr><tr><td>1</td></tr></table>'
+            '<table><tr><th>s</th></tr><tr><td>a</td></tr></table>')
+    items = [{'url': 'https://a.test/', 'timestamp': '2024-05-01 10:00:00', **item}
+             for item in stream_extract('https://a.test/', html, 'tables')]
+    path = tmp_path / 'tabel.jsonl'
+    assert export_tables(items, str(path)) == 2
+    rows = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert [(row['columns'], row['dtypes'], row['data']) for row in rows] == [
+        (['n'], ['int'], [[1]]), (['s'], ['str'], [['a']])]
+    folder = tmp_path / 'csv'
+    assert export_tables(items, str(folder), format_type='csv') == 2
+    assert (folder / 'tabel_2.csv').read_text(encoding='utf-8-sig') == 's\na\n'
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Test UiQueue: event dari worker diproses per tick di thread GUI"""
+
+import threading
+
+import pytest
+
+pytest.importorskip('tkinter')
+
+from easyscraper import UiQueue  # noqa: E402
+
+
+class FakeRoot:
+    """Pengganti Tk root: after() hanya dicatat, tick dijalankan manual"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, func):
+        self.scheduled.append(func)
+
+    def tick(self):
+        func = self.scheduled.pop(0)
+        func()
+
+
+@pytest.fixture
+def queue():
+    root = FakeRoot()
+    return root, UiQueue(root)
+
+
+def test_post_runs_in_order_on_next_tick(queue):
+    root, ui = queue
+    calls = []
+    ui.post(calls.append, 1)
+    ui.post(calls.append, 2)
+    assert calls == []
+    root.tick()
+    assert calls == [1, 2]
+    root.tick()
+    assert calls == [1, 2]
+
+
+def test_update_keeps_only_latest_per_key(queue):
+    root, ui = queue
+    calls = []
+    for done in range(100):
+        ui.update('progress', calls.append, ('progress', done))
+        ui.update('status', calls.append, ('status', done))
+    root.tick()
+    assert calls == [('progress', 99), ('status', 99)]
+
+
+def test_events_from_many_threads(queue):
+    root, ui = queue
+    calls = []
+    threads = [threading.Thread(target=lambda n=n: [ui.post(calls.append, (n, i)) for i in range(100)])
+               for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    root.tick()
+    assert len(calls) == 400
+    for n in range(4):
+        assert [i for m, i in calls if m == n] == list(range(100))
+
+
+def test_tick_always_reschedules(queue):
+    root, ui = queue
+    for _ in range(3):
+        root.tick()
+    assert len(root.scheduled) == 1
+
+
+def test_failing_callback_does_not_drop_the_rest(queue, capsys):
+    root, ui = queue
+    calls = []
+    messages = []
+    ui.on_error = messages.append
+
+    def broken():
+        raise ValueError('rusak')
+
+    ui.post(broken)
+    ui.post(calls.append, 'lanjut')
+    ui.update('status', calls.append, 'status')
+    root.tick()
+    assert calls == ['lanjut', 'status']
+    assert 'rusak' in capsys.readouterr().err
+    root.tick()
+    assert messages == ['Error tampilan: rusak']
+    assert len(root.scheduled) == 1